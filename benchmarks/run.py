@@ -0,0 +1,402 @@
+"""Offline micro-benchmarks for OpenClaw hot paths.
+
+    python benchmarks/run.py                   # compare against benchmarks/baseline.json
+    python benchmarks/run.py --update-baseline # record a new baseline on this machine
+    python benchmarks/run.py --threshold 15 --only bot.parse_inbound
+
+Each benchmark runs several rounds and keeps the best round's median, which
+is far less noisy than a single run. A benchmark regresses when that median
+is more than ``--threshold`` percent (default 25, or BENCH_THRESHOLD) slower
+than the baseline. Benchmarks in ``ALLOCATION_TRACKED`` also record the peak
+bytes tracemalloc sees during one call, and regress the same way when that
+grows. Baselines are machine specific: record one on the Jetson.
+"""
+
+from __future__ import annotations
+
+# benchmarks/run.py
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import numpy as np  # noqa: E402
+from aiohttp import web  # noqa: E402
+from loguru import logger  # noqa: E402
+
+from bot.message import ClawCommand, dispatch_command, parse_inbound  # noqa: E402
+from bot.slack_bot import OpenClawSlack  # noqa: E402
+from hardware.backends import SimulatedServoBackend  # noqa: E402
+from hardware.claw_controller import ClawController  # noqa: E402
+from hardware.executor import HardwareExecutor  # noqa: E402
+from llm.ollama_client import OllamaClient, StreamDecoder  # noqa: E402
+from llm.resilience import RetryPolicy  # noqa: E402
+from llm.semantic_cache import SemanticCache  # noqa: E402
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_THRESHOLD = 25.0
+
+PROMPT = "Explain in two sentences how a PWM servo knows which angle to hold."
+REPLY = (
+    "A servo reads the width of each pulse, typically 0.5 to 2.5 ms every 20 ms, "
+    "and its internal controller drives the motor until the potentiometer matches. "
+) * 4
+RESPONSE_BODY = json.dumps(
+    {
+        "model": "llama3:8b-instruct-q4_K_M",
+        "created_at": "2026-01-01T00:00:00Z",
+        "response": REPLY,
+        "done": True,
+        "context": list(range(512)),
+        "total_duration": 5_000_000_000,
+        "eval_count": 120,
+    }
+).encode()
+CHAT_RESPONSE_BODY = json.dumps(
+    {
+        "model": "llama3:8b-instruct-q4_K_M",
+        "created_at": "2026-01-01T00:00:00Z",
+        "message": {"role": "assistant", "content": REPLY},
+        "done": True,
+        "done_reason": "length",
+        "total_duration": 5_000_000_000,
+        "eval_count": 120,
+    }
+).encode()
+HISTORY = [
+    {"role": "user" if i % 2 == 0 else "assistant", "content": PROMPT if i % 2 == 0 else REPLY}
+    for i in range(6)
+]
+STREAM_BODY = (
+    b"".join(
+        json.dumps({"model": "llama3", "response": word + " ", "done": False}).encode() + b"\n"
+        for word in REPLY.split()
+    )
+    + json.dumps({"model": "llama3", "response": "", "done": True}).encode()
+    + b"\n"
+)
+SLACK_TEXT = "<@UBOT> " + PROMPT
+
+# Benchmarks whose memory use per call is recorded and checked as well
+ALLOCATION_TRACKED = frozenset({"bot.parse_inbound", "e2e.mention_to_reply"})
+ALLOCATION_SAMPLES = 50
+
+Op = Callable[[], Any]
+
+
+@dataclass(frozen=True)
+class Result:
+    median_us: float
+    p95_us: float
+    iterations: int
+    alloc_bytes: int | None = None
+
+
+async def _measure(op: Op, iterations: int, rounds: int) -> Result:
+    is_async = asyncio.iscoroutinefunction(op)
+    best: list[float] | None = None
+    for _ in range(rounds):
+        samples: list[float] = []
+        for _ in range(iterations):
+            start = time.perf_counter_ns()
+            if is_async:
+                await op()
+            else:
+                op()
+            samples.append((time.perf_counter_ns() - start) / 1000.0)
+        if best is None or statistics.median(samples) < statistics.median(best):
+            best = samples
+    assert best is not None
+    best.sort()
+    return Result(
+        median_us=round(statistics.median(best), 3),
+        p95_us=round(best[int(len(best) * 0.95) - 1], 3),
+        iterations=iterations,
+    )
+
+
+async def _measure_allocations(op: Op, samples: int) -> int:
+    """Median peak bytes allocated during one call of ``op``, as seen by tracemalloc."""
+    is_async = asyncio.iscoroutinefunction(op)
+    peaks: list[int] = []
+    tracemalloc.start()
+    try:
+        for _ in range(samples):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            if is_async:
+                await op()
+            else:
+                op()
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+    return int(statistics.median(peaks))
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks: each returns (op, cleanup)
+# ---------------------------------------------------------------------------
+
+
+def _offline_client(
+    post: Callable[[str, dict[str, Any]], Awaitable[dict[str, Any]]],
+) -> OllamaClient:
+    """An OllamaClient whose HTTP round trip is replaced by ``post``."""
+    client = OllamaClient("http://127.0.0.1:11434", "llama3", retry=RetryPolicy(attempts=1))
+    client._post = post  # type: ignore[method-assign]
+    return client
+
+
+async def bench_serialize_request() -> tuple[Op, Callable[[], Awaitable[None]] | None]:
+    # options(), admission and payload construction, then the encoding aiohttp's json= does
+    parsed = json.loads(RESPONSE_BODY)
+
+    async def post(_: str, payload: dict[str, Any]) -> dict[str, Any]:
+        json.dumps(payload).encode()
+        return parsed
+
+    client = _offline_client(post)
+
+    async def op() -> str:
+        return await client.chat(PROMPT, max_tokens=256)
+
+    return op, client.close
+
+
+async def bench_parse_response() -> tuple[Op, Callable[[], Awaitable[None]] | None]:
+    # /api/chat with history: decode, content extraction and the truncation marker
+    async def post(_: str, __: dict[str, Any]) -> dict[str, Any]:
+        return json.loads(CHAT_RESPONSE_BODY)
+
+    client = _offline_client(post)
+
+    async def op() -> str:
+        return await client.chat(PROMPT, HISTORY)
+
+    return op, client.close
+
+
+async def bench_stream_decode() -> tuple[Op, Callable[[], Awaitable[None]] | None]:
+    # Network reads arrive in arbitrary slices, not on line boundaries
+    slices = [STREAM_BODY[i : i + 256] for i in range(0, len(STREAM_BODY), 256)]
+
+    def op() -> int:
+        decoder = StreamDecoder()
+        tokens = 0
+        for data in slices:
+            tokens += len(decoder.feed(data))
+        return tokens
+
+    return op, None
+
+
+async def bench_parse_inbound() -> tuple[Op, Callable[[], Awaitable[None]] | None]:
+    def op() -> object:
+        return parse_inbound("slack", "C1", "U1", SLACK_TEXT, "UBOT", ts="1.0")
+
+    return op, None
+
+
+async def bench_semantic_lookup() -> tuple[Op, Callable[[], Awaitable[None]] | None]:
+    # Full cache of 768-d vectors (nomic-embed-text size), query misses so every row is scored
+    rng = np.random.default_rng(0)
+    cache = SemanticCache(capacity=512)
+    for row in rng.standard_normal((512, 768)):
+        cache.store(row, "answer")
+    query = rng.standard_normal(768).tolist()
+
+    def op() -> str | None:
+        return cache.lookup(query)
+
+    return op, None
+
+
+async def bench_claw_dispatch() -> tuple[Op, Callable[[], Awaitable[None]] | None]:
+    claw = ClawController(backend=SimulatedServoBackend(time_scale=0.0, seed=1))
+    claw.init_gpio()
+    executor = HardwareExecutor(claw)
+    commands = [ClawCommand("open", None), ClawCommand("close", None)]
+    counter = iter(range(1 << 62))
+
+    async def op() -> str:
+        return await dispatch_command(executor, commands[next(counter) & 1])
+
+    return op, executor.close
+
+
+async def bench_mention_to_reply() -> tuple[Op, Callable[[], Awaitable[None]] | None]:
+    async def generate(_: web.Request) -> web.Response:
+        return web.Response(body=RESPONSE_BODY, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_post("/api/generate", generate)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+
+    ai = OllamaClient(f"http://127.0.0.1:{port}", "llama3", retry=RetryPolicy(attempts=1))
+    executor = HardwareExecutor(ClawController(backend=SimulatedServoBackend()))
+    bot = OpenClawSlack("xoxb-bench", "xapp-bench", ai_client=ai, hardware=executor)
+    bot._bot_user_id = "UBOT"
+
+    async def slack_call(**_: Any) -> dict[str, str]:
+        return {"ok": "true", "ts": "2.0"}
+
+    bot.web_client = SimpleNamespace(chat_postMessage=slack_call, chat_update=slack_call)
+    socket = SimpleNamespace(send_socket_mode_response=lambda _: asyncio.sleep(0))
+    request = SimpleNamespace(
+        type="events_api",
+        envelope_id="env",
+        payload={
+            "event": {
+                "type": "app_mention",
+                "text": SLACK_TEXT,
+                "channel": "C1",
+                "user": "U1",
+                "ts": "1.0",
+            }
+        },
+    )
+
+    async def op() -> None:
+        await bot.handle_request(socket, request)  # type: ignore[arg-type]
+
+    async def cleanup() -> None:
+        await bot.outbound.close()
+        await bot.socket_client.close()
+        await executor.close()
+        await ai.close()
+        await runner.cleanup()
+
+    return op, cleanup
+
+
+BENCHMARKS: dict[str, tuple[Callable[[], Awaitable[Any]], int]] = {
+    "ollama.serialize_request": (bench_serialize_request, 5000),
+    "ollama.parse_response": (bench_parse_response, 5000),
+    "ollama.stream_decode": (bench_stream_decode, 2000),
+    "bot.parse_inbound": (bench_parse_inbound, 5000),
+    "cache.semantic_lookup": (bench_semantic_lookup, 2000),
+    "claw.dispatch_mock": (bench_claw_dispatch, 500),
+    "e2e.mention_to_reply": (bench_mention_to_reply, 300),
+}
+
+
+async def run(names: list[str], rounds: int = 5, scale: float = 1.0) -> dict[str, Result]:
+    results: dict[str, Result] = {}
+    for name in names:
+        setup, iterations = BENCHMARKS[name]
+        op, cleanup = await setup()
+        try:
+            await _measure(op, max(1, int(iterations * scale) // 10), 1)  # warm-up
+            result = await _measure(op, max(1, int(iterations * scale)), rounds)
+            if name in ALLOCATION_TRACKED:
+                allocations = await _measure_allocations(op, ALLOCATION_SAMPLES)
+                result = replace(result, alloc_bytes=allocations)
+            results[name] = result
+        finally:
+            if cleanup:
+                await cleanup()
+    return results
+
+
+def compare(results: dict[str, Result], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Return one message per benchmark slower, or allocating more, than baseline by
+    more than threshold %."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        change = 100.0 * (result.median_us / base["median_us"] - 1.0)
+        if change > threshold:
+            regressions.append(
+                f"{name}: {result.median_us:.2f}us vs baseline {base['median_us']:.2f}us "
+                f"(+{change:.1f}% > {threshold:.0f}%)"
+            )
+        if result.alloc_bytes is not None and base.get("alloc_bytes"):
+            change = 100.0 * (result.alloc_bytes / base["alloc_bytes"] - 1.0)
+            if change > threshold:
+                regressions.append(
+                    f"{name}: {result.alloc_bytes} bytes allocated vs baseline "
+                    f"{base['alloc_bytes']} (+{change:.1f}% > {threshold:.0f}%)"
+                )
+    return regressions
+
+
+def _record(result: Result) -> dict[str, Any]:
+    return {key: value for key, value in asdict(result).items() if value is not None}
+
+
+def _machine() -> dict[str, str]:
+    return {
+        "machine": platform.machine(),
+        "python": platform.python_version(),
+        "system": platform.system(),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=float(os.getenv("BENCH_THRESHOLD", DEFAULT_THRESHOLD)),
+        help="Allowed slowdown in percent before failing",
+    )
+    parser.add_argument("--only", action="append", choices=sorted(BENCHMARKS))
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply iteration counts")
+    args = parser.parse_args(argv)
+
+    logger.remove()  # hot paths log at INFO; keep the output readable
+    names = args.only or list(BENCHMARKS)
+    results = asyncio.run(run(names, rounds=args.rounds, scale=args.scale))
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else None
+    for name, result in results.items():
+        base = (baseline or {}).get("results", {}).get(name)
+        delta = f"  ({100 * (result.median_us / base['median_us'] - 1):+.1f}%)" if base else ""
+        allocs = f"  alloc {result.alloc_bytes}B" if result.alloc_bytes is not None else ""
+        print(
+            f"{name:28} median {result.median_us:10.2f}us  p95 {result.p95_us:10.2f}us"
+            f"{allocs}{delta}"
+        )
+
+    if args.update_baseline or baseline is None:
+        merged = dict((baseline or {}).get("results", {}))
+        merged.update({name: _record(result) for name, result in results.items()})
+        args.baseline.write_text(
+            json.dumps({"meta": _machine(), "results": merged}, indent=2) + "\n"
+        )
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if baseline.get("meta") != _machine():
+        print(f"warning: baseline recorded on {baseline.get('meta')}, running on {_machine()}")
+
+    regressions = compare(results, baseline, args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
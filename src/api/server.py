@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+# src/api/server.py
+import asyncio
+import hmac
+import json
+from dataclasses import asdict
+from typing import Any
+
+from aiohttp import web
+from loguru import logger
+
+from audit import AuditJournal
+from hardware.executor import ALL_DEVICES, HardwareExecutor, StateChange
+from hardware.registry import UnknownDeviceError
+from lifecycle import Lifecycle
+from llm.ollama_client import OllamaClient
+from replies import claw_outcome, reply_outcome
+
+_ACTIONS = ("open", "close", "stop")
+
+
+class ControlAPI:
+    """Local HTTP control surface sharing the bots' hardware queue and LLM.
+
+    Endpoints (JSON unless noted):
+
+    * ``GET  /api/health`` - Ollama circuit state, device count and semantic
+      cache statistics
+    * ``GET  /api/claw`` - cached state of every actuator; with
+      ``?wait=<seconds>`` it long-polls until the next state change
+    * ``POST /api/claw/{open,close,stop}`` - optional ``target`` in the
+      query string or JSON body, same semantics as the chat commands
+    * ``POST /api/chat`` - ``{"prompt": ..., "profile"?: ..., "max_tokens"?: ...}``,
+      answered as a chunked ``text/plain`` stream of tokens
+    * ``GET  /api/claw/events`` - server-sent events, one per ``StateChange``
+
+    Commands go through the same ``HardwareExecutor`` and chat through the
+    same admission-controlled ``OllamaClient`` as Discord and Slack. When
+    ``token`` is set every request needs ``Authorization: Bearer <token>``.
+    """
+
+    def __init__(
+        self,
+        hardware: HardwareExecutor,
+        ai: OllamaClient,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        token: str | None = None,
+        keepalive: float = 15.0,
+        max_wait: float = 60.0,
+        lifecycle: Lifecycle | None = None,
+        audit: AuditJournal | None = None,
+    ) -> None:
+        self.hardware = hardware
+        self.ai = ai
+        self.host = host
+        self.port = port
+        self.token = token
+        self.keepalive = keepalive
+        self.max_wait = max_wait
+        self.lifecycle = lifecycle or Lifecycle()
+        self.audit = audit or AuditJournal()
+        self._runner: web.AppRunner | None = None
+        self.app = web.Application(middlewares=[self._auth, self._track])
+        self.app.router.add_get("/api/health", self.health)
+        self.app.router.add_get("/api/claw", self.status)
+        self.app.router.add_get("/api/claw/events", self.events)
+        self.app.router.add_post("/api/claw/{action}", self.command)
+        self.app.router.add_post("/api/chat", self.chat)
+
+    async def start(self) -> None:
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        # Short shutdown timeout: open event streams must not hold up exit
+        await web.TCPSite(self._runner, self.host, self.port, shutdown_timeout=2.0).start()
+        logger.info(f"Control API listening on http://{self.host}:{self.port}")
+        await asyncio.sleep(float("inf"))  # Keep running
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _auth(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        if self.token:
+            supplied = request.headers.get("Authorization", "").removeprefix("Bearer ")
+            if not hmac.compare_digest(supplied.encode(), self.token.encode()):
+                raise web.HTTPUnauthorized(text="Missing or invalid bearer token")
+        return await handler(request)
+
+    @web.middleware
+    async def _track(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        if request.method == "GET":
+            # Reads (including long-polls and event streams) never hold up a drain
+            return await handler(request)
+        # An emergency stop still goes through while in-flight work drains
+        stopping = request.match_info.get("action") == "stop"
+        if not self.lifecycle.accepting and not stopping:
+            raise web.HTTPServiceUnavailable(text="Shutting down")
+        with self.lifecycle.track():
+            return await handler(request)
+
+    async def health(self, _: web.Request) -> web.Response:
+        health: dict[str, Any] = {
+            "ollama": self.ai.resilience.available,
+            "devices": len(self.hardware.names),
+        }
+        if self.ai.cache is not None:
+            health["cache"] = self.ai.cache.stats()
+        return web.json_response(health)
+
+    async def status(self, request: web.Request) -> web.Response:
+        try:
+            wait = min(float(request.query.get("wait", 0)), self.max_wait)
+        except ValueError:
+            raise web.HTTPBadRequest(text="wait must be a number of seconds") from None
+        change: StateChange | None = None
+        if wait > 0:
+            queue = self.hardware.subscribe()
+            try:
+                change = await asyncio.wait_for(queue.get(), wait)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self.hardware.unsubscribe(queue)
+        return web.json_response(
+            {
+                "devices": self.hardware.statuses(),
+                "change": asdict(change) if change else None,
+            }
+        )
+
+    async def command(self, request: web.Request) -> web.Response:
+        action = request.match_info["action"]
+        if action not in _ACTIONS:
+            raise web.HTTPNotFound(text=f"Unknown action '{action}'. Use: {', '.join(_ACTIONS)}")
+        target = request.query.get("target")
+        if target is None and request.can_read_body:
+            body = await self._json(request)
+            target = body.get("target")
+        if target is not None:
+            target = str(target).lower()  # actuator names are case-insensitive
+        if target is not None and target not in self.hardware.names and target != ALL_DEVICES:
+            raise web.HTTPNotFound(text=str(UnknownDeviceError(target, self.hardware.names)))
+        logger.info(f"API claw command: {action} {target or ''}".rstrip())
+        with self.audit.track(
+            "claw", "api", request.remote or "?", "http", action, target=target
+        ) as entry:
+            if action == "stop":
+                result = await self.hardware.emergency_stop()
+            elif action == "open":
+                result = await self.hardware.open_claw(target)
+            else:
+                result = await self.hardware.close_claw(target)
+            entry.outcome = claw_outcome(result)
+        return web.json_response({"result": result, "devices": self.hardware.statuses()})
+
+    async def chat(self, request: web.Request) -> web.StreamResponse:
+        body = await self._json(request)
+        prompt = str(body.get("prompt", "")).strip()
+        if not prompt:
+            raise web.HTTPBadRequest(text="'prompt' is required")
+        try:
+            max_tokens = int(body["max_tokens"]) if "max_tokens" in body else None
+        except (TypeError, ValueError):
+            raise web.HTTPBadRequest(text="'max_tokens' must be an integer") from None
+        profile = str(body.get("profile", "chat"))
+        response = web.StreamResponse(headers={"Content-Type": "text/plain; charset=utf-8"})
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        with self.audit.track(
+            "llm", "api", request.remote or "?", "http", "chat", prompt=prompt
+        ) as entry:
+            token = ""
+            async for token in self.ai.chat_stream(prompt, max_tokens=max_tokens, profile=profile):
+                await response.write(token.encode())
+            # A failed stream ends with the backend's canned reply
+            entry.outcome = reply_outcome(token)
+        await response.write_eof()
+        return response
+
+    async def events(self, request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse(
+            headers={
+                "Content-Type": "text/event-stream",
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no",
+            }
+        )
+        await response.prepare(request)
+        queue = self.hardware.subscribe()
+        try:
+            # Current state first, so clients never start from a blank slate
+            await response.write(self._sse("status", self.hardware.statuses()))
+            while self.lifecycle.accepting:
+                try:
+                    change = await asyncio.wait_for(queue.get(), self.keepalive)
+                except asyncio.TimeoutError:
+                    await response.write(b": keepalive\n\n")
+                    continue
+                await response.write(self._sse("change", asdict(change)))
+        except ConnectionResetError:
+            pass
+        finally:
+            self.hardware.unsubscribe(queue)
+        return response
+
+    @staticmethod
+    def _sse(event: str, data: object) -> bytes:
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+
+    @staticmethod
+    async def _json(request: web.Request) -> dict[str, Any]:
+        try:
+            body = await request.json()
+        except ValueError:
+            raise web.HTTPBadRequest(text="Body must be JSON") from None
+        if not isinstance(body, dict):
+            raise web.HTTPBadRequest(text="Body must be a JSON object")
+        return body
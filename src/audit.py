@@ -0,0 +1,310 @@
+"""Audit journal of claw actions and LLM calls.
+
+    python src/audit.py                          # last 50 records from AUDIT_LOG
+    python src/audit.py --kind claw --since 2h   # who moved the claw lately
+    python src/audit.py --user U123 --outcome error --json
+
+Records are compact JSON lines. Rotated files (``audit.jsonl.1``...) and the
+per-worker journals of multi-process mode (``audit.discord.jsonl``...) are
+read along with the main file.
+"""
+
+from __future__ import annotations
+
+# src/audit.py
+import argparse
+import asyncio
+import glob
+import json
+import os
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+DEFAULT_PATH = "logs/audit.jsonl"
+
+# The chat being served, so tool calls the model makes for it name the same caller
+_serving: ContextVar[AuditRecord | None] = ContextVar("audit_serving", default=None)
+
+
+@dataclass(slots=True)
+class AuditRecord:
+    kind: str  # "claw" or "llm"
+    platform: str
+    user: str
+    channel: str
+    intent: str  # open / close / stop / status / chat
+    target: str | None = None
+    prompt: str | None = None
+    outcome: str = "ok"
+    latency_ms: float = 0.0
+    ts: float = field(default_factory=time.time)
+    via: str | None = None  # "tool" when the model moved the claw during a chat
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {k: v for k, v in asdict(self).items() if v is not None}, separators=(",", ":")
+        )
+
+
+class AuditJournal:
+    """Append-only JSONL journal written off the request path.
+
+    ``record()`` only appends to an in-memory buffer; a background task
+    started on first use writes batches every ``flush_interval`` seconds (or
+    sooner once ``batch_size`` records are waiting) from a worker thread.
+    The file rotates at ``max_bytes`` keeping ``backups`` old files. If the
+    disk stalls, the buffer is capped at ``max_buffer`` and the oldest
+    records are dropped. Without a ``path`` the journal discards everything.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        flush_interval: float = 2.0,
+        batch_size: int = 256,
+        max_buffer: int = 10_000,
+        max_bytes: int = 10 * 1024 * 1024,
+        backups: int = 5,
+        prompt_chars: int = 200,
+    ) -> None:
+        self.path = Path(path) if path else None
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_buffer = max_buffer
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.prompt_chars = prompt_chars
+        self.dropped = 0
+        self._buffer: list[AuditRecord] = []
+        self._wake = asyncio.Event()
+        self._flusher: asyncio.Task[None] | None = None
+        self._closing = False
+
+    @classmethod
+    def from_env(cls, role: str | None = None) -> AuditJournal:
+        """Journal at ``AUDIT_LOG`` (empty disables); workers get their own file."""
+        path = os.getenv("AUDIT_LOG", DEFAULT_PATH)
+        if path and role:
+            p = Path(path)
+            path = str(p.with_name(f"{p.stem}.{role}{p.suffix}"))
+        return cls(
+            path or None,
+            flush_interval=float(os.getenv("AUDIT_FLUSH_INTERVAL", "2")),
+            max_bytes=int(float(os.getenv("AUDIT_MAX_MB", "10")) * 1024 * 1024),
+            backups=int(os.getenv("AUDIT_BACKUPS", "5")),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def record(self, record: AuditRecord) -> None:
+        if self.path is None:
+            return
+        if record.prompt is not None and len(record.prompt) > self.prompt_chars:
+            record.prompt = record.prompt[: self.prompt_chars] + "…"
+        self._buffer.append(record)
+        if len(self._buffer) > self.max_buffer:
+            overflow = len(self._buffer) - self.max_buffer
+            del self._buffer[:overflow]
+            self.dropped += overflow
+        if len(self._buffer) >= self.batch_size:
+            self._wake.set()
+        if not self._closing and (self._flusher is None or self._flusher.done()):
+            self._flusher = asyncio.create_task(self._run())
+
+    @contextmanager
+    def track(
+        self, kind: str, platform: str, user: str, channel: str, intent: str, **fields: Any
+    ) -> Iterator[AuditRecord]:
+        """Time the enclosed call and record it; exceptions are recorded as their outcome."""
+        record = AuditRecord(kind, platform, user, channel, intent, **fields)
+        serving = _serving.set(record) if kind == "llm" else None
+        started = time.perf_counter()
+        try:
+            yield record
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                record.outcome = "cancelled"
+            else:
+                # Known failures name their outcome (see replies.claw_outcome)
+                record.outcome = getattr(e, "audit_outcome", None) or type(e).__name__
+            raise
+        finally:
+            if serving is not None:
+                _serving.reset(serving)
+            record.latency_ms = round((time.perf_counter() - started) * 1000, 1)
+            self.record(record)
+
+    def track_tool(self, intent: str, **fields: Any) -> AbstractContextManager[AuditRecord]:
+        """``track`` a claw action the model took, on behalf of the chat being served."""
+        chat = _serving.get()
+        if chat is None:  # e.g. a chat forwarded from a gateway worker
+            return self.track("claw", "llm", "?", "?", intent, via="tool", **fields)
+        return self.track(
+            "claw", chat.platform, chat.user, chat.channel, intent, via="tool", **fields
+        )
+
+    async def _run(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self._buffer or self.path is None:
+            return
+        batch, self._buffer = self._buffer, []
+        lines = "".join(f"{r.to_json()}\n" for r in batch)
+        try:
+            await asyncio.to_thread(self._write, lines)
+        except OSError as e:
+            self.dropped += len(batch)
+            logger.error(f"Audit journal write to {self.path} failed, dropped {len(batch)}: {e}")
+
+    def _write(self, lines: str) -> None:
+        assert self.path is not None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size and size + len(lines) > self.max_bytes:
+            self._rotate()
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+    def _rotate(self) -> None:
+        assert self.path is not None
+        for i in range(self.backups - 1, 0, -1):
+            older = self.path.with_name(f"{self.path.name}.{i}")
+            if older.exists():
+                older.replace(self.path.with_name(f"{self.path.name}.{i + 1}"))
+        if self.backups > 0:
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+
+    async def close(self) -> None:
+        # Let an in-progress write finish rather than cancelling it mid-batch
+        self._closing = True
+        self._wake.set()
+        if self._flusher is not None:
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        await self.flush()
+
+
+def journal_files(path: str | Path) -> list[Path]:
+    """The journal, its rotations and any per-worker journals, oldest first."""
+    p = Path(path)
+    if p.is_dir():
+        files = list(p.glob("*.jsonl*"))
+    else:
+        # audit.jsonl -> audit.jsonl.1, audit.discord.jsonl; a bare "audit" -> audit.1, ...
+        stem, suffix = glob.escape(p.stem), glob.escape(p.suffix)
+        files = list(p.parent.glob(f"{stem}*{suffix}*" if suffix else f"{stem}*"))
+
+    def age(f: Path) -> tuple[int, str]:
+        suffix = f.name.rsplit(".", 1)[-1]
+        return (-int(suffix) if suffix.isdigit() else 0, f.name)
+
+    return sorted(files, key=age)
+
+
+def read_records(files: Iterable[Path]) -> Iterator[dict[str, Any]]:
+    for f in files:
+        with open(f, encoding="utf-8") as lines:
+            for line in lines:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn final line after a crash
+
+
+def _parse_since(value: str) -> float:
+    """``90s``, ``15m``, ``2h`` or ``7d`` ago, as a unix timestamp."""
+    units = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+    try:
+        if value[-1] in units:
+            return time.time() - float(value[:-1]) * units[value[-1]]
+        return time.time() - float(value)
+    except (ValueError, IndexError):
+        raise argparse.ArgumentTypeError(f"Bad duration '{value}' (use e.g. 30m, 2h)") from None
+
+
+def _format(record: dict[str, Any]) -> str:
+    when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(record.get("ts", 0)))
+    what = record.get("intent", "?")
+    if record.get("target"):
+        what += f" {record['target']}"
+    if record.get("prompt"):
+        what += f" {record['prompt']!r}"
+    if record.get("via"):
+        what += f" (via {record['via']})"
+    return (
+        f"{when}  {record.get('kind', '?'):<4} {record.get('platform', '?'):<7} "
+        f"{record.get('user', '?')}@{record.get('channel', '?')}  {what}  "
+        f"-> {record.get('outcome', '?')} ({record.get('latency_ms', 0):.0f} ms)"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Query the OpenClaw audit journal")
+    parser.add_argument("path", nargs="?", default=os.getenv("AUDIT_LOG") or DEFAULT_PATH)
+    parser.add_argument("--kind", choices=["claw", "llm"])
+    parser.add_argument("--platform")
+    parser.add_argument("--user")
+    parser.add_argument("--channel")
+    parser.add_argument("--outcome", help="'ok', or e.g. 'error' for anything else")
+    parser.add_argument("--since", type=_parse_since, help="e.g. 30m, 2h, 7d")
+    parser.add_argument("--limit", type=int, default=50, help="newest N records (0 = all)")
+    parser.add_argument("--json", action="store_true", help="print raw JSON lines")
+    args = parser.parse_args(argv)
+
+    files = journal_files(args.path)
+    if not files:
+        print(f"No audit journal at {args.path}", file=sys.stderr)
+        return 1
+
+    matches = []
+    for record in read_records(files):
+        if args.since is not None and record.get("ts", 0) < args.since:
+            continue
+        if any(
+            value is not None and record.get(key) != value
+            for key, value in (
+                ("kind", args.kind),
+                ("platform", args.platform),
+                ("user", args.user),
+                ("channel", args.channel),
+            )
+        ):
+            continue
+        if args.outcome == "error" and record.get("outcome") == "ok":
+            continue
+        if args.outcome not in (None, "error") and record.get("outcome") != args.outcome:
+            continue
+        matches.append(record)
+
+    matches.sort(key=lambda r: r.get("ts", 0))
+    if args.limit > 0:
+        matches = matches[-args.limit :]
+    for record in matches:
+        print(json.dumps(record) if args.json else _format(record))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,40 +1,120 @@
 from __future__ import annotations
 
 # src/bot/discord_bot.py
+from collections.abc import Awaitable, Callable
+
 import discord
 from discord.ext import commands
 from loguru import logger
 
-from hardware.claw_controller import ClawController
+from audit import AuditJournal
+from bot.message import (
+    InboundMessage,
+    dispatch_command,
+    parse_command,
+    parse_inbound,
+    strip_mention,
+)
+from bot.outbound import OutboundSender, Priority
+from bot.placeholder import ReplyDeadline
+from hardware.executor import HardwareExecutor
+from hardware.registry import UnknownDeviceError
+from lifecycle import Lifecycle
+from llm.generation import clip_message, platform_budget
 from llm.ollama_client import OllamaClient
+from replies import claw_outcome, reply_outcome
+
+MESSAGE_LIMIT = 2000  # Discord rejects longer messages
+
+
+def _channel_key(channel: discord.abc.Messageable) -> str:
+    return f"discord:{getattr(channel, 'id', channel)}"
 
 
 class ClawCommands(commands.Cog):
-    def __init__(self, hardware: ClawController, ai_client: OllamaClient) -> None:
+    def __init__(
+        self,
+        hardware: HardwareExecutor,
+        ai_client: OllamaClient,
+        outbound: OutboundSender | None = None,
+        audit: AuditJournal | None = None,
+    ) -> None:
         self.hardware = hardware
         self.ai = ai_client
+        self.outbound = outbound or OutboundSender()
+        self.audit = audit or AuditJournal()
+
+    async def _reply(self, ctx: commands.Context, text: str) -> None:
+        await self.outbound.send(
+            _channel_key(ctx.channel), ctx.send, text, priority=Priority.HARDWARE
+        )
+
+    async def _actuate(
+        self,
+        ctx: commands.Context,
+        intent: str,
+        action: Callable[[str | None], Awaitable[str]],
+        target: str | None,
+    ) -> None:
+        with self.audit.track(
+            "claw", "discord", str(ctx.author.id), str(ctx.channel.id), intent, target=target
+        ) as entry:
+            try:
+                result = await action(target)
+            except UnknownDeviceError as e:
+                result = str(e)
+            entry.outcome = claw_outcome(result)
+        await self._reply(ctx, result)
 
     @commands.command(name="status")
-    async def claw_status(self, ctx: commands.Context) -> None:
-        status = self.hardware.get_status()
-        await ctx.send(f"Status: {status}")
+    async def claw_status(self, ctx: commands.Context, target: str | None = None) -> None:
+        if target is None and len(self.hardware.names) > 1:
+            statuses = ", ".join(f"{n}={s}" for n, s in self.hardware.statuses().items())
+            await self._reply(ctx, f"Status: {statuses}")
+            return
+        try:
+            status = self.hardware.get_status(target)
+        except UnknownDeviceError as e:
+            await self._reply(ctx, str(e))
+            return
+        await self._reply(ctx, f"Status: {status}")
 
     @commands.command(name="open")
-    async def claw_open(self, ctx: commands.Context) -> None:
-        result = self.hardware.open_claw()
-        await ctx.send(result)
+    async def claw_open(self, ctx: commands.Context, target: str | None = None) -> None:
+        await self._actuate(ctx, "open", self.hardware.open_claw, target)
 
     @commands.command(name="close")
-    async def claw_close(self, ctx: commands.Context) -> None:
-        result = self.hardware.close_claw()
-        await ctx.send(result)
+    async def claw_close(self, ctx: commands.Context, target: str | None = None) -> None:
+        await self._actuate(ctx, "close", self.hardware.close_claw, target)
+
+    @commands.command(name="stop")
+    async def claw_stop(self, ctx: commands.Context) -> None:
+        with self.audit.track(
+            "claw", "discord", str(ctx.author.id), str(ctx.channel.id), "stop"
+        ) as entry:
+            result = await self.hardware.emergency_stop()
+            entry.outcome = claw_outcome(result)
+        await self._reply(ctx, result)
 
 
 class OpenClawDiscord(commands.Bot):
-    def __init__(self, token: str, ai_client: OllamaClient, hardware: ClawController) -> None:
+    def __init__(
+        self,
+        token: str,
+        ai_client: OllamaClient,
+        hardware: HardwareExecutor,
+        outbound: OutboundSender | None = None,
+        lifecycle: Lifecycle | None = None,
+        audit: AuditJournal | None = None,
+        deadline: ReplyDeadline | None = None,
+    ) -> None:
         self.token = token
         self.ai = ai_client
         self.hardware = hardware
+        self.outbound = outbound or OutboundSender()
+        self.lifecycle = lifecycle or Lifecycle()
+        self.audit = audit or AuditJournal()
+        self.deadline = deadline or ReplyDeadline()
 
         intents = discord.Intents.default()
         intents.message_content = True
@@ -42,7 +122,11 @@ class OpenClawDiscord(commands.Bot):
         super().__init__(command_prefix="!claw ", intents=intents)
 
     async def setup_hook(self) -> None:
-        await self.add_cog(ClawCommands(hardware=self.hardware, ai_client=self.ai))
+        await self.add_cog(
+            ClawCommands(
+                hardware=self.hardware, ai_client=self.ai, outbound=self.outbound, audit=self.audit
+            )
+        )
 
     async def on_ready(self) -> None:
         logger.info(f"Discord Bot connected as {self.user}")
@@ -50,22 +134,73 @@ class OpenClawDiscord(commands.Bot):
     async def on_message(self, message: discord.Message) -> None:
         if message.author == self.user:
             return
-
+        if not self.lifecycle.accepting and not self._is_stop(message):
+            return
+        with self.lifecycle.track():
+            await self._route(message)
+
+    def _is_stop(self, message: discord.Message) -> bool:
+        """``!claw stop`` or a "stop claw" mention, served even while draining."""
+        body = strip_mention(message.content, str(self.user.id))
+        if body.lower().startswith(f"{self.command_prefix}stop"):
+            return True
+        command = parse_command(body)
+        return command is not None and command.verb == "stop"
+
+    async def _route(self, message: discord.Message) -> None:
         # Check if the message is a direct message or mentions the bot
         if isinstance(message.channel, discord.DMChannel) or self.user in message.mentions:
-            query = message.content.replace(f"<@{self.user.id}>", "").strip()
-            if not query:
+            msg = parse_inbound(
+                "discord",
+                str(message.channel.id),
+                str(message.author.id),
+                message.content,
+                str(self.user.id),
+            )
+            if msg is None:
                 await super().on_message(message)
                 return
 
-            await message.channel.send("Thinking...")
-
-            # Simple RAG or direct LLM call
-            response = await self.ai.chat(query)
-            await message.channel.send(response)
+            await self.handle_message(msg, message.channel)
             return
 
         await super().on_message(message)
 
+    async def handle_message(self, msg: InboundMessage, channel: discord.abc.Messageable) -> None:
+        if msg.command:
+            with self.audit.track(
+                "claw",
+                msg.platform,
+                msg.user,
+                msg.channel,
+                msg.command.verb,
+                target=msg.command.target,
+            ) as entry:
+                reply = await dispatch_command(self.hardware, msg.command)
+                entry.outcome = claw_outcome(reply)
+            await self.outbound.send(
+                msg.channel_key, channel.send, reply, priority=Priority.HARDWARE
+            )
+            return
+
+        # Generation starts first; the typing indicator only goes out for slow replies,
+        # so fast answers (cache hits, small models) cost a single outbound call
+        with self.audit.track(
+            "llm", msg.platform, msg.user, msg.channel, "chat", prompt=msg.text
+        ) as entry:
+            reply = self.deadline.start(
+                self.ai.chat(
+                    msg.text, context=msg.conversation_key, max_tokens=platform_budget("discord")
+                )
+            )
+            if not await self.deadline.race(reply):
+                async with channel.typing():
+                    await reply
+            response = reply.result()
+            entry.outcome = reply_outcome(response)
+        await self.outbound.send(
+            msg.channel_key, channel.send, clip_message(response, MESSAGE_LIMIT)
+        )
+
     async def start(self) -> None:
         await super().start(self.token)
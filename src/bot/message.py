@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+# src/bot/message.py
+import re
+
+from hardware.executor import HardwareExecutor
+from hardware.registry import UnknownDeviceError
+
+# "<open|close|stop> claw [actuator]" at the start of the text, any case. Anchored so
+# questions that merely mention a command ("how to open claw?") go to the LLM
+_CLAW_COMMAND = re.compile(r"(open|close|stop) claw\b(?:\s+([\w-]+))?", re.IGNORECASE)
+
+# Words that may follow "claw" without naming an actuator ("open claw please").
+# Any other word must be a registered actuator: a typo never moves the default one
+_FILLER_WORDS = frozenset({"please", "pls", "now", "again", "thanks", "thx", "asap", "too"})
+
+_MENTION_CACHE: dict[str, re.Pattern[str]] = {}
+
+
+def _mention_pattern(bot_user_id: str) -> re.Pattern[str]:
+    # Discord writes <@id> or <@!id>, Slack writes <@U123>
+    pattern = _MENTION_CACHE.get(bot_user_id)
+    if pattern is None:
+        pattern = re.compile(rf"\s*<@!?{re.escape(bot_user_id)}>\s*")
+        _MENTION_CACHE[bot_user_id] = pattern
+    return pattern
+
+
+class ClawCommand:
+    __slots__ = ("verb", "target")
+
+    def __init__(self, verb: str, target: str | None) -> None:
+        self.verb = verb
+        self.target = target
+
+    def __repr__(self) -> str:
+        return f"ClawCommand({self.verb!r}, {self.target!r})"
+
+
+class InboundMessage:
+    """Platform-neutral view of one chat event, shared by both bots.
+
+    Built once per event by ``parse_inbound``; routing, rate limiting,
+    the LLM and the hardware queue all read from it instead of re-walking
+    the platform payload.
+    """
+
+    __slots__ = ("platform", "channel", "user", "text", "ts", "thread", "command")
+
+    def __init__(
+        self,
+        platform: str,
+        channel: str,
+        user: str,
+        text: str,
+        ts: str | None = None,
+        thread: str | None = None,
+        command: ClawCommand | None = None,
+    ) -> None:
+        self.platform = platform
+        self.channel = channel
+        self.user = user
+        self.text = text
+        self.ts = ts
+        self.thread = thread
+        self.command = command
+
+    @property
+    def channel_key(self) -> str:
+        """Outbound queue / rate-limit bucket key."""
+        return f"{self.platform}:{self.channel}"
+
+    @property
+    def is_stop(self) -> bool:
+        """Emergency stops are served even while draining for shutdown."""
+        return self.command is not None and self.command.verb == "stop"
+
+    @property
+    def conversation_key(self) -> str:
+        """One conversation per thread (Slack) or channel (Discord)."""
+        return f"{self.platform}:{self.channel}:{self.thread or ''}"
+
+    def __repr__(self) -> str:
+        return (
+            f"InboundMessage({self.platform}:{self.channel} user={self.user} "
+            f"text={self.text!r} command={self.command!r})"
+        )
+
+
+def strip_mention(text: str, bot_user_id: str | None) -> str:
+    """Remove the bot mention and surrounding whitespace in a single regex pass."""
+    if bot_user_id and "<@" in text:
+        text = _mention_pattern(bot_user_id).sub(" ", text)
+    return text.strip()
+
+
+def parse_command(text: str) -> ClawCommand | None:
+    match = _CLAW_COMMAND.match(text)
+    if match is None:
+        return None
+    verb, target = match.groups()
+    target = target.lower() if target else None
+    return ClawCommand(verb.lower(), None if target in _FILLER_WORDS else target)
+
+
+def parse_inbound(
+    platform: str,
+    channel: str,
+    user: str,
+    text: str,
+    bot_user_id: str | None,
+    ts: str | None = None,
+    thread: str | None = None,
+) -> InboundMessage | None:
+    """Normalize a raw event; returns None when nothing is left after the mention."""
+    body = strip_mention(text, bot_user_id)
+    if not body:
+        return None
+    return InboundMessage(platform, channel, user, body, ts, thread, parse_command(body))
+
+
+async def dispatch_command(hardware: HardwareExecutor, command: ClawCommand) -> str:
+    """Run a parsed claw command against the HardwareExecutor."""
+    target = command.target
+    try:
+        if command.verb == "stop":
+            return await hardware.emergency_stop()
+        if command.verb == "open":
+            return await hardware.open_claw(target)
+        return await hardware.close_claw(target)
+    except UnknownDeviceError as e:
+        return str(e)
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+# src/bot/outbound.py
+import asyncio
+import itertools
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any
+
+from loguru import logger
+
+SendCall = Callable[[], Awaitable[Any]]
+
+
+class Priority(IntEnum):
+    """Lower values are delivered first within a channel."""
+
+    HARDWARE = 0
+    REPLY = 1
+    STATUS = 2
+
+
+class RateLimitBucket:
+    """Tracks the remaining budget of one platform rate-limit bucket.
+
+    The bucket learns from response headers (``Retry-After``, and
+    ``X-RateLimit-*`` where an API returns them) and from 429 errors, and
+    makes senders wait out the reset window instead of hammering the API
+    into penalties. In practice only Slack responses feed it: discord.py
+    waits out Discord's limits internally and ``send()`` returns a
+    ``Message`` without headers.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self.remaining: int | None = None
+        self.reset_at: float = 0.0
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        lowered = {k.lower(): v for k, v in headers.items()}
+        remaining = lowered.get("x-ratelimit-remaining")
+        reset_after = lowered.get("x-ratelimit-reset-after")
+        retry_after = lowered.get("retry-after")
+        if remaining is not None:
+            self.remaining = int(float(remaining))
+        if reset_after is not None:
+            self.reset_at = self._clock() + float(reset_after)
+        if retry_after is not None:
+            self.penalize(float(retry_after))
+
+    def penalize(self, retry_after: float) -> None:
+        self.remaining = 0
+        self.reset_at = max(self.reset_at, self._clock() + retry_after)
+
+    def delay(self) -> float:
+        """Seconds to wait before the next call may be issued."""
+        now = self._clock()
+        if now >= self.reset_at:
+            self.remaining = None
+            return 0.0
+        if self.remaining is None or self.remaining > 0:
+            return 0.0
+        return self.reset_at - now
+
+    def consume(self) -> None:
+        if self.remaining is not None and self.remaining > 0:
+            self.remaining -= 1
+
+
+@dataclass(order=True)
+class _Outgoing:
+    priority: int
+    seq: int
+    call: SendCall = field(compare=False)
+    future: asyncio.Future[Any] = field(compare=False)
+
+
+def _retry_after(exc: BaseException) -> float | None:
+    """Extract a retry-after delay from a platform rate-limit error, if any."""
+    # discord.py: discord.RateLimited (raised only when its own wait would be too long)
+    retry = getattr(exc, "retry_after", None)
+    if isinstance(retry, int | float):
+        return float(retry)
+    # slack_sdk: SlackApiError.response is a SlackResponse
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None) or getattr(exc, "status", None)
+    if status == 429:
+        headers = getattr(response, "headers", None) or {}
+        return float(headers.get("Retry-After", headers.get("retry-after", 1)))
+    return None
+
+
+class OutboundSender:
+    """Per-channel outbound queue shared by the Discord and Slack bots.
+
+    Each channel gets its own priority queue drained by a short-lived
+    worker, so a slow or rate-limited channel never blocks another one,
+    and hardware confirmations overtake queued LLM text in the same channel.
+    Rate-limit buckets only learn from Slack (headers and 429s) and from a
+    ``discord.RateLimited`` that discord.py gives up on; ordinary Discord
+    429s are retried inside discord.py before the call returns.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_retries = max_retries
+        self._clock = clock
+        self._queues: dict[str, asyncio.PriorityQueue[_Outgoing]] = {}
+        self._workers: dict[str, asyncio.Task[None]] = {}
+        self._buckets: dict[str, RateLimitBucket] = {}
+        self._seq = itertools.count()
+
+    def bucket(self, key: str) -> RateLimitBucket:
+        if key not in self._buckets:
+            self._buckets[key] = RateLimitBucket(clock=self._clock)
+        return self._buckets[key]
+
+    async def submit(self, key: str, call: SendCall, priority: Priority = Priority.REPLY) -> Any:
+        """Queue ``call`` on the channel identified by ``key`` and wait for its result."""
+        loop = asyncio.get_running_loop()
+        item = _Outgoing(int(priority), next(self._seq), call, loop.create_future())
+        queue = self._queues.setdefault(key, asyncio.PriorityQueue())
+        queue.put_nowait(item)
+        worker = self._workers.get(key)
+        if worker is None or worker.done():
+            self._workers[key] = asyncio.create_task(self._drain(key, queue))
+        return await item.future
+
+    async def send(
+        self,
+        key: str,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        priority: Priority = Priority.REPLY,
+        **kwargs: Any,
+    ) -> Any:
+        return await self.submit(key, lambda: func(*args, **kwargs), priority)
+
+    async def _drain(self, key: str, queue: asyncio.PriorityQueue[_Outgoing]) -> None:
+        bucket = self.bucket(key)
+        while not queue.empty():
+            item = queue.get_nowait()
+            if item.future.done():
+                continue
+            for attempt in range(self.max_retries + 1):
+                wait = bucket.delay()
+                if wait > 0:
+                    logger.debug(f"Outbound {key}: waiting {wait:.2f}s for rate limit reset")
+                    await asyncio.sleep(wait)
+                bucket.consume()
+                try:
+                    result = await item.call()
+                except Exception as e:
+                    retry = _retry_after(e)
+                    if retry is None or attempt == self.max_retries:
+                        if not item.future.done():
+                            item.future.set_exception(e)
+                        break
+                    logger.warning(f"Outbound {key} rate limited, retry in {retry:.2f}s")
+                    bucket.penalize(retry)
+                    continue
+                headers = getattr(result, "headers", None)
+                if isinstance(headers, Mapping):
+                    bucket.update(headers)
+                if not item.future.done():
+                    item.future.set_result(result)
+                break
+
+    async def close(self) -> None:
+        workers = [w for w in self._workers.values() if not w.done()]
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._workers.clear()
+        for queue in self._queues.values():
+            while not queue.empty():
+                queue.get_nowait().future.cancel()
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+# src/bot/placeholder.py
+import asyncio
+import os
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class ReplyDeadline:
+    """Decides how long a reply may take before a "thinking" placeholder is shown.
+
+    Generation starts first; the placeholder (typing indicator, Slack post)
+    only goes out if no answer arrived within ``deadline``. The deadline
+    follows recent reply latency: when most replies land quickly it waits a
+    little longer than their 75th percentile, so cache hits and small-model
+    answers go out as a single message. When replies are usually slower
+    than ``ceiling`` waiting buys nothing, so it drops to ``floor`` and the
+    user sees feedback almost at once.
+    """
+
+    def __init__(
+        self,
+        ceiling: float = 1.0,
+        floor: float = 0.2,
+        window: int = 32,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.ceiling = ceiling
+        self.floor = floor
+        self._clock = clock
+        self._samples: deque[float] = deque(maxlen=window)
+
+    @classmethod
+    def from_env(cls) -> ReplyDeadline:
+        return cls(
+            ceiling=float(os.getenv("PLACEHOLDER_DEADLINE", "1.0")),
+            floor=float(os.getenv("PLACEHOLDER_DEADLINE_MIN", "0.2")),
+        )
+
+    @property
+    def deadline(self) -> float:
+        if not self._samples:
+            return self.ceiling
+        ordered = sorted(self._samples)
+        p75 = ordered[int(0.75 * (len(ordered) - 1))]
+        if p75 > self.ceiling:
+            return self.floor
+        return max(self.floor, min(self.ceiling, p75 * 1.25))
+
+    def observe(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def start(self, reply: Awaitable[T]) -> asyncio.Task[T]:
+        """Run ``reply`` as a task whose latency feeds the deadline."""
+        started = self._clock()
+        task = asyncio.ensure_future(reply)
+
+        def done(t: asyncio.Task[T]) -> None:
+            if not t.cancelled() and t.exception() is None:
+                self.observe(self._clock() - started)
+
+        task.add_done_callback(done)
+        return task
+
+    async def race(self, task: asyncio.Task[T]) -> bool:
+        """Wait up to the deadline; True if ``task`` finished in time."""
+        try:
+            done, _ = await asyncio.wait({task}, timeout=self.deadline)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        return bool(done)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 # src/bot/slack_bot.py
 import asyncio
+from typing import Any
 
 from loguru import logger
 from slack_sdk import WebClient
@@ -9,8 +10,17 @@ from slack_sdk.socket_mode.aiohttp import SocketModeClient
 from slack_sdk.socket_mode.request import SocketModeRequest
 from slack_sdk.socket_mode.response import SocketModeResponse
 
-from hardware.claw_controller import ClawController
+from audit import AuditJournal
+from bot.message import InboundMessage, dispatch_command, parse_inbound
+from bot.outbound import OutboundSender, Priority
+from bot.placeholder import ReplyDeadline
+from hardware.executor import HardwareExecutor
+from lifecycle import Lifecycle
+from llm.generation import clip_message, platform_budget
 from llm.ollama_client import OllamaClient
+from replies import claw_outcome, reply_outcome
+
+MESSAGE_LIMIT = 40000  # Slack truncates text beyond this
 
 
 class OpenClawSlack:
@@ -19,12 +29,20 @@ class OpenClawSlack:
         bot_token: str,
         app_token: str,
         ai_client: OllamaClient,
-        hardware: ClawController,
+        hardware: HardwareExecutor,
+        outbound: OutboundSender | None = None,
+        lifecycle: Lifecycle | None = None,
+        audit: AuditJournal | None = None,
+        deadline: ReplyDeadline | None = None,
     ) -> None:
         self.bot_token = bot_token
         self.app_token = app_token
         self.ai = ai_client
         self.hardware = hardware
+        self.outbound = outbound or OutboundSender()
+        self.lifecycle = lifecycle or Lifecycle()
+        self.audit = audit or AuditJournal()
+        self.deadline = deadline or ReplyDeadline()
 
         self.web_client = WebClient(token=bot_token)
         self.socket_client = SocketModeClient(app_token=app_token, web_client=self.web_client)
@@ -51,40 +69,78 @@ class OpenClawSlack:
             await client.send_socket_mode_response(response)
 
             event = request.payload["event"]
-            if event["type"] == "app_mention" or (
-                event["type"] == "message" and event.get("channel_type") == "im"
+            event_type = event["type"]
+            if event_type == "app_mention" or (
+                event_type == "message" and event.get("channel_type") == "im"
             ):
-                text = event.get("text", "")
-                channel_id = event["channel"]
-                user = event["user"]
-
                 # Remove mention using cached bot_user_id
-                bot_user_id = await self._get_bot_user_id()
-                prompt = text.replace(f"<@{bot_user_id}>", "").strip()
-
-                if not prompt:
-                    return
-
-                # Simple command parsing
-                if "open claw" in prompt.lower():
-                    msg = self.hardware.open_claw()
-                    await self.web_client.chat_postMessage(channel=channel_id, text=msg)
+                msg = parse_inbound(
+                    "slack",
+                    event["channel"],
+                    event["user"],
+                    event.get("text", ""),
+                    await self._get_bot_user_id(),
+                    ts=event.get("ts"),
+                    thread=event.get("thread_ts"),
+                )
+                if msg is None:
                     return
-                elif "close claw" in prompt.lower():
-                    msg = self.hardware.close_claw()
-                    await self.web_client.chat_postMessage(channel=channel_id, text=msg)
+                if not self.lifecycle.accepting and not msg.is_stop:
+                    logger.info("Shutting down, ignoring Slack event")
                     return
-
-                # LLM Reply
-                await self.web_client.reactions_add(
-                    channel=channel_id, timestamp=event["ts"], name="thinking_face"
-                )
-
-                reply = await self.ai.chat(prompt)
-
-                await self.web_client.chat_postMessage(
-                    channel=channel_id, text=f"<@{user}> {reply}"
-                )
-                await self.web_client.reactions_remove(
-                    channel=channel_id, timestamp=event["ts"], name="thinking_face"
+                with self.lifecycle.track():
+                    await self.handle_message(msg)
+
+    async def handle_message(self, msg: InboundMessage) -> None:
+        if msg.command:
+            with self.audit.track(
+                "claw",
+                msg.platform,
+                msg.user,
+                msg.channel,
+                msg.command.verb,
+                target=msg.command.target,
+            ) as entry:
+                reply = await dispatch_command(self.hardware, msg.command)
+                entry.outcome = claw_outcome(reply)
+            await self._post(msg, reply, Priority.HARDWARE)
+            return
+
+        # LLM Reply: generation starts first. Only a slow answer gets a placeholder
+        # (later edited in place); a fast one is a single post
+        placeholder: Any = None
+        with self.audit.track(
+            "llm", msg.platform, msg.user, msg.channel, "chat", prompt=msg.text
+        ) as entry:
+            pending = self.deadline.start(
+                self.ai.chat(
+                    msg.text, context=msg.conversation_key, max_tokens=platform_budget("slack")
                 )
+            )
+            if not await self.deadline.race(pending):
+                placeholder = await self._post(msg, "_Thinking..._", Priority.STATUS)
+            reply = await pending
+            entry.outcome = reply_outcome(reply)
+
+        text = clip_message(f"<@{msg.user}> {reply}", MESSAGE_LIMIT)
+        if placeholder is None:
+            await self._post(msg, text, Priority.REPLY)
+        else:
+            await self._replace(msg, placeholder, text)
+
+    async def _post(self, msg: InboundMessage, text: str, priority: Priority) -> Any:
+        return await self.outbound.send(
+            msg.channel_key,
+            self.web_client.chat_postMessage,
+            channel=msg.channel,
+            text=text,
+            priority=priority,
+        )
+
+    async def _replace(self, msg: InboundMessage, placeholder: Any, text: str) -> Any:
+        ts = placeholder.get("ts") if placeholder is not None else None
+        if not ts:
+            return await self._post(msg, text, Priority.REPLY)
+        return await self.outbound.send(
+            msg.channel_key, self.web_client.chat_update, channel=msg.channel, ts=ts, text=text
+        )
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+# src/hardware/backends.py
+import os
+import random
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+from loguru import logger
+
+try:
+    import Jetson.GPIO as GPIO  # type: ignore[import-untyped]
+except ImportError:
+    GPIO = None
+
+
+class ServoBackend(ABC):
+    """Drives one PWM servo output.
+
+    ``move`` applies a duty cycle and returns how long the caller should
+    hold it before calling ``release``; open-loop hardware backends return
+    a fixed calibrated hold, the simulator returns its modelled travel time.
+    """
+
+    name: str = "abstract"
+    simulated: bool = False
+
+    def __init__(self, hold_seconds: float = 1.0) -> None:
+        self.hold_seconds = hold_seconds
+
+    @abstractmethod
+    def setup(self, pin: int, frequency: int) -> None: ...
+
+    @abstractmethod
+    def set_duty_cycle(self, duty: float) -> None: ...
+
+    def move(self, duty: float) -> float:
+        self.set_duty_cycle(duty)
+        return self.hold_seconds
+
+    def release(self) -> None:
+        # Duty 0 stops the pulse train so the servo does not jitter at rest
+        self.set_duty_cycle(0)
+
+    @abstractmethod
+    def cleanup(self) -> None: ...
+
+
+class JetsonGPIOBackend(ServoBackend):
+    name = "jetson"
+
+    def __init__(self, hold_seconds: float = 1.0) -> None:
+        super().__init__(hold_seconds)
+        if GPIO is None:
+            raise RuntimeError("Jetson.GPIO is not installed")
+        self.pwm: Any | None = None
+        self.pin: int | None = None
+
+    def setup(self, pin: int, frequency: int) -> None:
+        self.pin = pin
+        GPIO.setmode(GPIO.BOARD)
+        GPIO.setup(pin, GPIO.OUT, initial=GPIO.HIGH)
+        self.pwm = GPIO.PWM(pin, frequency)
+        self.pwm.start(0)
+
+    def set_duty_cycle(self, duty: float) -> None:
+        if self.pwm:
+            self.pwm.ChangeDutyCycle(duty)
+
+    def cleanup(self) -> None:
+        if self.pwm:
+            self.pwm.stop()
+        # Only release our own pin so sibling actuators keep running
+        if self.pin is not None:
+            GPIO.cleanup(self.pin)
+
+
+class PeripheryPWMBackend(ServoBackend):
+    """Kernel sysfs PWM via python-periphery (``/sys/class/pwm/pwmchipN``)."""
+
+    name = "periphery"
+
+    def __init__(self, chip: int = 0, channel: int = 0, hold_seconds: float = 1.0) -> None:
+        super().__init__(hold_seconds)
+        self.chip = chip
+        self.channel = channel
+        self.pwm: Any | None = None
+
+    def setup(self, pin: int, frequency: int) -> None:
+        from periphery import PWM  # type: ignore[import-untyped]
+
+        # The header pin is routed to a pwmchip channel by the device tree; pin is informational
+        self.pwm = PWM(self.chip, self.channel)
+        self.pwm.frequency = frequency
+        self.pwm.duty_cycle = 0.0
+        self.pwm.enable()
+
+    def set_duty_cycle(self, duty: float) -> None:
+        if self.pwm:
+            self.pwm.duty_cycle = duty / 100.0
+
+    def cleanup(self) -> None:
+        if self.pwm:
+            self.pwm.disable()
+            self.pwm.close()
+            self.pwm = None
+
+
+@dataclass(frozen=True)
+class SimulatedMove:
+    duty: float
+    start_angle: float
+    target_angle: float
+    seconds: float
+
+
+class SimulatedServoBackend(ServoBackend):
+    """Hobby-servo model for off-device testing and benchmarking.
+
+    A new duty cycle only takes effect on the next PWM period edge, the
+    pulse width carries Gaussian jitter, and the horn travels at a fixed
+    angular speed. ``time_scale`` maps modelled seconds to real holds
+    (0 = instant); ``virtual_time`` accumulates modelled seconds either way.
+    """
+
+    name = "sim"
+    simulated = True
+
+    MIN_PULSE_MS: float = 0.5  # 0 degrees
+    MAX_PULSE_MS: float = 2.5  # 180 degrees
+
+    def __init__(
+        self,
+        speed_deg_per_s: float = 600.0,
+        jitter_us: float = 10.0,
+        time_scale: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        super().__init__(hold_seconds=0.0)
+        self.speed_deg_per_s = speed_deg_per_s
+        self.jitter_us = jitter_us
+        self.time_scale = time_scale
+        self.rng = random.Random(seed)
+        self.frequency = 50
+        self.angle = 90.0
+        self.duty = 0.0
+        self.virtual_time = 0.0
+        self.history: list[SimulatedMove] = []
+
+    @property
+    def period(self) -> float:
+        return 1.0 / self.frequency
+
+    def setup(self, pin: int, frequency: int) -> None:
+        self.frequency = frequency
+
+    def angle_for(self, duty: float) -> float:
+        pulse_ms = duty / 100.0 * self.period * 1000.0
+        pulse_ms += self.rng.gauss(0.0, self.jitter_us / 1000.0)
+        span = self.MAX_PULSE_MS - self.MIN_PULSE_MS
+        fraction = (pulse_ms - self.MIN_PULSE_MS) / span
+        return min(180.0, max(0.0, fraction * 180.0))
+
+    def set_duty_cycle(self, duty: float) -> None:
+        self.duty = duty
+
+    def move(self, duty: float) -> float:
+        self.set_duty_cycle(duty)
+        target = self.angle_for(duty)
+        latch = self.rng.uniform(0.0, self.period)
+        seconds = latch + abs(target - self.angle) / self.speed_deg_per_s
+        self.history.append(SimulatedMove(duty, self.angle, target, seconds))
+        self.angle = target
+        self.virtual_time += seconds
+        return seconds * self.time_scale
+
+    def cleanup(self) -> None:
+        self.duty = 0.0
+
+
+def create_backend(
+    kind: str | None = None, chip: int | None = None, channel: int | None = None
+) -> ServoBackend:
+    """Build the backend named by ``kind`` or ``CLAW_BACKEND``.
+
+    Defaults to Jetson.GPIO when it is importable and the simulator otherwise.
+    ``chip``/``channel`` select the sysfs PWM output for the periphery backend.
+    """
+    kind = (kind or os.getenv("CLAW_BACKEND") or "").lower()
+    if not kind:
+        kind = "jetson" if GPIO is not None else "sim"
+    if kind == "jetson":
+        return JetsonGPIOBackend()
+    if kind == "periphery":
+        return PeripheryPWMBackend(
+            chip=int(os.getenv("PWM_CHIP", "0")) if chip is None else chip,
+            channel=int(os.getenv("PWM_CHANNEL", "0")) if channel is None else channel,
+        )
+    if kind == "sim":
+        if GPIO is None:
+            logger.warning("Jetson.GPIO not found, running in MOCK mode (simulated servo)")
+        return SimulatedServoBackend(time_scale=float(os.getenv("SIM_TIME_SCALE", "0")))
+    raise ValueError(f"Unknown CLAW_BACKEND '{kind}'. Use 'jetson', 'periphery' or 'sim'.")
@@ -1,68 +1,103 @@
 from __future__ import annotations
 
 # src/hardware/claw_controller.py
-import time
-from typing import Any
+import threading
 
 from loguru import logger
 
-try:
-    import Jetson.GPIO as GPIO  # type: ignore[import-untyped]
-except ImportError:
-    logger.warning("Jetson.GPIO not found, running in MOCK mode")
-    GPIO = None
+from hardware.backends import ServoBackend, create_backend
+from replies import MOVE_INTERRUPTED_REPLY
 
 
 class ClawController:
     # Pin definitions (Adjust based on wiring)
     # Using simple BCM numbering or Board numbering
     SERVO_PIN: int = 33  # PWM capable pin on Jetson Nano header (PWM0)
+    PWM_FREQUENCY: int = 50  # 50Hz for servos
 
-    def __init__(self) -> None:
+    # Duty cycle for open/close (approx 2.5% to 12.5%)
+    # These values need calibration for specific servo
+    OPEN_DUTY: float = 7.5
+    CLOSE_DUTY: float = 2.5
+
+    def __init__(
+        self,
+        backend: ServoBackend | None = None,
+        name: str = "claw",
+        pin: int | None = None,
+        open_duty: float | None = None,
+        close_duty: float | None = None,
+    ) -> None:
+        self.name = name
+        self.pin: int = self.SERVO_PIN if pin is None else pin
+        self.open_duty: float = self.OPEN_DUTY if open_duty is None else open_duty
+        self.close_duty: float = self.CLOSE_DUTY if close_duty is None else close_duty
         self.state: str = "UNKNOWN"
-        self.mock: bool = GPIO is None
-        self.pwm: Any | None = None
+        self.backend: ServoBackend = backend or create_backend()
+        self.mock: bool = self.backend.simulated
+        self._interrupt = threading.Event()
 
     def init_gpio(self) -> None:
+        self.backend.setup(self.pin, self.PWM_FREQUENCY)
         if self.mock:
-            logger.info("Hardware initialized (MOCK)")
-            return
+            logger.info(f"Hardware initialized (MOCK): {self.name}")
+        else:
+            logger.info(
+                f"Hardware initialized ({self.backend.name}): {self.name} on pin {self.pin}"
+            )
+
+    def _hold(self, seconds: float) -> bool:
+        """Wait for the servo to travel; returns False if interrupted by a stop."""
+        return not self._interrupt.wait(seconds)
 
-        GPIO.setmode(GPIO.BOARD)
-        GPIO.setup(self.SERVO_PIN, GPIO.OUT, initial=GPIO.HIGH)
-        # Setup PWM
-        self.pwm = GPIO.PWM(self.SERVO_PIN, 50)  # 50Hz for servos
-        self.pwm.start(0)
-        logger.info("Hardware initialized (GPIO)")
+    def _move(self, duty: float) -> bool:
+        completed = self._hold(self.backend.move(duty))
+        self.backend.release()  # Stop jitter
+        return completed
 
     def open_claw(self) -> str:
-        logger.info("Opening Claw...")
-        if not self.mock and self.pwm:
-            # Duty cycle for open (approx 2.5% to 12.5%)
-            # These values need calibration for specific servo
-            self.pwm.ChangeDutyCycle(7.5)
-            time.sleep(1)
-            self.pwm.ChangeDutyCycle(0)  # Stop jitter
+        """Open the claw (release whatever it is holding)."""
+        logger.info(f"Opening {self.name}...")
+        if not self._move(self.open_duty):
+            return MOVE_INTERRUPTED_REPLY
 
         self.state = "OPEN"
         return "Claw is now OPEN"
 
     def close_claw(self) -> str:
-        logger.info("Closing Claw...")
-        if not self.mock and self.pwm:
-            self.pwm.ChangeDutyCycle(2.5)
-            time.sleep(1)
-            self.pwm.ChangeDutyCycle(0)
+        """Close the claw (grip)."""
+        logger.info(f"Closing {self.name}...")
+        if not self._move(self.close_duty):
+            return MOVE_INTERRUPTED_REPLY
 
         self.state = "CLOSED"
         return "Claw is now CLOSED"
 
+    def interrupt(self) -> None:
+        """Abort an in-progress move. Safe to call from any thread."""
+        self._interrupt.set()
+
+    def arm(self) -> None:
+        """Clear a stale interrupt before a move is handed to a worker thread.
+
+        Called by the command owner when it dequeues the move, not inside
+        the move itself, so a stop that lands between dequeue and the
+        thread starting still aborts it.
+        """
+        self._interrupt.clear()
+
+    def stop(self) -> str:
+        """Emergency stop: cut the PWM signal immediately."""
+        logger.warning(f"Emergency stop: {self.name}")
+        self.backend.release()
+        self._interrupt.clear()
+        self.state = "STOPPED"
+        return "Claw STOPPED"
+
     def get_status(self) -> str:
+        """Report the last known claw state: OPEN, CLOSED, STOPPED or UNKNOWN."""
         return self.state
 
     def cleanup(self) -> None:
-        if not self.mock:
-            if self.pwm:
-                self.pwm.stop()
-            GPIO.cleanup()
+        self.backend.cleanup()
         logger.info("Hardware cleanup complete")
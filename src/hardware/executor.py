@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+# src/hardware/executor.py
+import asyncio
+import itertools
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+from loguru import logger
+
+from hardware.claw_controller import ClawController
+from hardware.registry import DeviceRegistry
+from replies import MOVE_PREEMPTED_REPLY
+
+ALL_DEVICES = "all"
+
+
+class CommandPriority(IntEnum):
+    """Lower values run first."""
+
+    STOP = 0
+    MOVE = 1
+
+
+@dataclass(frozen=True)
+class StateChange:
+    device: str
+    previous: str
+    state: str
+    action: str
+    timestamp: float
+
+
+@dataclass(order=True)
+class _Command:
+    priority: int
+    seq: int
+    action: str = field(compare=False)
+    func: Callable[[], str] = field(compare=False)
+    future: asyncio.Future[str] = field(compare=False)
+
+
+class _Lane:
+    """Serialized command queue for one actuator."""
+
+    def __init__(self, device: ClawController) -> None:
+        self.device = device
+        self.state: str = device.get_status()
+        self.queue: asyncio.PriorityQueue[_Command] = asyncio.PriorityQueue()
+        self.worker: asyncio.Task[None] | None = None
+
+    def drop_moves(self) -> int:
+        dropped = 0
+        kept: list[_Command] = []
+        while not self.queue.empty():
+            command = self.queue.get_nowait()
+            if command.priority == CommandPriority.MOVE:
+                if not command.future.done():
+                    command.future.set_result(MOVE_PREEMPTED_REPLY)
+                dropped += 1
+            else:
+                kept.append(command)
+        for command in kept:
+            self.queue.put_nowait(command)
+        return dropped
+
+
+class HardwareExecutor:
+    """Single owner of every actuator shared by the chat platforms.
+
+    Each actuator has its own priority queue whose commands run off the
+    event loop in a worker thread: operations on one servo are strictly
+    serialized (Discord and Slack can never interleave PWM writes), while
+    different servos move in parallel. ``get_status`` returns the last
+    committed state without touching the hardware, and subscribers receive
+    a ``StateChange`` whenever a device's state moves.
+    """
+
+    def __init__(self, devices: DeviceRegistry | ClawController) -> None:
+        if isinstance(devices, ClawController):
+            devices = DeviceRegistry.single(devices)
+        self.devices = devices
+        self._lanes: dict[str, _Lane] = {name: _Lane(d) for name, d in devices.devices.items()}
+        self._subscribers: set[asyncio.Queue[StateChange]] = set()
+        self._seq = itertools.count()
+
+    @property
+    def names(self) -> list[str]:
+        return self.devices.names
+
+    def get_status(self, target: str | None = None) -> str:
+        return self._lane(target).state
+
+    def statuses(self) -> dict[str, str]:
+        return {name: lane.state for name, lane in self._lanes.items()}
+
+    def subscribe(self) -> asyncio.Queue[StateChange]:
+        queue: asyncio.Queue[StateChange] = asyncio.Queue()
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[StateChange]) -> None:
+        self._subscribers.discard(queue)
+
+    async def open_claw(self, target: str | None = None) -> str:
+        return await self._dispatch(target, "open", lambda d: d.open_claw)
+
+    async def close_claw(self, target: str | None = None) -> str:
+        return await self._dispatch(target, "close", lambda d: d.close_claw)
+
+    async def emergency_stop(self) -> str:
+        """Abort running moves, drop pending moves and stop every servo."""
+        for lane in self._lanes.values():
+            lane.device.interrupt()
+            dropped = lane.drop_moves()
+            if dropped:
+                logger.warning(
+                    f"Emergency stop dropped {dropped} pending move(s) on {lane.device.name}"
+                )
+        results = await asyncio.gather(
+            *(
+                self._submit(lane, "stop", lane.device.stop, CommandPriority.STOP)
+                for lane in self._lanes.values()
+            )
+        )
+        return results[0] if len(results) == 1 else "\n".join(results)
+
+    def _lane(self, target: str | None) -> _Lane:
+        return self._lanes[self.devices.resolve(target)]
+
+    async def _dispatch(
+        self, target: str | None, action: str, method: Callable[[ClawController], Callable[[], str]]
+    ) -> str:
+        if target is None or target.lower() != ALL_DEVICES:
+            lane = self._lane(target)
+            return await self._submit(lane, action, method(lane.device), CommandPriority.MOVE)
+        lanes = list(self._lanes.values())
+        results = await asyncio.gather(
+            *(
+                self._submit(lane, action, method(lane.device), CommandPriority.MOVE)
+                for lane in lanes
+            )
+        )
+        return "\n".join(f"{lane.device.name}: {r}" for lane, r in zip(lanes, results, strict=True))
+
+    async def _submit(
+        self, lane: _Lane, action: str, func: Callable[[], str], priority: int
+    ) -> str:
+        loop = asyncio.get_running_loop()
+        command = _Command(int(priority), next(self._seq), action, func, loop.create_future())
+        lane.queue.put_nowait(command)
+        if lane.worker is None or lane.worker.done():
+            lane.worker = asyncio.create_task(self._run(lane))
+        return await command.future
+
+    async def _run(self, lane: _Lane) -> None:
+        while not lane.queue.empty():
+            command = lane.queue.get_nowait()
+            if command.future.done():
+                continue
+            if command.priority == CommandPriority.MOVE:
+                lane.device.arm()  # on the loop, so a racing emergency_stop() is never lost
+            try:
+                result = await asyncio.to_thread(command.func)
+            except Exception as e:
+                logger.exception(
+                    f"Hardware command '{command.action}' on {lane.device.name} failed"
+                )
+                if not command.future.done():
+                    command.future.set_exception(e)
+                continue
+            self._commit(lane, command.action)
+            if not command.future.done():
+                command.future.set_result(result)
+
+    def _commit(self, lane: _Lane, action: str) -> None:
+        state = lane.device.get_status()
+        if state == lane.state:
+            return
+        change = StateChange(lane.device.name, lane.state, state, action, time.time())
+        lane.state = state
+        for queue in self._subscribers:
+            queue.put_nowait(change)
+
+    async def close(self) -> None:
+        workers = [lane.worker for lane in self._lanes.values() if lane.worker]
+        for lane in self._lanes.values():
+            if lane.worker and not lane.worker.done():
+                lane.device.interrupt()
+                lane.worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for lane in self._lanes.values():
+            while not lane.queue.empty():
+                lane.queue.get_nowait().future.cancel()
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+# src/hardware/registry.py
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+from loguru import logger
+
+from hardware.backends import create_backend
+from hardware.claw_controller import ClawController
+from replies import UNKNOWN_DEVICE_PREFIX
+
+
+class UnknownDeviceError(LookupError):
+    audit_outcome = "unknown_device"
+
+    def __init__(self, name: str, available: list[str]) -> None:
+        super().__init__(name)
+        self.name = name
+        self.available = available
+
+    def __str__(self) -> str:
+        return f"{UNKNOWN_DEVICE_PREFIX}'{self.name}'. Available: {', '.join(self.available)}"
+
+
+@dataclass(frozen=True)
+class ActuatorConfig:
+    name: str
+    pin: int = ClawController.SERVO_PIN
+    backend: str | None = None
+    open_duty: float = ClawController.OPEN_DUTY
+    close_duty: float = ClawController.CLOSE_DUTY
+    pwm_chip: int | None = None
+    pwm_channel: int | None = None
+
+    @classmethod
+    def from_dict(cls, name: str, data: dict[str, Any] | None) -> ActuatorConfig:
+        data = data or {}
+        unknown = set(data) - {f for f in cls.__dataclass_fields__ if f != "name"}
+        if unknown:
+            raise ValueError(f"Actuator '{name}' has unknown keys: {', '.join(sorted(unknown))}")
+        return cls(name=name.lower(), **data)
+
+    def build(self) -> ClawController:
+        backend = create_backend(self.backend, chip=self.pwm_chip, channel=self.pwm_channel)
+        return ClawController(
+            backend=backend,
+            name=self.name,
+            pin=self.pin,
+            open_duty=self.open_duty,
+            close_duty=self.close_duty,
+        )
+
+
+class DeviceRegistry:
+    """Named actuators driven from one Jetson.
+
+    Loaded from a YAML file (``CLAW_CONFIG``)::
+
+        default: claw
+        actuators:
+          claw:  {pin: 33, open_duty: 7.5, close_duty: 2.5}
+          wrist: {pin: 32, open_duty: 10.0, close_duty: 5.0}
+
+    Without a config file the registry holds the single legacy claw.
+    Names are case-insensitive: they are stored and reported in lower case,
+    which is how chat commands spell them.
+    """
+
+    def __init__(self, devices: dict[str, ClawController], default: str | None = None) -> None:
+        if not devices:
+            raise ValueError("DeviceRegistry needs at least one actuator")
+        self.devices = {name.lower(): device for name, device in devices.items()}
+        if len(self.devices) != len(devices):
+            raise ValueError(f"Actuator names differ only by case: {', '.join(devices)}")
+        self.default_name = (default or next(iter(self.devices))).lower()
+        if self.default_name not in self.devices:
+            raise UnknownDeviceError(self.default_name, self.names)
+
+    @classmethod
+    def single(cls, claw: ClawController | None = None) -> DeviceRegistry:
+        claw = claw or ClawController()
+        return cls({claw.name: claw})
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DeviceRegistry:
+        actuators = data.get("actuators") or {}
+        devices = {
+            name: ActuatorConfig.from_dict(name, options).build()
+            for name, options in actuators.items()
+        }
+        return cls(devices, default=data.get("default"))
+
+    @classmethod
+    def from_yaml(cls, path: str | Path) -> DeviceRegistry:
+        with open(path) as f:
+            data = yaml.safe_load(f) or {}
+        registry = cls.from_dict(data)
+        logger.info(f"Loaded {len(registry.devices)} actuator(s) from {path}: {registry.names}")
+        return registry
+
+    @classmethod
+    def load(cls, path: str | None) -> DeviceRegistry:
+        return cls.from_yaml(path) if path else cls.single()
+
+    @property
+    def names(self) -> list[str]:
+        return list(self.devices)
+
+    def resolve(self, name: str | None = None) -> str:
+        """Registry key for ``name`` (any case), or the default actuator's."""
+        key = (name or self.default_name).lower()
+        if key not in self.devices:
+            raise UnknownDeviceError(name or key, self.names)
+        return key
+
+    def get(self, name: str | None = None) -> ClawController:
+        return self.devices[self.resolve(name)]
+
+    def __iter__(self) -> Iterator[ClawController]:
+        return iter(self.devices.values())
+
+    def __len__(self) -> int:
+        return len(self.devices)
+
+    def init_all(self) -> None:
+        for device in self:
+            device.init_gpio()
+
+    def cleanup_all(self) -> None:
+        for device in self:
+            device.cleanup()
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+# src/hardware/telemetry.py
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class TelemetrySample:
+    """One tegrastats-style reading of the board."""
+
+    temperatures: dict[str, float] = field(default_factory=dict)  # zone type -> Celsius
+    mem_total_mb: float = 0.0
+    mem_available_mb: float = 0.0
+    swap_total_mb: float = 0.0
+    swap_free_mb: float = 0.0
+    timestamp: float = 0.0
+
+    @property
+    def max_temp(self) -> float:
+        return max(self.temperatures.values(), default=0.0)
+
+    @property
+    def mem_used_pct(self) -> float:
+        if not self.mem_total_mb:
+            return 0.0
+        return 100.0 * (1 - self.mem_available_mb / self.mem_total_mb)
+
+    @property
+    def swap_used_pct(self) -> float:
+        if not self.swap_total_mb:
+            return 0.0
+        return 100.0 * (1 - self.swap_free_mb / self.swap_total_mb)
+
+    def summary(self) -> str:
+        return (
+            f"temp {self.max_temp:.1f}C, RAM {self.mem_used_pct:.0f}% "
+            f"of {self.mem_total_mb:.0f}MB, swap {self.swap_used_pct:.0f}%"
+        )
+
+
+class TelemetrySampler:
+    """Reads thermal zones from ``/sys`` and memory/swap from ``/proc``.
+
+    ``root`` is prepended to every path, so tests (or a dev laptop) can
+    point it at a directory tree of plain files that mimics the Jetson's
+    ``sys/class/thermal/thermal_zone*/{type,temp}`` and ``proc/meminfo``.
+    Readings are cached for ``min_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        root: str | Path = "/",
+        min_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.root = Path(root)
+        self.min_interval = min_interval
+        self._clock = clock
+        self._cached: TelemetrySample | None = None
+        self._cached_at = 0.0
+
+    def sample(self) -> TelemetrySample:
+        now = self._clock()
+        if self._cached is not None and now - self._cached_at < self.min_interval:
+            return self._cached
+        meminfo = self._read_meminfo()
+        self._cached = TelemetrySample(
+            temperatures=self._read_thermal_zones(),
+            mem_total_mb=meminfo.get("MemTotal", 0.0),
+            mem_available_mb=meminfo.get("MemAvailable", 0.0),
+            swap_total_mb=meminfo.get("SwapTotal", 0.0),
+            swap_free_mb=meminfo.get("SwapFree", 0.0),
+            timestamp=time.time(),
+        )
+        self._cached_at = now
+        return self._cached
+
+    def _read_thermal_zones(self) -> dict[str, float]:
+        temperatures: dict[str, float] = {}
+        for zone in sorted((self.root / "sys/class/thermal").glob("thermal_zone*")):
+            try:
+                millidegrees = int((zone / "temp").read_text().strip())
+            except (OSError, ValueError):
+                continue
+            try:
+                name = (zone / "type").read_text().strip()
+            except OSError:
+                name = zone.name
+            temperatures[name] = millidegrees / 1000.0
+        return temperatures
+
+    def _read_meminfo(self) -> dict[str, float]:
+        values: dict[str, float] = {}
+        try:
+            text = (self.root / "proc/meminfo").read_text()
+        except OSError as e:
+            logger.debug(f"Cannot read meminfo: {e}")
+            return values
+        for line in text.splitlines():
+            key, _, rest = line.partition(":")
+            parts = rest.split()
+            if parts:
+                values[key] = float(parts[0]) / 1024.0  # kB -> MB
+        return values
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+# src/ipc/client.py
+import asyncio
+import itertools
+import time
+from typing import Any
+
+from loguru import logger
+
+from hardware.registry import UnknownDeviceError
+from ipc.protocol import ProtocolError, encode, read_frame
+from replies import CORE_OFFLINE_REPLY
+
+
+class CoreUnavailableError(ConnectionError):
+    """The core process cannot be reached (not started yet, or restarting)."""
+
+    audit_outcome = "offline"
+
+
+class CoreError(RuntimeError):
+    """The core process failed to handle a request."""
+
+
+class CoreClient:
+    """Gateway-side connection to the core process.
+
+    Requests carry an id and are matched to replies by a single reader
+    task, so many can be in flight at once. Pushed ``state`` events keep a
+    local copy of every actuator's state for instant status replies. When
+    the core goes away, pending calls fail with ``CoreUnavailableError``
+    and the next call reconnects (waiting up to ``timeout`` seconds).
+    """
+
+    def __init__(self, path: str, timeout: float = 10.0, retry_delay: float = 0.25) -> None:
+        self.path = path
+        self.timeout = timeout
+        self.retry_delay = retry_delay
+        self.names: list[str] = []
+        self.default: str | None = None
+        self.states: dict[str, str] = {}
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task[None] | None = None
+        self._pending: dict[int, asyncio.Future[Any]] = {}
+        self._ids = itertools.count(1)
+        self._connect_lock = asyncio.Lock()
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None
+
+    async def connect(self, timeout: float | None = None) -> None:
+        """Connect and read the core's hello; ``timeout=None`` waits forever."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.path)
+                hello = await read_frame(reader)
+                if hello is None or hello.get("event") != "hello":
+                    writer.close()
+                    raise ConnectionResetError("Core closed the connection during handshake")
+                break
+            except (FileNotFoundError, ConnectionError) as e:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise CoreUnavailableError(f"Core not reachable at {self.path}: {e}") from e
+                await asyncio.sleep(self.retry_delay)
+        self.names = list(hello["names"])
+        self.default = hello.get("default")
+        self.states = dict(hello["states"])
+        self._writer = writer
+        self._reader_task = asyncio.create_task(self._read(reader, writer))
+        logger.info(f"Connected to core at {self.path} ({len(self.names)} device(s))")
+
+    async def call(self, op: str, **args: Any) -> Any:
+        if self._writer is None:
+            async with self._connect_lock:
+                if self._writer is None:
+                    await self.connect(self.timeout)
+        assert self._writer is not None
+        request_id = next(self._ids)
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            self._writer.write(encode({"id": request_id, "op": op, **args}))
+            await self._writer.drain()
+            return await future
+        except ConnectionError as e:
+            raise CoreUnavailableError(str(e)) from e
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _read(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while (message := await read_frame(reader)) is not None:
+                if message.get("event") == "state":
+                    self.states[message["device"]] = message["state"]
+                    continue
+                future = self._pending.get(message.get("id"))  # type: ignore[arg-type]
+                if future is None or future.done():
+                    continue
+                error = message.get("error")
+                if error is None:
+                    future.set_result(message.get("result"))
+                elif error.get("type") == "unknown_device":
+                    future.set_exception(UnknownDeviceError(error["name"], error["available"]))
+                else:
+                    future.set_exception(CoreError(error.get("message", "core error")))
+        except (ConnectionError, ProtocolError) as e:
+            logger.warning(f"Core connection error: {e}")
+        finally:
+            if self._writer is writer:
+                self._writer = None
+            writer.close()
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(CoreUnavailableError("Core connection lost"))
+            logger.warning("Disconnected from core")
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+            self._reader_task = None
+
+
+class RemoteHardware:
+    """``HardwareExecutor`` look-alike for gateway processes.
+
+    Status reads come from the client's event-fed state copy; commands
+    are forwarded to the core, which owns the actuators.
+    """
+
+    def __init__(self, client: CoreClient) -> None:
+        self.client = client
+
+    @property
+    def names(self) -> list[str]:
+        return self.client.names
+
+    def get_status(self, target: str | None = None) -> str:
+        name = (target or self.client.default or "").lower()
+        if name not in self.client.states:
+            raise UnknownDeviceError(str(name), self.names)
+        return self.client.states[name]
+
+    def statuses(self) -> dict[str, str]:
+        return dict(self.client.states)
+
+    async def open_claw(self, target: str | None = None) -> str:
+        return await self._command("open", target)
+
+    async def close_claw(self, target: str | None = None) -> str:
+        return await self._command("close", target)
+
+    async def emergency_stop(self) -> str:
+        return await self._command("stop", None)
+
+    async def _command(self, op: str, target: str | None) -> str:
+        try:
+            return str(await self.client.call(op, target=target))
+        except CoreUnavailableError as e:
+            logger.error(f"Claw command '{op}' not delivered: {e}")
+            return CORE_OFFLINE_REPLY
+
+
+class RemoteChat:
+    """Chat backend that runs the prompt through the core's LLM pipeline."""
+
+    def __init__(self, client: CoreClient) -> None:
+        self.client = client
+
+    async def chat(self, prompt: str, context: object = None, max_tokens: int | None = None) -> str:
+        try:
+            return str(
+                await self.client.call(
+                    "chat", prompt=prompt, context=context, max_tokens=max_tokens
+                )
+            )
+        except (CoreUnavailableError, CoreError) as e:
+            logger.error(f"Chat request to core failed: {e}")
+            return CORE_OFFLINE_REPLY
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+# src/ipc/core.py
+import asyncio
+import os
+from dataclasses import asdict
+from typing import Any, Protocol
+
+from loguru import logger
+
+from hardware.executor import HardwareExecutor
+from hardware.registry import UnknownDeviceError
+from ipc.protocol import ProtocolError, encode, read_frame
+from lifecycle import Lifecycle
+
+
+class ChatBackend(Protocol):
+    async def chat(
+        self, prompt: str, context: object = None, max_tokens: int | None = None
+    ) -> str: ...
+
+
+class CoreServer:
+    """Unix-socket front for the hardware queue and chat pipeline.
+
+    Platform gateway processes send ``{"id", "op", ...}`` frames and get
+    ``{"id", "result"}`` or ``{"id", "error"}`` back. Requests from one
+    connection run concurrently, so a long LLM call never blocks a claw
+    command. Every client also receives ``{"event": "state", ...}`` for
+    each ``StateChange``, after a ``hello`` with the device list and
+    current states.
+    """
+
+    def __init__(
+        self,
+        hardware: HardwareExecutor,
+        chat: ChatBackend,
+        path: str,
+        lifecycle: Lifecycle | None = None,
+    ) -> None:
+        self.hardware = hardware
+        self.chat = chat
+        self.path = path
+        self.lifecycle = lifecycle or Lifecycle()
+        self._server: asyncio.Server | None = None
+        self._connections: set[asyncio.Task[None]] = set()
+
+    async def start(self) -> None:
+        if os.path.exists(self.path):
+            os.unlink(self.path)  # stale socket from a crashed core
+        self._server = await asyncio.start_unix_server(self._serve_client, path=self.path)
+        os.chmod(self.path, 0o600)
+        logger.info(f"Core IPC listening on {self.path}")
+        await asyncio.sleep(float("inf"))  # Keep running
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for task in self._connections:
+                task.cancel()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+    async def _serve_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        self._connections.add(task)
+        lock = asyncio.Lock()
+        queue = self.hardware.subscribe()
+        pending: set[asyncio.Task[None]] = set()
+
+        async def send(message: dict[str, Any]) -> None:
+            async with lock:
+                writer.write(encode(message))
+                await writer.drain()
+
+        async def push_changes() -> None:
+            while True:
+                change = await queue.get()
+                await send({"event": "state", **asdict(change)})
+
+        pusher = asyncio.create_task(push_changes())
+        try:
+            await send(
+                {
+                    "event": "hello",
+                    "names": self.hardware.names,
+                    "default": self.hardware.devices.default_name,
+                    "states": self.hardware.statuses(),
+                }
+            )
+            while (request := await read_frame(reader)) is not None:
+                job = asyncio.create_task(self._answer(request, send))
+                pending.add(job)
+                job.add_done_callback(pending.discard)
+        except (ConnectionError, ProtocolError) as e:
+            logger.warning(f"Core IPC client dropped: {e}")
+        finally:
+            self.hardware.unsubscribe(queue)
+            pusher.cancel()
+            for job in pending:
+                job.cancel()
+            await asyncio.gather(pusher, *pending, return_exceptions=True)
+            writer.close()
+            self._connections.discard(task)
+
+    async def _answer(self, request: dict[str, Any], send: Any) -> None:
+        reply: dict[str, Any] = {"id": request.get("id")}
+        try:
+            with self.lifecycle.track():
+                reply["result"] = await self._dispatch(request)
+        except UnknownDeviceError as e:
+            reply["error"] = {"type": "unknown_device", "name": e.name, "available": e.available}
+        except Exception as e:
+            logger.exception(f"Core IPC request '{request.get('op')}' failed")
+            reply["error"] = {"type": "internal", "message": str(e)}
+        try:
+            await send(reply)
+        except ConnectionError:
+            pass
+
+    async def _dispatch(self, request: dict[str, Any]) -> Any:
+        op = request.get("op")
+        target = request.get("target")
+        if op == "chat":
+            return await self.chat.chat(
+                str(request["prompt"]),
+                context=request.get("context"),
+                max_tokens=request.get("max_tokens"),
+            )
+        if op == "open":
+            return await self.hardware.open_claw(target)
+        if op == "close":
+            return await self.hardware.close_claw(target)
+        if op == "stop":
+            return await self.hardware.emergency_stop()
+        if op == "status":
+            return self.hardware.statuses()
+        raise ValueError(f"Unknown op '{op}'")
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+# src/ipc/protocol.py
+import asyncio
+import json
+import struct
+from typing import Any
+
+DEFAULT_SOCKET = "/tmp/openclaw-core.sock"
+MAX_FRAME = 1 << 20  # 1 MiB; chat prompts and replies are far smaller
+
+_HEADER = struct.Struct("!I")
+
+
+class ProtocolError(RuntimeError):
+    """Malformed or oversized frame on the core socket."""
+
+
+def encode(message: dict[str, Any]) -> bytes:
+    body = json.dumps(message, separators=(",", ":")).encode()
+    if len(body) > MAX_FRAME:
+        raise ProtocolError(f"Frame of {len(body)} bytes exceeds {MAX_FRAME}")
+    return _HEADER.pack(len(body)) + body
+
+
+async def read_frame(reader: asyncio.StreamReader) -> dict[str, Any] | None:
+    """Next length-prefixed JSON message, or None once the peer has closed."""
+    try:
+        header = await reader.readexactly(_HEADER.size)
+    except asyncio.IncompleteReadError:
+        return None
+    (length,) = _HEADER.unpack(header)
+    if length > MAX_FRAME:
+        raise ProtocolError(f"Frame of {length} bytes exceeds {MAX_FRAME}")
+    try:
+        body = await reader.readexactly(length)
+    except asyncio.IncompleteReadError:
+        return None
+    try:
+        message = json.loads(body)
+    except ValueError as e:  # JSONDecodeError and UnicodeDecodeError
+        raise ProtocolError(f"Frame is not valid JSON: {e}") from e
+    if not isinstance(message, dict):
+        raise ProtocolError("Frame is not a JSON object")
+    return message
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+# src/ipc/supervisor.py
+import asyncio
+import contextlib
+import signal
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from loguru import logger
+
+
+@dataclass
+class WorkerSpec:
+    role: str
+    argv: list[str]
+    env: dict[str, str] = field(default_factory=dict)
+
+
+class Supervisor:
+    """Runs the core and gateway processes and restarts any that crash.
+
+    The first spec is the core: the others start once ``ready`` returns.
+    A worker that dies is restarted after ``backoff`` seconds, doubling up
+    to ``max_backoff`` while it keeps crashing; a run longer than
+    ``stable_after`` resets the delay. On shutdown gateways get SIGTERM
+    first so they can drain replies that still need the core, then the
+    core; anything still alive after ``stop_timeout`` is killed.
+    """
+
+    def __init__(
+        self,
+        specs: list[WorkerSpec],
+        ready: Callable[[], Awaitable[None]] | None = None,
+        backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        stable_after: float = 60.0,
+        stop_timeout: float = 35.0,
+    ) -> None:
+        if not specs:
+            raise ValueError("Supervisor needs at least one worker")
+        self.specs = specs
+        self.ready = ready
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.stable_after = stable_after
+        self.stop_timeout = stop_timeout
+        self.processes: dict[str, asyncio.subprocess.Process] = {}
+        self.restarts: dict[str, int] = {spec.role: 0 for spec in specs}
+        self._stopping = asyncio.Event()
+        self._tasks: list[asyncio.Task[None]] = []
+
+    async def run(self) -> None:
+        """Start every worker and supervise until ``stop()``; then shut them down."""
+        core, *gateways = self.specs
+        self._tasks.append(asyncio.create_task(self._keep_alive(core)))
+        try:
+            if self.ready is not None and gateways:
+                ready = asyncio.create_task(self.ready())
+                stopping = asyncio.create_task(self._stopping.wait())
+                await asyncio.wait([ready, stopping], return_when=asyncio.FIRST_COMPLETED)
+                for task in (ready, stopping):
+                    task.cancel()
+            if not self._stopping.is_set():
+                for spec in gateways:
+                    self._tasks.append(asyncio.create_task(self._keep_alive(spec)))
+            await self._stopping.wait()
+        finally:
+            self._stopping.set()
+            await self._terminate([s.role for s in gateways])
+            await self._terminate([core.role])
+            for task in self._tasks:
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    def signal(self, sig: signal.Signals) -> None:
+        """Forward ``sig`` (e.g. SIGHUP for a reload) to every live worker."""
+        for process in self.processes.values():
+            if process.returncode is None:
+                process.send_signal(sig)
+
+    async def _keep_alive(self, spec: WorkerSpec) -> None:
+        delay = self.backoff
+        while not self._stopping.is_set():
+            started = time.monotonic()
+            # Own session: a terminal Ctrl+C reaches the supervisor only, which
+            # then stops the workers in order
+            process = await asyncio.create_subprocess_exec(
+                *spec.argv, env=spec.env or None, start_new_session=True
+            )
+            self.processes[spec.role] = process
+            logger.info(f"Started {spec.role} worker (pid {process.pid})")
+            try:
+                code = await process.wait()
+            except asyncio.CancelledError:
+                if process.returncode is None:
+                    process.kill()  # spawned after shutdown began
+                raise
+            if self._stopping.is_set():
+                return
+            if time.monotonic() - started >= self.stable_after:
+                delay = self.backoff
+            self.restarts[spec.role] += 1
+            logger.error(f"{spec.role} worker exited with code {code}; restarting in {delay:.1f}s")
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), delay)
+            delay = min(delay * 2, self.max_backoff)
+
+    async def _terminate(self, roles: list[str]) -> None:
+        live = [
+            (role, p)
+            for role in roles
+            if (p := self.processes.get(role)) is not None and p.returncode is None
+        ]
+        for role, process in live:
+            logger.info(f"Stopping {role} worker (pid {process.pid})")
+            process.terminate()
+        for role, process in live:
+            try:
+                await asyncio.wait_for(process.wait(), self.stop_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"{role} worker ignored SIGTERM for {self.stop_timeout:.0f}s, killing"
+                )
+                process.kill()
+                await process.wait()
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+# src/lifecycle.py
+import asyncio
+import os
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import TypeVar
+
+from loguru import logger
+
+from llm.admission import AdmissionController, AdmissionThresholds
+from llm.generation import load_profiles
+from llm.memory import ConversationMemory
+from llm.ollama_client import OllamaClient, _validate_ollama_host
+from llm.resilience import RetryPolicy
+from llm.tools import ToolAgent
+
+T = TypeVar("T")
+
+
+class Lifecycle:
+    """Tracks in-flight chat/API work so shutdown can drain instead of cancel.
+
+    Entry points wrap each request in ``track()``; ``stop_accepting()``
+    makes them turn new work away and ``drain()`` waits for the rest.
+    """
+
+    def __init__(self) -> None:
+        self.accepting = True
+        self.in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        self.in_flight += 1
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            if self.in_flight == 0:
+                self._idle.set()
+
+    def stop_accepting(self) -> None:
+        self.accepting = False
+
+    async def drain(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for tracked work; True if it all finished."""
+        self.stop_accepting()
+        if self.in_flight:
+            logger.info(f"Draining {self.in_flight} in-flight request(s), up to {timeout:.0f}s")
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Drain deadline hit with {self.in_flight} request(s) still running")
+            return False
+        return True
+
+
+def _env(name: str, parse: Callable[[str], T], current: T) -> T:
+    """``parse`` the env var ``name``, or keep ``current`` when it is unset."""
+    raw = os.getenv(name)
+    if raw is None:
+        return current
+    try:
+        return parse(raw)
+    except ValueError as e:
+        raise ValueError(f"{name}={raw!r}: {e}") from e
+
+
+def _positive(parse: Callable[[str], T]) -> Callable[[str], T]:
+    def check(raw: str) -> T:
+        value = parse(raw)
+        if value <= 0:  # type: ignore[operator]
+            raise ValueError("must be positive")
+        return value
+
+    return check
+
+
+async def reload_settings(
+    ai: OllamaClient,
+    admission: AdmissionController | None = None,
+    memory: ConversationMemory | None = None,
+    agent: ToolAgent | None = None,
+) -> list[str]:
+    """Re-apply tunables from the (already reloaded) environment in place.
+
+    Tokens and the actuator registry need a restart; model, host, generation
+    profiles, retry, admission, memory and tool-loop limits take effect on the
+    next request. Every value is parsed before anything is applied, so one bad
+    value rejects the whole reload and leaves the running config untouched.
+    Returns the names of the settings that changed.
+    """
+    updates: list[tuple[object, str, object, str]] = []
+    try:
+        updates.append((ai, "model", os.getenv("OLLAMA_MODEL", ai.model), "OLLAMA_MODEL"))
+        host = _validate_ollama_host(os.getenv("OLLAMA_HOST", ai.host))
+        updates.append((ai, "host", host, "OLLAMA_HOST"))
+        profiles = load_profiles(os.getenv("OLLAMA_PROFILES"))
+        updates.append((ai, "profiles", profiles, "OLLAMA_PROFILES"))
+
+        if ai.cache is not None:
+            threshold = _env("SEMANTIC_CACHE_THRESHOLD", float, ai.cache.threshold)
+            updates.append((ai.cache, "threshold", threshold, "SEMANTIC_CACHE_THRESHOLD"))
+            ttl = _env("SEMANTIC_CACHE_TTL", _positive(float), ai.cache.ttl)
+            updates.append((ai.cache, "ttl", ttl, "SEMANTIC_CACHE_TTL"))
+
+        policy = RetryPolicy.from_env()
+
+        if admission is not None:
+            limit = _env("LLM_MAX_CONCURRENCY", _positive(int), admission.max_concurrency)
+            updates.append((admission, "max_concurrency", limit, "LLM_MAX_CONCURRENCY"))
+            fallback = os.getenv("OLLAMA_FALLBACK_MODEL") or None
+            updates.append((admission, "fallback_model", fallback, "OLLAMA_FALLBACK_MODEL"))
+            thresholds = AdmissionThresholds.from_env()
+            updates.append((admission, "thresholds", thresholds, "ADMISSION_*"))
+
+        if memory is not None:
+            tokens = _env("MEMORY_MAX_TOKENS", int, memory.max_tokens)
+            if tokens > 0:  # turning memory off needs a restart
+                updates.append((memory, "max_tokens", tokens, "MEMORY_MAX_TOKENS"))
+            keep = _env("MEMORY_KEEP_TURNS", int, memory.keep_turns)
+            updates.append((memory, "keep_turns", keep, "MEMORY_KEEP_TURNS"))
+            summary_model = os.getenv("OLLAMA_SUMMARY_MODEL") or (
+                fallback if admission is not None else None
+            )
+            updates.append((memory, "summary_model", summary_model, "OLLAMA_SUMMARY_MODEL"))
+
+        if agent is not None:
+            iterations = _env("OLLAMA_TOOL_MAX_ITERATIONS", _positive(int), agent.max_iterations)
+            updates.append((agent, "max_iterations", iterations, "OLLAMA_TOOL_MAX_ITERATIONS"))
+            budget = _env("OLLAMA_TOOL_BUDGET", _positive(float), agent.budget)
+            updates.append((agent, "budget", budget, "OLLAMA_TOOL_BUDGET"))
+    except (OSError, ValueError) as e:
+        logger.error(f"Rejecting reload, keeping the current settings: {e}")
+        return []
+
+    changed: list[str] = []
+    for obj, attr, value, label in updates:
+        if getattr(obj, attr) != value:
+            setattr(obj, attr, value)
+            changed.append(label)
+
+    if policy != ai.resilience.policy:
+        ai.resilience.policy = policy
+        ai.resilience.breaker.failure_threshold = policy.failure_threshold
+        ai.resilience.breaker.recovery_timeout = policy.recovery_timeout
+        changed.append("OLLAMA_RETRY")
+
+    if admission is not None:
+        await admission.wake()
+
+    return changed
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+# src/llm/admission.py
+import asyncio
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import Enum
+
+from loguru import logger
+
+from hardware.telemetry import TelemetrySample, TelemetrySampler
+
+
+class Action(Enum):
+    ADMIT = "admit"
+    DEGRADE = "degrade"
+    SHED = "shed"
+
+
+@dataclass(frozen=True)
+class Decision:
+    action: Action
+    reason: str = ""
+    model: str | None = None  # override the default model when degraded
+
+
+class OverloadedError(RuntimeError):
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+        self.reason = reason
+
+
+@dataclass(frozen=True)
+class AdmissionThresholds:
+    """Limits for the Orin Nano; the SoC starts throttling in the mid-80s C."""
+
+    warn_temp: float = 75.0
+    max_temp: float = 88.0
+    warn_mem_pct: float = 85.0
+    max_mem_pct: float = 95.0
+    max_swap_pct: float = 60.0
+
+    @classmethod
+    def from_env(cls) -> AdmissionThresholds:
+        default = cls()
+        return cls(
+            warn_temp=float(os.getenv("ADMISSION_WARN_TEMP", str(default.warn_temp))),
+            max_temp=float(os.getenv("ADMISSION_MAX_TEMP", str(default.max_temp))),
+            warn_mem_pct=float(os.getenv("ADMISSION_WARN_MEM_PCT", str(default.warn_mem_pct))),
+            max_mem_pct=float(os.getenv("ADMISSION_MAX_MEM_PCT", str(default.max_mem_pct))),
+            max_swap_pct=float(os.getenv("ADMISSION_MAX_SWAP_PCT", str(default.max_swap_pct))),
+        )
+
+
+class AdmissionController:
+    """Thermal/memory-aware gate in front of every LLM request.
+
+    Healthy: up to ``max_concurrency`` generations at once. Warm or memory
+    tight: concurrency drops to ``degraded_concurrency`` and requests are
+    routed to ``fallback_model`` when one is configured. Saturated: new
+    requests are shed with ``OverloadedError`` so the bots can reply
+    immediately instead of queueing behind a throttled GPU.
+    """
+
+    def __init__(
+        self,
+        sampler: TelemetrySampler,
+        max_concurrency: int = 2,
+        degraded_concurrency: int = 1,
+        fallback_model: str | None = None,
+        thresholds: AdmissionThresholds | None = None,
+    ) -> None:
+        self.sampler = sampler
+        self.max_concurrency = max_concurrency
+        self.degraded_concurrency = degraded_concurrency
+        self.fallback_model = fallback_model
+        self.thresholds = thresholds or AdmissionThresholds()
+        self.in_flight = 0
+        self._slots = asyncio.Condition()
+
+    def evaluate(self, sample: TelemetrySample | None = None) -> Decision:
+        sample = sample or self.sampler.sample()
+        t = self.thresholds
+        if sample.max_temp >= t.max_temp:
+            return Decision(Action.SHED, f"SoC at {sample.max_temp:.0f}C")
+        if sample.mem_used_pct >= t.max_mem_pct:
+            return Decision(Action.SHED, f"RAM {sample.mem_used_pct:.0f}% used")
+        if sample.swap_used_pct >= t.max_swap_pct:
+            return Decision(Action.SHED, f"swap {sample.swap_used_pct:.0f}% used")
+        if sample.max_temp >= t.warn_temp:
+            return Decision(Action.DEGRADE, f"SoC at {sample.max_temp:.0f}C", self.fallback_model)
+        if sample.mem_used_pct >= t.warn_mem_pct:
+            return Decision(
+                Action.DEGRADE, f"RAM {sample.mem_used_pct:.0f}% used", self.fallback_model
+            )
+        return Decision(Action.ADMIT)
+
+    def limit(self, decision: Decision) -> int:
+        if decision.action is Action.DEGRADE:
+            return self.degraded_concurrency
+        return self.max_concurrency
+
+    async def wake(self) -> None:
+        """Let queued requests re-check the limits, e.g. after a config reload."""
+        async with self._slots:
+            self._slots.notify_all()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[Decision]:
+        """Hold one generation slot; raises OverloadedError when shedding."""
+        decision = self.evaluate()
+        if decision.action is Action.SHED:
+            logger.warning(f"Shedding LLM request: {decision.reason}")
+            raise OverloadedError(decision.reason)
+        async with self._slots:
+            # Re-evaluated on every wake-up so a cooling board admits more work
+            while self.in_flight >= self.limit(decision):
+                await self._slots.wait()
+                decision = self.evaluate()
+                if decision.action is Action.SHED:
+                    raise OverloadedError(decision.reason)
+            self.in_flight += 1
+        if decision.action is Action.DEGRADE:
+            logger.info(f"LLM degraded ({decision.reason}), model={decision.model or 'default'}")
+        try:
+            yield decision
+        finally:
+            async with self._slots:
+                self.in_flight -= 1
+                self._slots.notify_all()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+# src/llm/generation.py
+import os
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any
+
+import yaml
+from loguru import logger
+
+TRUNCATION_MARKER = " …(cut short, ask me to continue)"
+
+# Rough token ceilings that keep a reply inside each platform's message limit
+# (Discord: 2000 characters; Slack allows more but long walls of text read badly)
+PLATFORM_TOKEN_BUDGETS: dict[str, int] = {"discord": 400, "slack": 800}
+
+
+@dataclass(frozen=True)
+class GenerationProfile:
+    """Ollama ``options`` for one kind of request.
+
+    ``num_ctx`` defaults small: the KV cache for the context window lives
+    in the Jetson's shared 8GB, and chat prompts here are short.
+    """
+
+    num_predict: int = 384
+    num_ctx: int = 2048
+    temperature: float | None = None
+    top_p: float | None = None
+    stop: tuple[str, ...] = field(default_factory=tuple)
+
+    @classmethod
+    def from_dict(cls, name: str, data: dict[str, Any] | None) -> GenerationProfile:
+        data = dict(data or {})
+        unknown = set(data) - set(cls.__dataclass_fields__)
+        if unknown:
+            raise ValueError(f"Profile '{name}' has unknown keys: {', '.join(sorted(unknown))}")
+        if "stop" in data:
+            data["stop"] = tuple(data["stop"] or ())
+        return cls(**data)
+
+    def options(self, max_tokens: int | None = None) -> dict[str, Any]:
+        """Options payload, with ``num_predict`` capped at ``max_tokens``."""
+        num_predict = self.num_predict
+        if max_tokens is not None and max_tokens > 0:
+            num_predict = min(num_predict, max_tokens)
+        options: dict[str, Any] = {"num_predict": num_predict, "num_ctx": self.num_ctx}
+        if self.temperature is not None:
+            options["temperature"] = self.temperature
+        if self.top_p is not None:
+            options["top_p"] = self.top_p
+        if self.stop:
+            options["stop"] = list(self.stop)
+        return options
+
+
+DEFAULT_PROFILES: dict[str, GenerationProfile] = {
+    "chat": GenerationProfile(num_predict=384, num_ctx=2048, temperature=0.7),
+    "command-explain": GenerationProfile(num_predict=160, num_ctx=1024, temperature=0.2),
+    "tools": GenerationProfile(num_predict=256, num_ctx=4096, temperature=0.1),
+    "summary": GenerationProfile(num_predict=200, num_ctx=4096, temperature=0.2),
+}
+
+
+def load_profiles(path: str | Path | None = None) -> dict[str, GenerationProfile]:
+    """Built-in profiles, overlaid by a YAML file, then by ``OLLAMA_NUM_*`` env vars.
+
+    YAML format (unlisted profiles keep their defaults)::
+
+        profiles:
+          chat: {num_predict: 300, temperature: 0.8, stop: ["\\nUser:"]}
+          command-explain: {num_predict: 120}
+
+    ``OLLAMA_NUM_CTX``, ``OLLAMA_NUM_PREDICT`` and ``OLLAMA_TEMPERATURE``
+    apply to the ``chat`` profile only.
+    """
+    profiles = dict(DEFAULT_PROFILES)
+    if path:
+        with open(path) as f:
+            data = yaml.safe_load(f) or {}
+        for name, options in (data.get("profiles") or {}).items():
+            base = profiles.get(name, GenerationProfile())
+            override = GenerationProfile.from_dict(name, options)
+            profiles[name] = replace(base, **{k: getattr(override, k) for k in options or {}})
+        logger.info(f"Loaded generation profiles from {path}: {sorted(profiles)}")
+
+    overrides: dict[str, Any] = {}
+    if num_ctx := os.getenv("OLLAMA_NUM_CTX"):
+        overrides["num_ctx"] = int(num_ctx)
+    if num_predict := os.getenv("OLLAMA_NUM_PREDICT"):
+        overrides["num_predict"] = int(num_predict)
+    if temperature := os.getenv("OLLAMA_TEMPERATURE"):
+        overrides["temperature"] = float(temperature)
+    if overrides:
+        profiles["chat"] = replace(profiles["chat"], **overrides)
+    return profiles
+
+
+def platform_budget(platform: str) -> int | None:
+    """Max reply tokens for a platform (``<PLATFORM>_MAX_TOKENS`` overrides)."""
+    value = os.getenv(f"{platform.upper()}_MAX_TOKENS")
+    if value is not None:
+        return int(value) or None
+    return PLATFORM_TOKEN_BUDGETS.get(platform)
+
+
+def clip_message(text: str, limit: int) -> str:
+    """Hard-cut ``text`` to ``limit`` characters, ending with the truncation marker."""
+    if len(text) <= limit:
+        return text
+    if text.endswith(TRUNCATION_MARKER):
+        text = text[: -len(TRUNCATION_MARKER)]
+    return text[: limit - len(TRUNCATION_MARKER)].rstrip() + TRUNCATION_MARKER
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+# src/llm/memory.py
+import asyncio
+from collections import OrderedDict
+from typing import Protocol
+
+from loguru import logger
+
+from llm.admission import Action
+from llm.ollama_client import OllamaClient
+from replies import reply_outcome
+
+SUMMARY_PROMPT = (
+    "You maintain the running memory of a chat between a user and OpenClaw, a robot "
+    "claw assistant. Merge the previous summary and the new transcript into one short "
+    "summary. Keep names, decisions, open questions and claw/device state; drop "
+    "greetings and filler. Answer with the summary only."
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token for English on llama tokenizers)."""
+    return len(text) // 4 + 4  # + per-message role/template overhead
+
+
+class ChatBackend(Protocol):
+    async def chat(
+        self, prompt: str, context: object | None = None, max_tokens: int | None = None
+    ) -> str: ...
+
+
+class Conversation:
+    """History of one thread: a rolling summary plus the most recent turns."""
+
+    __slots__ = ("summary", "turns", "tokens", "compaction")
+
+    def __init__(self) -> None:
+        self.summary = ""
+        self.turns: list[dict[str, str]] = []
+        self.tokens = 0
+        self.compaction: asyncio.Task[None] | None = None
+
+    def append(self, role: str, content: str) -> None:
+        self.turns.append({"role": role, "content": content})
+        self.tokens += estimate_tokens(content)
+
+    def recount(self) -> None:
+        self.tokens = estimate_tokens(self.summary) if self.summary else 0
+        self.tokens += sum(estimate_tokens(turn["content"]) for turn in self.turns)
+
+
+class ConversationMemory:
+    """Drop-in for ``chat`` that gives each thread a bounded, compacted history.
+
+    ``context`` is the conversation key (``InboundMessage.conversation_key``).
+    Once a conversation grows past ``max_tokens``, a background task waits
+    for the GPU to go idle (no generation in flight, admission healthy),
+    summarizes everything but the last ``keep_turns`` turns with
+    ``summary_model`` and swaps those turns for the summary. The prompt sent
+    per reply therefore stays roughly constant however long the thread runs.
+    Until then, history is cut to what fits the ``profile``'s context window
+    (``num_ctx - num_predict``) next to the prompt, so Ollama never silently
+    truncates the start of it. Up to ``max_conversations`` threads are kept,
+    least recently used first out.
+    """
+
+    def __init__(
+        self,
+        inner: ChatBackend,
+        client: OllamaClient,
+        max_tokens: int = 1500,
+        keep_turns: int = 6,
+        summary_model: str | None = None,
+        max_conversations: int = 256,
+        idle_poll: float = 1.0,
+        idle_timeout: float = 300.0,
+        profile: str = "chat",
+    ) -> None:
+        self.inner = inner
+        self.client = client
+        self.max_tokens = max_tokens
+        self.keep_turns = keep_turns
+        self.summary_model = summary_model
+        self.max_conversations = max_conversations
+        self.idle_poll = idle_poll
+        self.idle_timeout = idle_timeout
+        self.profile = profile
+        self._conversations: OrderedDict[str, Conversation] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._conversations)
+
+    def conversation(self, key: str) -> Conversation:
+        conversation = self._conversations.get(key)
+        if conversation is None:
+            conversation = self._conversations[key] = Conversation()
+            while len(self._conversations) > self.max_conversations:
+                _, evicted = self._conversations.popitem(last=False)
+                if evicted.compaction and not evicted.compaction.done():
+                    evicted.compaction.cancel()
+        else:
+            self._conversations.move_to_end(key)
+        return conversation
+
+    def budget(self, prompt: str = "", max_tokens: int | None = None) -> int:
+        """History tokens that fit the context window beside ``prompt`` and the reply."""
+        options = self.client.options(self.profile, max_tokens)
+        room = options["num_ctx"] - options["num_predict"] - estimate_tokens(prompt)
+        # Hard cap for when the GPU never goes idle long enough to compact
+        return max(0, min(2 * self.max_tokens, room))
+
+    def history(self, key: str, budget: int | None = None) -> list[dict[str, str]]:
+        """Messages to prepend to the next prompt: summary first, then recent turns."""
+        conversation = self.conversation(key)
+        turns = conversation.turns
+        if budget is None:
+            budget = self.budget()
+        summary = ""
+        if conversation.summary:
+            summary = f"Summary of the earlier conversation: {conversation.summary}"
+            budget -= estimate_tokens(summary)
+        start = len(turns)
+        while start > 0:
+            cost = estimate_tokens(turns[start - 1]["content"])
+            if cost > budget:
+                break
+            budget -= cost
+            start -= 1
+        messages = turns[start:]
+        if summary:
+            messages = [{"role": "system", "content": summary}, *messages]
+        return messages
+
+    async def chat(
+        self, prompt: str, context: object | None = None, max_tokens: int | None = None
+    ) -> str:
+        if not isinstance(context, str):
+            return await self.inner.chat(prompt, max_tokens=max_tokens)
+        history = self.history(context, self.budget(prompt, max_tokens))
+        reply = await self.inner.chat(prompt, context=history, max_tokens=max_tokens)
+        if reply_outcome(reply) != "ok":
+            return reply  # a canned failure is not something the model said
+        conversation = self.conversation(context)
+        conversation.append("user", prompt)
+        conversation.append("assistant", reply)
+        if conversation.tokens > self.max_tokens and (
+            conversation.compaction is None or conversation.compaction.done()
+        ):
+            conversation.compaction = asyncio.create_task(self._compact(context, conversation))
+        return reply
+
+    async def _wait_for_idle(self) -> bool:
+        admission = self.client.admission
+        if admission is None:
+            return True
+        loop = asyncio.get_running_loop()
+        give_up = loop.time() + self.idle_timeout
+        while loop.time() < give_up:
+            if admission.in_flight == 0 and admission.evaluate().action is Action.ADMIT:
+                return True
+            await asyncio.sleep(self.idle_poll)
+        return False
+
+    async def _compact(self, key: str, conversation: Conversation) -> None:
+        if not await self._wait_for_idle():
+            logger.debug(f"Skipped compacting {key}: GPU never went idle")
+            return
+        older = conversation.turns[: -self.keep_turns or None]
+        if not older:
+            return
+        transcript = "\n".join(f"{turn['role']}: {turn['content']}" for turn in older)
+        if conversation.summary:
+            transcript = f"Previous summary: {conversation.summary}\n\n{transcript}"
+        message = await self.client.chat_completion(
+            [
+                {"role": "system", "content": SUMMARY_PROMPT},
+                {"role": "user", "content": transcript},
+            ],
+            model=self.summary_model,
+            profile="summary",
+        )
+        summary = (message or {}).get("content", "").strip()
+        if not summary:
+            logger.warning(f"Compaction of {key} failed, keeping full history")
+            return
+        before = conversation.tokens
+        # Turns added while summarizing are newer than ``older`` and survive
+        del conversation.turns[: len(older)]
+        conversation.summary = summary
+        conversation.recount()
+        logger.info(f"Compacted {key}: {before} -> {conversation.tokens} tokens")
+
+    async def close(self) -> None:
+        tasks = [
+            c.compaction
+            for c in self._conversations.values()
+            if c.compaction and not c.compaction.done()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,14 +1,35 @@
 from __future__ import annotations
 
 # src/llm/ollama_client.py
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
 from urllib.parse import urlparse
 
 import aiohttp
 from loguru import logger
 
+from llm.admission import AdmissionController, OverloadedError
+from llm.generation import DEFAULT_PROFILES, TRUNCATION_MARKER, GenerationProfile
+from llm.resilience import (
+    CircuitOpenError,
+    OllamaError,
+    Resilience,
+    RetryPolicy,
+    TransientOllamaError,
+)
+from llm.semantic_cache import SemanticCache, is_standalone
+from replies import NEURAL_ERROR_REPLY, OFFLINE_REPLY, OLLAMA_ERROR_REPLY, OVERLOADED_REPLY
+
 _ALLOWED_SCHEMES = {"http", "https"}
 
 
+# Embeddings take milliseconds; never let one hold up a reply for long
+EMBED_TIMEOUT = 5.0
+
+
 def _validate_ollama_host(host: str) -> str:
     """Reject dangerous OLLAMA_HOST values (SSRF guard).
 
@@ -24,11 +45,54 @@ def _validate_ollama_host(host: str) -> str:
     return host
 
 
+def mark_truncated(text: str, done_reason: str | None) -> str:
+    """Flag user-facing replies that stopped at ``num_predict`` rather than finishing."""
+    if done_reason == "length":
+        return text.rstrip() + TRUNCATION_MARKER
+    return text
+
+
+class StreamDecoder:
+    """Incremental NDJSON decoder for Ollama's ``stream: true`` responses.
+
+    Network reads do not line up with JSON lines, so a partial trailing
+    line is kept in the buffer until the rest of it arrives.
+    """
+
+    __slots__ = ("_buffer",)
+
+    def __init__(self) -> None:
+        self._buffer = b""
+
+    def feed(self, data: bytes) -> list[dict[str, Any]]:
+        buffer = self._buffer + data if self._buffer else data
+        end = buffer.rfind(b"\n")
+        if end == -1:
+            self._buffer = buffer
+            return []
+        self._buffer = buffer[end + 1 :]
+        return [json.loads(line) for line in buffer[:end].split(b"\n") if line]
+
+
 class OllamaClient:
-    def __init__(self, host: str, model: str) -> None:
+    def __init__(
+        self,
+        host: str,
+        model: str,
+        retry: RetryPolicy | None = None,
+        admission: AdmissionController | None = None,
+        cache: SemanticCache | None = None,
+        embed_model: str | None = None,
+        profiles: dict[str, GenerationProfile] | None = None,
+    ) -> None:
         self.host = _validate_ollama_host(host)
         self.model = model
         self.session: aiohttp.ClientSession | None = None
+        self.resilience = Resilience(retry, probe=self.check_connection)
+        self.admission = admission
+        self.cache = cache
+        self.embed_model = embed_model
+        self.profiles = profiles or dict(DEFAULT_PROFILES)
 
     async def __aenter__(self) -> OllamaClient:
         return self
@@ -37,37 +101,231 @@ class OllamaClient:
         await self.close()
 
     async def close(self) -> None:
+        await self.resilience.close()
         if self.session and not self.session.closed:
             await self.session.close()
             self.session = None
 
-    async def check_connection(self) -> bool:
+    @asynccontextmanager
+    async def _admit(self) -> AsyncIterator[str]:
+        """Hold an admission slot and yield the model to use for this request."""
+        if self.admission is None:
+            yield self.model
+            return
+        async with self.admission.slot() as decision:
+            yield decision.model or self.model
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
         if not self.session or self.session.closed:
             self.session = aiohttp.ClientSession()
+        return self.session
+
+    async def _post(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
+        session = self._ensure_session()
+        async with session.post(f"{self.host}{path}", json=payload) as resp:
+            if resp.status == 200:
+                return await resp.json()
+            body = await resp.text()
+            if resp.status >= 500:
+                raise TransientOllamaError(resp.status, body)
+            raise OllamaError(resp.status, body)
+
+    async def _open_stream(self, path: str, payload: dict[str, Any]) -> aiohttp.ClientResponse:
+        resp = await self._ensure_session().post(f"{self.host}{path}", json=payload)
+        if resp.status == 200:
+            return resp
+        body = await resp.text()
+        resp.release()
+        if resp.status >= 500:
+            raise TransientOllamaError(resp.status, body)
+        raise OllamaError(resp.status, body)
+
+    async def check_connection(self) -> bool:
+        session = self._ensure_session()
         try:
-            async with self.session.get(f"{self.host}/api/tags") as resp:
+            async with session.get(f"{self.host}/api/tags") as resp:
                 if resp.status == 200:
                     return True
         except Exception as e:
             logger.error(f"Could not connect to Ollama at {self.host}: {e}")
         return False
 
-    async def chat(self, prompt: str, context: object | None = None) -> str:
-        if not self.session or self.session.closed:
-            self.session = aiohttp.ClientSession()
+    def options(self, profile: str = "chat", max_tokens: int | None = None) -> dict[str, Any]:
+        """Ollama ``options`` for a named profile (unknown names fall back to ``chat``)."""
+        selected = self.profiles.get(profile) or self.profiles.get("chat") or GenerationProfile()
+        return selected.options(max_tokens)
+
+    async def embed(self, text: str) -> list[float] | None:
+        """Embedding of ``text`` from ``embed_model``, or None if unavailable."""
+        if not self.embed_model or not self.resilience.available:
+            return None
+        payload = {"model": self.embed_model, "input": text}
+        try:
+            data = await asyncio.wait_for(self._post("/api/embed", payload), EMBED_TIMEOUT)
+        except Exception as e:
+            logger.debug(f"Embedding failed, skipping semantic cache: {e!r}")
+            return None
+        embeddings = data.get("embeddings") or [None]
+        return embeddings[0]
+
+    async def cache_lookup(
+        self, prompt: str, context: object | None = None
+    ) -> tuple[list[float] | None, str | None]:
+        """Embedding of ``prompt`` and a cached answer to it, if the cache applies.
+
+        Prompts with no history are always eligible; mid-conversation only
+        ``is_standalone`` prompts are looked up, since other answers depend on
+        the thread. The embedding is None when the prompt must not be cached.
+        """
+        if self.cache is None or (context and not is_standalone(prompt)):
+            return None, None
+        vector = await self.embed(prompt)
+        if vector is None:
+            return None, None
+        cached = self.cache.lookup(vector)
+        if cached is not None:
+            logger.debug(f"Semantic cache hit ({self.cache.hit_rate:.0%} hit rate)")
+        return vector, cached
+
+    def cache_store(
+        self, vector: list[float] | None, reply: str, context: object | None = None
+    ) -> None:
+        """Remember ``reply`` for the prompt ``vector`` came from (see ``cache_lookup``).
 
-        # Simple completion endpoint, or chat depending on version
-        url = f"{self.host}/api/generate"
-        payload = {"model": self.model, "prompt": prompt, "stream": False}
+        Only replies generated without history are stored: one written with a
+        thread in view may answer from it ("your name is Alice") and must not
+        be served to another conversation.
+        """
+        if isinstance(context, list) and context:
+            return
+        if self.cache is not None and vector is not None:
+            self.cache.store(vector, reply)
 
+    async def chat(
+        self,
+        prompt: str,
+        context: object | None = None,
+        max_tokens: int | None = None,
+        profile: str = "chat",
+    ) -> str:
+        """Answer ``prompt``; ``context`` may be earlier chat messages to continue from."""
+        vector, cached = await self.cache_lookup(prompt, context)
+        if cached is not None:
+            return cached
         try:
-            async with self.session.post(url, json=payload) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    return data.get("response", "I have no words.")
+            options = self.options(profile, max_tokens)
+            async with self._admit() as model:
+                if isinstance(context, list) and context:
+                    messages = [*context, {"role": "user", "content": prompt}]
+                    payload = {
+                        "model": model,
+                        "messages": messages,
+                        "stream": False,
+                        "options": options,
+                    }
+                    data = await self.resilience.call(lambda: self._post("/api/chat", payload))
+                    text = data.get("message", {}).get("content")
                 else:
-                    logger.error(f"Ollama error: {resp.status} - {await resp.text()}")
-                    return "Sorry, my brain is offline."
+                    # Simple completion endpoint, or chat depending on version
+                    payload = {
+                        "model": model,
+                        "prompt": prompt,
+                        "stream": False,
+                        "options": options,
+                    }
+                    data = await self.resilience.call(lambda: self._post("/api/generate", payload))
+                    text = data.get("response")
+            if not text:
+                return "I have no words."
+            reply = mark_truncated(text, data.get("done_reason"))
+            # Answers from a degraded fallback model are not worth reusing
+            if model == self.model:
+                self.cache_store(vector, reply, context)
+            return reply
+        except OverloadedError as e:
+            return f"{OVERLOADED_REPLY} ({e.reason}). Please try again in a minute."
+        except CircuitOpenError:
+            return OFFLINE_REPLY
+        except OllamaError as e:
+            logger.error(f"Ollama error: {e}")
+            return OLLAMA_ERROR_REPLY
         except Exception:
             logger.exception("LLM Request Failed")
-            return "I encountered a neural error."
+            return NEURAL_ERROR_REPLY
+
+    async def chat_stream(
+        self, prompt: str, max_tokens: int | None = None, profile: str = "chat"
+    ) -> AsyncIterator[str]:
+        """Yield response tokens as Ollama generates them."""
+        try:
+            options = self.options(profile, max_tokens)
+            async with self._admit() as model:
+                payload = {"model": model, "prompt": prompt, "stream": True, "options": options}
+                # Retries cover connecting and the response status, not a stream cut mid-way
+                resp = await self.resilience.call(
+                    lambda: self._open_stream("/api/generate", payload)
+                )
+                try:
+                    decoder = StreamDecoder()
+                    async for data in resp.content.iter_any():
+                        for chunk in decoder.feed(data):
+                            token = chunk.get("response")
+                            if token:
+                                yield token
+                            if chunk.get("done"):
+                                if chunk.get("done_reason") == "length":
+                                    yield TRUNCATION_MARKER
+                                return
+                finally:
+                    resp.release()
+        except OverloadedError as e:
+            yield f"{OVERLOADED_REPLY} ({e.reason}). Please try again in a minute."
+        except CircuitOpenError:
+            yield OFFLINE_REPLY
+        except OllamaError as e:
+            logger.error(f"Ollama error: {e}")
+            yield OLLAMA_ERROR_REPLY
+        except Exception:
+            logger.exception("LLM stream failed")
+            yield NEURAL_ERROR_REPLY
+
+    async def chat_completion(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        timeout: float | None = None,
+        model: str | None = None,
+        profile: str = "chat",
+        max_tokens: int | None = None,
+    ) -> dict[str, Any] | None:
+        """Call /api/chat and return the assistant message, or None on failure.
+
+        The message is returned as generated; a ``done_reason`` key is added
+        when Ollama sent one, for callers that show the reply to a user.
+        """
+        try:
+            async with self._admit() as admitted:
+                payload: dict[str, Any] = {
+                    "model": model or admitted,
+                    "messages": messages,
+                    "stream": False,
+                    "options": self.options(profile, max_tokens),
+                }
+                if tools:
+                    payload["tools"] = tools
+                data = await self.resilience.call(
+                    lambda: self._post("/api/chat", payload), deadline=timeout
+                )
+            message = data.get("message")
+            if message is not None and data.get("done_reason"):
+                message["done_reason"] = data["done_reason"]
+            return message
+        except OverloadedError as e:
+            logger.warning(f"LLM chat shed: {e.reason}")
+        except CircuitOpenError:
+            logger.warning("LLM chat skipped: circuit open")
+        except OllamaError as e:
+            logger.error(f"Ollama chat error: {e}")
+        except Exception:
+            logger.exception("LLM chat request failed")
+        return None
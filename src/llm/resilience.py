@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+# src/llm/resilience.py
+import asyncio
+import os
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import aiohttp
+from loguru import logger
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    stop_after_delay,
+    wait_random_exponential,
+)
+
+T = TypeVar("T")
+
+
+class OllamaError(Exception):
+    """Non-retryable error response from Ollama (4xx)."""
+
+    def __init__(self, status: int, body: str) -> None:
+        super().__init__(f"{status} - {body}")
+        self.status = status
+        self.body = body
+
+
+class TransientOllamaError(OllamaError):
+    """5xx from Ollama, typically while a model is (re)loading."""
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling Ollama while the circuit breaker is open."""
+
+
+# Connection resets, refused connections and per-attempt timeouts are worth retrying
+RETRYABLE: tuple[type[BaseException], ...] = (
+    aiohttp.ClientConnectionError,
+    aiohttp.ServerDisconnectedError,
+    asyncio.TimeoutError,
+    ConnectionError,
+    TransientOllamaError,
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    attempts: int = 3
+    attempt_timeout: float = 120.0
+    deadline: float = 180.0
+    backoff_initial: float = 0.5
+    backoff_max: float = 8.0
+    failure_threshold: int = 3
+    recovery_timeout: float = 30.0
+    probe_interval: float = 5.0
+
+    @classmethod
+    def from_env(cls) -> RetryPolicy:
+        default = cls()
+        return cls(
+            attempts=int(os.getenv("OLLAMA_RETRIES", str(default.attempts))),
+            attempt_timeout=float(
+                os.getenv("OLLAMA_ATTEMPT_TIMEOUT", str(default.attempt_timeout))
+            ),
+            deadline=float(os.getenv("OLLAMA_DEADLINE", str(default.deadline))),
+            failure_threshold=int(
+                os.getenv("OLLAMA_BREAKER_THRESHOLD", str(default.failure_threshold))
+            ),
+            recovery_timeout=float(
+                os.getenv("OLLAMA_BREAKER_COOLDOWN", str(default.recovery_timeout))
+            ),
+        )
+
+
+class CircuitBreaker:
+    """Classic closed / open / half-open breaker.
+
+    After ``failure_threshold`` consecutive failed calls the circuit opens
+    and calls are refused until ``recovery_timeout`` has passed, at which
+    point a single trial call is let through (half-open).
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        recovery_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+
+    def allow(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and self._clock() - self.opened_at >= self.recovery_timeout:
+            self.state = self.HALF_OPEN
+            return True
+        return False
+
+    def record_success(self) -> None:
+        if self.state != self.CLOSED:
+            logger.info("Ollama circuit closed, LLM back online")
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(f"Ollama circuit opened after {self.failures} failure(s)")
+            self.state = self.OPEN
+            self.opened_at = self._clock()
+
+
+class Resilience:
+    """Retry, deadline and circuit-breaker wrapper for Ollama calls.
+
+    Retryable failures are retried with full-jitter exponential backoff,
+    each attempt is bounded by ``attempt_timeout`` and the whole call by
+    ``deadline``. When the breaker opens, a background task keeps probing
+    ``probe`` and closes the circuit as soon as Ollama answers again.
+    """
+
+    def __init__(
+        self,
+        policy: RetryPolicy | None = None,
+        probe: Callable[[], Awaitable[bool]] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.policy = policy or RetryPolicy()
+        self.breaker = CircuitBreaker(
+            self.policy.failure_threshold, self.policy.recovery_timeout, clock=clock
+        )
+        self.probe = probe
+        self._probe_task: asyncio.Task[None] | None = None
+
+    @property
+    def available(self) -> bool:
+        return self.breaker.state != CircuitBreaker.OPEN
+
+    async def call(self, fn: Callable[[], Awaitable[T]], deadline: float | None = None) -> T:
+        if not self.breaker.allow():
+            raise CircuitOpenError("Ollama circuit is open")
+
+        loop = asyncio.get_running_loop()
+        deadline = self.policy.deadline if deadline is None else deadline
+        expires = loop.time() + deadline
+
+        async def attempt() -> T:
+            remaining = expires - loop.time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError("Ollama deadline exceeded")
+            return await asyncio.wait_for(fn(), min(self.policy.attempt_timeout, remaining))
+
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(self.policy.attempts) | stop_after_delay(deadline),
+            wait=wait_random_exponential(
+                multiplier=self.policy.backoff_initial, max=self.policy.backoff_max
+            ),
+            retry=retry_if_exception_type(RETRYABLE),
+            before_sleep=lambda state: logger.warning(
+                f"Ollama attempt {state.attempt_number} failed "
+                f"({state.outcome.exception()!r}), retrying"
+            ),
+            reraise=True,
+        )
+        try:
+            result: Any = await retrying(attempt)
+        except TransientOllamaError:
+            self._failed()
+            raise
+        except OllamaError:
+            # A 4xx answer still proves the server is up
+            self.breaker.record_success()
+            raise
+        except Exception:
+            self._failed()
+            raise
+        self.breaker.record_success()
+        return result
+
+    def _failed(self) -> None:
+        self.breaker.record_failure()
+        if self.breaker.state == CircuitBreaker.OPEN:
+            self._start_probe()
+
+    def _start_probe(self) -> None:
+        if self.probe is None or (self._probe_task and not self._probe_task.done()):
+            return
+        self._probe_task = asyncio.create_task(self._probe_until_healthy())
+
+    async def _probe_until_healthy(self) -> None:
+        assert self.probe is not None
+        while self.breaker.state != CircuitBreaker.CLOSED:
+            await asyncio.sleep(self.policy.probe_interval)
+            try:
+                healthy = await asyncio.wait_for(self.probe(), self.policy.probe_interval)
+            except Exception:
+                healthy = False
+            if healthy:
+                self.breaker.record_success()
+
+    async def close(self) -> None:
+        if self._probe_task and not self._probe_task.done():
+            self._probe_task.cancel()
+            await asyncio.gather(self._probe_task, return_exceptions=True)
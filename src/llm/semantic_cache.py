@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+# src/llm/semantic_cache.py
+import re
+import time
+from collections.abc import Callable, Sequence
+
+import numpy as np
+
+# Words that point back at earlier turns ("is it open?", "and the other one?") or at
+# the people in them ("what is my name?"), whose answers differ per conversation
+_REFERENCES = frozenset(
+    "it its it's that this these those they them their he she him her his one ones other "
+    "above previous earlier before again more continue else also too same instead then "
+    "me my mine myself your yours yourself we us our ours".split()
+)
+_WORD = re.compile(r"[a-z']+")
+
+
+def is_standalone(prompt: str) -> bool:
+    """Whether ``prompt`` can be answered without the conversation before it.
+
+    Such prompts are looked up in the cache even mid-thread.
+    Short replies ("yes", "why not?") and anything referring back are not.
+    """
+    words = _WORD.findall(prompt.lower())
+    return len(words) >= 3 and _REFERENCES.isdisjoint(words)
+
+
+class SemanticCache:
+    """Fixed-size store of (prompt embedding, answer) pairs.
+
+    Vectors are L2-normalized into one preallocated float32 matrix, so a
+    lookup is a single matrix-vector product (cosine similarity against
+    every entry) plus an argmax. A hit needs ``similarity >= threshold``.
+    When full, the least recently used entry is overwritten; entries older
+    than ``ttl`` seconds are ignored.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 512,
+        threshold: float = 0.92,
+        ttl: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.capacity = capacity
+        self.threshold = threshold
+        self.ttl = ttl
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._vectors: np.ndarray | None = None  # allocated on first store (dim unknown)
+        self._stored_at = np.zeros(capacity, dtype=np.float64)
+        self._used = np.zeros(capacity, dtype=np.int64)
+        self._answers: list[str] = []
+        self._tick = 0
+
+    def __len__(self) -> int:
+        return len(self._answers)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "size": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 3),
+        }
+
+    def clear(self) -> None:
+        self._vectors = None
+        self._answers.clear()
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> np.ndarray | None:
+        v = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(v))
+        return v / norm if norm else None
+
+    def lookup(self, vector: Sequence[float]) -> str | None:
+        q = self._normalize(vector)
+        size = len(self._answers)
+        if q is None or self._vectors is None or not size or q.shape[0] != self._vectors.shape[1]:
+            self.misses += 1
+            return None
+        scores = self._vectors[:size] @ q
+        scores[self._stored_at[:size] < self._clock() - self.ttl] = -1.0
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._tick += 1
+        self._used[best] = self._tick
+        return self._answers[best]
+
+    def store(self, vector: Sequence[float], answer: str) -> None:
+        v = self._normalize(vector)
+        if v is None:
+            return
+        if self._vectors is None or self._vectors.shape[1] != v.shape[0]:
+            # First entry, or the embedding model changed: start over
+            self._vectors = np.zeros((self.capacity, v.shape[0]), dtype=np.float32)
+            self._answers.clear()
+        if len(self._answers) < self.capacity:
+            slot = len(self._answers)
+            self._answers.append(answer)
+        else:
+            slot = int(np.argmin(self._used))
+            self._answers[slot] = answer
+        self._tick += 1
+        self._vectors[slot] = v
+        self._stored_at[slot] = self._clock()
+        self._used[slot] = self._tick
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+# src/llm/tools.py
+import asyncio
+import inspect
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from loguru import logger
+
+from audit import AuditJournal
+from hardware.claw_controller import ClawController
+from hardware.executor import ALL_DEVICES, HardwareExecutor
+from hardware.registry import UnknownDeviceError
+from llm.ollama_client import OllamaClient, mark_truncated
+from replies import OLLAMA_ERROR_REPLY, STEP_LIMIT_REPLY, TIMEOUT_REPLY, claw_outcome
+
+# ClawController method -> HardwareExecutor coroutine/function that runs it through the queue
+_HARDWARE_METHODS: dict[str, str] = {
+    "open_claw": "open_claw",
+    "close_claw": "close_claw",
+    "get_status": "get_status",
+    "stop": "emergency_stop",
+}
+_TARGETED = {"open_claw", "close_claw", "get_status"}
+# Audit intents of the tools that move hardware, as recorded for chat commands
+_INTENTS = {"open_claw": "open", "close_claw": "close", "stop": "stop"}
+
+MAX_WAIT_SECONDS = 5.0
+
+
+SYSTEM_PROMPT = (
+    "You are OpenClaw, an assistant running on a Jetson that controls a robotic claw. "
+    "Use the provided tools to move or inspect the hardware, then answer briefly."
+)
+
+
+@dataclass(frozen=True)
+class Tool:
+    name: str
+    description: str
+    parameters: dict[str, Any]
+    handler: Callable[[dict[str, Any]], Awaitable[str]]
+
+    def definition(self) -> dict[str, Any]:
+        return {
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "description": self.description,
+                "parameters": self.parameters,
+            },
+        }
+
+
+def _hardware_tool(hardware: HardwareExecutor, method: str, audit: AuditJournal | None) -> Tool:
+    description = inspect.getdoc(getattr(ClawController, method)) or method
+    properties: dict[str, Any] = {}
+    if method in _TARGETED and len(hardware.names) > 1:
+        properties["target"] = {
+            "type": "string",
+            "enum": [*hardware.names, ALL_DEVICES],
+            "description": f"Actuator to use (default: {hardware.devices.default_name})",
+        }
+    call = getattr(hardware, _HARDWARE_METHODS[method])
+
+    async def handler(args: dict[str, Any]) -> str:
+        target = args.get("target") if method in _TARGETED else None
+        if method == "get_status":
+            if target == ALL_DEVICES:
+                return ", ".join(f"{n}={s}" for n, s in hardware.statuses().items())
+            return call(target)
+        if audit is None:
+            return await (call(target) if method in _TARGETED else call())
+        with audit.track_tool(_INTENTS[method], target=target) as entry:
+            result = await (call(target) if method in _TARGETED else call())
+            entry.outcome = claw_outcome(result)
+            return result
+
+    return Tool(method, description, {"type": "object", "properties": properties}, handler)
+
+
+async def _wait(args: dict[str, Any]) -> str:
+    seconds = min(max(float(args.get("seconds", 1.0)), 0.0), MAX_WAIT_SECONDS)
+    await asyncio.sleep(seconds)
+    return f"Waited {seconds:g}s"
+
+
+def hardware_tools(hardware: HardwareExecutor, audit: AuditJournal | None = None) -> list[Tool]:
+    """Tool definitions generated from the ClawController methods, plus ``wait``.
+
+    Moves made through the tools are recorded in ``audit``, attributed to the
+    chat the model was answering.
+    """
+    tools = [_hardware_tool(hardware, method, audit) for method in _HARDWARE_METHODS]
+    tools.append(
+        Tool(
+            "wait",
+            f"Pause between hardware actions (max {MAX_WAIT_SECONDS:g} seconds).",
+            {
+                "type": "object",
+                "properties": {"seconds": {"type": "number"}},
+                "required": ["seconds"],
+            },
+            _wait,
+        )
+    )
+    return tools
+
+
+class ToolAgent:
+    """Drop-in for ``OllamaClient.chat`` that lets the model drive hardware.
+
+    Runs the /api/chat tool loop: every tool call the model returns is
+    executed through the hardware queue and fed back, until the model
+    answers in plain text. The loop is capped both in iterations and in
+    wall-clock time so a confused model cannot hold a request open.
+    """
+
+    def __init__(
+        self,
+        client: OllamaClient,
+        tools: list[Tool],
+        max_iterations: int = 4,
+        budget: float = 60.0,
+        tool_timeout: float = 10.0,
+        system_prompt: str = SYSTEM_PROMPT,
+    ) -> None:
+        self.client = client
+        self.tools = {tool.name: tool for tool in tools}
+        self.max_iterations = max_iterations
+        self.budget = budget
+        self.tool_timeout = tool_timeout
+        self.system_prompt = system_prompt
+
+    async def chat(
+        self, prompt: str, context: object | None = None, max_tokens: int | None = None
+    ) -> str:
+        vector, cached = await self.client.cache_lookup(prompt, context)
+        if cached is not None:
+            return cached
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.budget
+        definitions = [tool.definition() for tool in self.tools.values()]
+        history = context if isinstance(context, list) else []
+        messages: list[dict[str, Any]] = [
+            {"role": "system", "content": self.system_prompt},
+            *history,
+            {"role": "user", "content": prompt},
+        ]
+
+        for iteration in range(self.max_iterations):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return TIMEOUT_REPLY
+            message = await self.client.chat_completion(
+                messages,
+                tools=definitions,
+                timeout=remaining,
+                profile="tools",
+                max_tokens=max_tokens,
+            )
+            if message is None:
+                if iteration == 0:
+                    # Model or server without tool support: plain completion
+                    return await self.client.chat(prompt, context, max_tokens=max_tokens)
+                return OLLAMA_ERROR_REPLY
+
+            done_reason = message.pop("done_reason", None)
+            calls = message.get("tool_calls") or []
+            if not calls:
+                content = message.get("content")
+                if not content:
+                    return "I have no words."
+                content = mark_truncated(content, done_reason)
+                # A reply that moved or read the hardware must not be replayed later
+                if iteration == 0:
+                    self.client.cache_store(vector, content, history)
+                return content
+
+            messages.append(message)
+            for call in calls:
+                function = call.get("function", {})
+                name = function.get("name", "")
+                result = await self._execute(name, function.get("arguments") or {}, deadline)
+                messages.append({"role": "tool", "tool_name": name, "content": result})
+
+        logger.warning(f"Tool loop hit the {self.max_iterations}-iteration cap")
+        return STEP_LIMIT_REPLY
+
+    async def _execute(self, name: str, args: dict[str, Any], deadline: float) -> str:
+        tool = self.tools.get(name)
+        if tool is None:
+            return f"Error: unknown tool '{name}'"
+        timeout = min(self.tool_timeout, deadline - asyncio.get_running_loop().time())
+        if timeout <= 0:
+            return "Error: latency budget exhausted"
+        logger.info(f"LLM tool call: {name}({args})")
+        try:
+            return await asyncio.wait_for(tool.handler(args), timeout)
+        except asyncio.TimeoutError:
+            return f"Error: {name} timed out after {timeout:.1f}s"
+        except UnknownDeviceError as e:
+            return f"Error: {e}"
+        except Exception as e:
+            logger.exception(f"Tool {name} failed")
+            return f"Error: {name} failed ({e})"
@@ -4,49 +4,214 @@ from __future__ import annotations
 import asyncio
 import os
 import signal
+import sys
+from dataclasses import dataclass
 
 from dotenv import load_dotenv
 from loguru import logger
 
+from api.server import ControlAPI
+from audit import AuditJournal
 from bot.discord_bot import OpenClawDiscord
+from bot.outbound import OutboundSender
+from bot.placeholder import ReplyDeadline
 from bot.slack_bot import OpenClawSlack
-from hardware.claw_controller import ClawController
+from hardware.executor import HardwareExecutor
+from hardware.registry import DeviceRegistry
+from hardware.telemetry import TelemetrySampler
+from ipc.client import CoreClient, RemoteChat, RemoteHardware
+from ipc.core import CoreServer
+from ipc.protocol import DEFAULT_SOCKET
+from ipc.supervisor import Supervisor, WorkerSpec
+from lifecycle import Lifecycle, reload_settings
+from llm.admission import Action, AdmissionController, AdmissionThresholds
+from llm.generation import load_profiles
+from llm.memory import ConversationMemory
 from llm.ollama_client import OllamaClient
+from llm.resilience import RetryPolicy
+from llm.semantic_cache import SemanticCache
+from llm.tools import ToolAgent, hardware_tools
 
 load_dotenv()
 
+# OPENCLAW_ROLE is set by the supervisor for its workers; unset means the
+# classic single process running everything
+GATEWAY_ROLES = ("discord", "slack")
 
-async def shutdown(loop: asyncio.AbstractEventLoop, signal: signal.Signals | None = None) -> None:
-    if signal:
-        logger.info(f"Received exit signal {signal.name}...")
-    tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
-    [task.cancel() for task in tasks]
-    await asyncio.gather(*tasks, return_exceptions=True)
-    loop.stop()
 
+@dataclass
+class Core:
+    """Hardware and LLM pipeline; owned by exactly one process."""
 
-async def main() -> None:
-    logger.info("Initializing OpenClaw System...")
+    devices: DeviceRegistry
+    hardware: HardwareExecutor
+    admission: AdmissionController
+    ai: OllamaClient
+    chat_ai: OllamaClient | ToolAgent | ConversationMemory
+    agent: ToolAgent | None
+    memory: ConversationMemory | None
+
+    async def close(self) -> None:
+        if self.memory:
+            await self.memory.close()
+        await self.hardware.close()
+        await self.ai.close()
+        self.devices.cleanup_all()
 
+
+async def build_core(audit: AuditJournal | None = None) -> Core:
     # Hardware Init
-    claw = ClawController()
-    claw.init_gpio()
+    devices = DeviceRegistry.load(os.getenv("CLAW_CONFIG"))
+    devices.init_all()
+    hardware = HardwareExecutor(devices)
+
+    # Thermal / memory telemetry gates LLM admission
+    admission = AdmissionController(
+        TelemetrySampler(os.getenv("TELEMETRY_ROOT", "/")),
+        max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "2")),
+        fallback_model=os.getenv("OLLAMA_FALLBACK_MODEL") or None,
+        thresholds=AdmissionThresholds.from_env(),
+    )
 
     # AI Init
     ai = OllamaClient(
         host=os.getenv("OLLAMA_HOST", "http://ollama:11434"),
         model=os.getenv("OLLAMA_MODEL", "llama3:8b-instruct-q4_K_M"),
+        retry=RetryPolicy.from_env(),
+        admission=admission,
+        embed_model=os.getenv("OLLAMA_EMBED_MODEL") or None,
+        profiles=load_profiles(os.getenv("OLLAMA_PROFILES")),
     )
 
+    # Near-duplicate prompts are answered from a semantic cache (needs OLLAMA_EMBED_MODEL)
+    if ai.embed_model:
+        ai.cache = SemanticCache(
+            capacity=int(os.getenv("SEMANTIC_CACHE_SIZE", "512")),
+            threshold=float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92")),
+            ttl=float(os.getenv("SEMANTIC_CACHE_TTL", "3600")),
+        )
+        logger.info(f"Semantic cache enabled ({ai.embed_model})")
+
     # Check if AI is ready
     if await ai.check_connection():
         logger.info("Connected to local LLM (Ollama)")
     else:
         logger.warning("Could not connect to Ollama. AI features will be limited.")
 
+    # Check if the board is ready
+    sample = admission.sampler.sample()
+    readiness = admission.evaluate(sample)
+    logger.info(f"Device telemetry: {sample.summary()}")
+    if readiness.action is not Action.ADMIT:
+        logger.warning(
+            f"Device under pressure at startup ({readiness.reason}): LLM will {readiness.action.value}"
+        )
+
+    # Let tool-capable models drive the hardware directly from chat
+    chat_ai: OllamaClient | ToolAgent | ConversationMemory = ai
+    agent: ToolAgent | None = None
+    if os.getenv("OLLAMA_TOOLS", "false").lower() in ("1", "true", "yes"):
+        chat_ai = agent = ToolAgent(
+            ai,
+            hardware_tools(hardware, audit),
+            max_iterations=int(os.getenv("OLLAMA_TOOL_MAX_ITERATIONS", "4")),
+            budget=float(os.getenv("OLLAMA_TOOL_BUDGET", "60")),
+        )
+        logger.info("LLM tool-calling enabled")
+
+    # Per-thread history, compacted into a summary while the GPU is idle
+    memory: ConversationMemory | None = None
+    memory_tokens = int(os.getenv("MEMORY_MAX_TOKENS", "1500"))
+    if memory_tokens > 0:
+        memory = ConversationMemory(
+            chat_ai,
+            ai,
+            max_tokens=memory_tokens,
+            keep_turns=int(os.getenv("MEMORY_KEEP_TURNS", "6")),
+            summary_model=os.getenv("OLLAMA_SUMMARY_MODEL") or admission.fallback_model,
+            max_conversations=int(os.getenv("MEMORY_MAX_CONVERSATIONS", "256")),
+            profile="tools" if agent else "chat",
+        )
+        chat_ai = memory
+
+    return Core(devices, hardware, admission, ai, chat_ai, agent, memory)
+
+
+async def supervise() -> None:
+    """Multi-process mode: one core worker plus one worker per configured platform."""
+    socket_path = os.getenv("OPENCLAW_SOCKET", DEFAULT_SOCKET)
+    roles = []
+    if os.getenv("DISCORD_TOKEN"):
+        roles.append("discord")
+    if os.getenv("SLACK_BOT_TOKEN") and os.getenv("SLACK_APP_TOKEN"):
+        roles.append("slack")
+    if not roles:
+        logger.error("No bot tokens provided! Please set DISCORD_TOKEN or SLACK_BOT_TOKEN in .env")
+        return
+
+    argv = [sys.executable, "-u", os.path.abspath(__file__)]
+    specs = [
+        WorkerSpec(
+            role, argv, {**os.environ, "OPENCLAW_ROLE": role, "OPENCLAW_SOCKET": socket_path}
+        )
+        for role in ("core", *roles)
+    ]
+
+    async def core_ready() -> None:
+        probe = CoreClient(socket_path)
+        await probe.connect(timeout=None)
+        await probe.close()
+
+    supervisor = Supervisor(
+        specs,
+        ready=core_ready,
+        max_backoff=float(os.getenv("WORKER_MAX_BACKOFF", "30")),
+        stop_timeout=float(os.getenv("SHUTDOWN_DRAIN_TIMEOUT", "30")) + 5,
+    )
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, supervisor.stop)
+    loop.add_signal_handler(signal.SIGHUP, supervisor.signal, signal.SIGHUP)
+    logger.info(f"Supervising workers: {', '.join(s.role for s in specs)}")
+    await supervisor.run()
+    logger.info("OpenClaw stopped.")
+
+
+async def main() -> None:
+    role = os.getenv("OPENCLAW_ROLE")
+    if role is None and os.getenv("OPENCLAW_PROCESSES", "single").lower() == "multi":
+        await supervise()
+        return
+
+    logger.info(f"Initializing OpenClaw System{f' ({role} worker)' if role else ''}...")
+    socket_path = os.getenv("OPENCLAW_SOCKET", DEFAULT_SOCKET)
+
+    # Who moved the claw / asked what, batched to a rotating JSONL file off the hot path
+    audit = AuditJournal.from_env(role)
+    if audit.enabled:
+        logger.info(f"Audit journal: {audit.path}")
+
+    # Gateway workers reach hardware and LLM through the core process
+    core: Core | None = None
+    client: CoreClient | None = None
+    if role in GATEWAY_ROLES:
+        client = CoreClient(socket_path)
+        await client.connect(timeout=None)
+        hardware: HardwareExecutor | RemoteHardware = RemoteHardware(client)
+        chat_ai: OllamaClient | ToolAgent | ConversationMemory | RemoteChat = RemoteChat(client)
+    else:
+        core = await build_core(audit)
+        hardware, chat_ai = core.hardware, core.chat_ai
+
+    # Outbound platform API calls (shared rate-limit tracking)
+    outbound = OutboundSender()
+
+    # In-flight work tracking so SIGTERM drains instead of cutting replies off
+    lifecycle = Lifecycle()
+
     # Bots Init
-    discord_token = os.getenv("DISCORD_TOKEN")
-    slack_token = os.getenv("SLACK_BOT_TOKEN")
+    discord_token = os.getenv("DISCORD_TOKEN") if role in (None, "discord") else None
+    slack_token = os.getenv("SLACK_BOT_TOKEN") if role in (None, "slack") else None
     slack_app_token = os.getenv("SLACK_APP_TOKEN")
 
     discord_bot: OpenClawDiscord | None = None
@@ -56,39 +221,126 @@ async def main() -> None:
 
     if discord_token:
         logger.info("Starting Discord Bot...")
-        discord_bot = OpenClawDiscord(token=discord_token, ai_client=ai, hardware=claw)
+        discord_bot = OpenClawDiscord(
+            token=discord_token,
+            ai_client=chat_ai,
+            hardware=hardware,
+            outbound=outbound,
+            lifecycle=lifecycle,
+            audit=audit,
+            deadline=ReplyDeadline.from_env(),
+        )
         tasks.append(asyncio.create_task(discord_bot.start()))
 
     if slack_token and slack_app_token:
         logger.info("Starting Slack Bot (Socket Mode)...")
         slack_bot = OpenClawSlack(
-            bot_token=slack_token, app_token=slack_app_token, ai_client=ai, hardware=claw
+            bot_token=slack_token,
+            app_token=slack_app_token,
+            ai_client=chat_ai,
+            hardware=hardware,
+            outbound=outbound,
+            lifecycle=lifecycle,
+            audit=audit,
+            deadline=ReplyDeadline.from_env(),
         )
         tasks.append(asyncio.create_task(slack_bot.start()))
 
+    # Gateway workers connect here for hardware commands and chat
+    core_server: CoreServer | None = None
+    if core is not None and role == "core":
+        core_server = CoreServer(core.hardware, core.chat_ai, socket_path, lifecycle=lifecycle)
+        tasks.append(asyncio.create_task(core_server.start()))
+
+    # Local HTTP control API on the same loop, hardware queue and LLM gate (opt-in: it can
+    # move the claw, so it only starts when API_PORT is set)
+    api: ControlAPI | None = None
+    api_port = int(os.getenv("API_PORT") or 0)
+    if core is not None and api_port > 0:
+        if not tasks:
+            logger.warning("No bot tokens provided, running the HTTP API only")
+        api = ControlAPI(
+            core.hardware,
+            core.ai,
+            host=os.getenv("API_HOST", "127.0.0.1"),
+            port=api_port,
+            token=os.getenv("API_TOKEN") or None,
+            lifecycle=lifecycle,
+            audit=audit,
+        )
+        tasks.append(asyncio.create_task(api.start()))
+
     if not tasks:
         logger.error("No bot tokens provided! Please set DISCORD_TOKEN or SLACK_BOT_TOKEN in .env")
+        if core is not None:
+            await core.close()
         return
 
+    # SIGHUP reloads .env in place; SIGTERM/SIGINT drain, then stop
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+
+    def request_stop(sig: signal.Signals) -> None:
+        logger.info(f"Received exit signal {sig.name}...")
+        stop.set()
+
+    async def reload() -> None:
+        logger.info("Received SIGHUP, reloading settings...")
+        load_dotenv(override=True)
+        if core is None:
+            return  # gateways read their per-platform settings per message
+        changed = await reload_settings(core.ai, core.admission, core.memory, core.agent)
+        logger.info(f"Reloaded: {', '.join(changed) or 'no changes'}")
+
+    # The loop only keeps weak references to tasks; hold reloads until they finish
+    reloads: set[asyncio.Task[None]] = set()
+
+    def reload_done(task: asyncio.Task[None]) -> None:
+        reloads.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.opt(exception=task.exception()).error("Settings reload failed")
+
+    def request_reload() -> None:
+        task = asyncio.create_task(reload())
+        reloads.add(task)
+        task.add_done_callback(reload_done)
+
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, request_stop, sig)
+    loop.add_signal_handler(signal.SIGHUP, request_reload)
+
     # Keep alive until signal
+    stopping = asyncio.create_task(stop.wait())
     try:
-        await asyncio.gather(*tasks)
+        done, _ = await asyncio.wait([stopping, *tasks], return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task is not stopping and not task.cancelled() and task.exception():
+                logger.opt(exception=task.exception()).error("Service crashed")
+        logger.info("Shutting down services...")
+        await lifecycle.drain(float(os.getenv("SHUTDOWN_DRAIN_TIMEOUT", "30")))
     except asyncio.CancelledError:
         logger.info("Shutting down services...")
     finally:
-        claw.cleanup()
+        stopping.cancel()
+        if discord_bot:
+            await discord_bot.close()
+        if slack_bot:
+            await slack_bot.socket_client.close()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if core_server:
+            await core_server.close()
+        if api:
+            await api.close()
+        await outbound.close()
+        await audit.close()
+        if client:
+            await client.close()
+        if core:
+            await core.close()
         logger.info("OpenClaw stopped.")
 
 
 if __name__ == "__main__":
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-
-    signals = (signal.SIGHUP, signal.SIGTERM, signal.SIGINT)
-    for s in signals:
-        loop.add_signal_handler(s, lambda s=s: asyncio.create_task(shutdown(loop, signal=s)))
-
-    try:
-        loop.run_until_complete(main())
-    finally:
-        loop.close()
+    asyncio.run(main())
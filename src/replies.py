@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+# src/replies.py
+# Canned replies that chat backends and the hardware queue answer with instead of
+# raising. Kept free of imports so the audit CLI and memory can classify them
+# without loading the stack.
+
+OFFLINE_REPLY = "My LLM is offline right now (it may be reloading). Please try again shortly."
+OVERLOADED_REPLY = "I'm running too hot to think right now"
+OLLAMA_ERROR_REPLY = "Sorry, my brain is offline."
+NEURAL_ERROR_REPLY = "I encountered a neural error."
+TIMEOUT_REPLY = "I ran out of time while working on that."
+STEP_LIMIT_REPLY = "I stopped after too many hardware steps."
+CORE_OFFLINE_REPLY = "My core process is restarting. Please try again shortly."
+
+# Claw results that mean an actuator did not move
+MOVE_INTERRUPTED_REPLY = "Claw move interrupted"
+MOVE_PREEMPTED_REPLY = "Cancelled by emergency stop"
+UNKNOWN_DEVICE_PREFIX = "Unknown actuator "
+
+
+def reply_outcome(reply: str) -> str:
+    """Audit outcome of a chat reply: ``ok`` unless it is one of the canned failures."""
+    if reply in (OFFLINE_REPLY, CORE_OFFLINE_REPLY):
+        return "offline"
+    if reply.startswith(OVERLOADED_REPLY):
+        return "overloaded"
+    if reply in (OLLAMA_ERROR_REPLY, NEURAL_ERROR_REPLY):
+        return "error"
+    if reply == TIMEOUT_REPLY:
+        return "timeout"
+    if reply == STEP_LIMIT_REPLY:
+        return "step_limit"
+    return "ok"
+
+
+def claw_outcome(result: str) -> str:
+    """Audit outcome of a claw command result, in the same vocabulary as ``reply_outcome``."""
+    if result == CORE_OFFLINE_REPLY:
+        return "offline"
+    if result.startswith(UNKNOWN_DEVICE_PREFIX):
+        return "unknown_device"
+    # Commands for every actuator answer one "name: result" line each
+    if MOVE_INTERRUPTED_REPLY in result:
+        return "interrupted"
+    if MOVE_PREEMPTED_REPLY in result:
+        return "preempted"
+    return "ok"
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from hardware.telemetry import TelemetrySample
+from llm.admission import Action, AdmissionController, OverloadedError
+
+
+class _StubSampler:
+    def __init__(self, sample: TelemetrySample) -> None:
+        self.current = sample
+
+    def sample(self) -> TelemetrySample:
+        return self.current
+
+
+def _board(temp: float = 50.0, mem_pct: float = 50.0, swap_pct: float = 0.0) -> TelemetrySample:
+    return TelemetrySample(
+        temperatures={"gpu-thermal": temp},
+        mem_total_mb=8000,
+        mem_available_mb=8000 * (1 - mem_pct / 100),
+        swap_total_mb=4000,
+        swap_free_mb=4000 * (1 - swap_pct / 100),
+    )
+
+
+@pytest.mark.parametrize(
+    ("sample", "action"),
+    [
+        (_board(), Action.ADMIT),
+        (_board(temp=80), Action.DEGRADE),
+        (_board(mem_pct=90), Action.DEGRADE),
+        (_board(temp=92), Action.SHED),
+        (_board(mem_pct=97), Action.SHED),
+        (_board(swap_pct=70), Action.SHED),
+    ],
+)
+def test_evaluate(sample, action):
+    controller = AdmissionController(_StubSampler(sample), fallback_model="tiny")
+    decision = controller.evaluate()
+    assert decision.action is action
+    if action is Action.DEGRADE:
+        assert decision.model == "tiny"
+
+
+@pytest.mark.asyncio
+async def test_shed_raises_overloaded():
+    controller = AdmissionController(_StubSampler(_board(temp=95)))
+    with pytest.raises(OverloadedError, match="95C"):
+        async with controller.slot():
+            pass
+
+
+@pytest.mark.asyncio
+async def test_degraded_board_lowers_concurrency():
+    sampler = _StubSampler(_board(temp=80))
+    controller = AdmissionController(sampler, max_concurrency=3, degraded_concurrency=1)
+    peak = 0
+
+    async def generate() -> None:
+        nonlocal peak
+        async with controller.slot():
+            peak = max(peak, controller.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(generate() for _ in range(3)))
+    assert peak == 1
+
+    sampler.current = _board()
+    await asyncio.gather(*(generate() for _ in range(3)))
+    assert peak == 3
+    assert controller.in_flight == 0
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from api.server import ControlAPI
+from audit import AuditJournal
+from hardware.backends import SimulatedServoBackend
+from hardware.claw_controller import ClawController
+from hardware.executor import HardwareExecutor
+from hardware.registry import DeviceRegistry
+from llm.ollama_client import NEURAL_ERROR_REPLY
+
+
+@pytest.fixture
+def hardware():
+    registry = DeviceRegistry(
+        {n: ClawController(backend=SimulatedServoBackend(), name=n) for n in ("left", "wrist")}
+    )
+    return HardwareExecutor(registry)
+
+
+@pytest.fixture
+def ai():
+    async def chat_stream(prompt: str, max_tokens=None, profile="chat"):
+        for token in ("Hello", ", ", prompt):
+            yield token
+
+    client = MagicMock()
+    client.resilience.available = True
+    client.cache = None
+    client.chat_stream = chat_stream
+    return client
+
+
+async def _client(api: ControlAPI) -> TestClient:
+    client = TestClient(TestServer(api.app))
+    await client.start_server()
+    return client
+
+
+@pytest.mark.asyncio
+async def test_claw_command_goes_through_executor(hardware, ai):
+    client = await _client(ControlAPI(hardware, ai))
+    try:
+        resp = await client.post("/api/claw/open", json={"target": "wrist"})
+        body = await resp.json()
+    finally:
+        await client.close()
+
+    assert resp.status == 200
+    assert body["result"] == "Claw is now OPEN"
+    assert body["devices"] == {"left": "UNKNOWN", "wrist": "OPEN"}
+
+
+@pytest.mark.asyncio
+async def test_unknown_action_and_target_are_404(hardware, ai):
+    client = await _client(ControlAPI(hardware, ai))
+    try:
+        assert (await client.post("/api/claw/fly")).status == 404
+        resp = await client.post("/api/claw/close?target=elbow")
+        assert resp.status == 404
+        assert "Unknown actuator 'elbow'" in await resp.text()
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_only_stop_is_accepted_while_draining(hardware, ai):
+    api = ControlAPI(hardware, ai)
+    api.lifecycle.stop_accepting()
+    client = await _client(api)
+    try:
+        refused = await client.post("/api/claw/open")
+        stopped = await client.post("/api/claw/stop")
+    finally:
+        await client.close()
+
+    assert refused.status == 503
+    assert stopped.status == 200
+
+
+@pytest.mark.asyncio
+async def test_status_long_poll_returns_on_change(hardware, ai):
+    client = await _client(ControlAPI(hardware, ai))
+    try:
+        poll = asyncio.create_task(client.get("/api/claw?wait=5"))
+        await asyncio.sleep(0.05)
+        await hardware.close_claw("left")
+        body = await (await poll).json()
+    finally:
+        await client.close()
+
+    assert body["devices"]["left"] == "CLOSED"
+    assert body["change"]["device"] == "left"
+    assert body["change"]["action"] == "close"
+
+
+@pytest.mark.asyncio
+async def test_events_stream_state_changes(hardware, ai):
+    client = await _client(ControlAPI(hardware, ai))
+    try:
+        resp = await client.get("/api/claw/events")
+        assert resp.headers["Content-Type"] == "text/event-stream"
+        first = await resp.content.readuntil(b"\n\n")
+        await hardware.open_claw("left")
+        second = await resp.content.readuntil(b"\n\n")
+        resp.close()
+    finally:
+        await client.close()
+
+    assert first.startswith(b"event: status\n")
+    event, data = second.decode().strip().split("\n")
+    assert event == "event: change"
+    change = json.loads(data.removeprefix("data: "))
+    assert (change["device"], change["previous"], change["state"]) == ("left", "UNKNOWN", "OPEN")
+
+
+@pytest.mark.asyncio
+async def test_chat_streams_tokens(hardware, ai):
+    client = await _client(ControlAPI(hardware, ai))
+    try:
+        resp = await client.post("/api/chat", json={"prompt": "world"})
+        text = await resp.text()
+        missing = await client.post("/api/chat", json={})
+    finally:
+        await client.close()
+
+    assert text == "Hello, world"
+    assert missing.status == 400
+
+
+@pytest.mark.asyncio
+async def test_failed_chat_stream_is_audited_as_error(hardware, ai, tmp_path):
+    async def failing_stream(prompt: str, max_tokens=None, profile="chat"):
+        yield NEURAL_ERROR_REPLY
+
+    ai.chat_stream = failing_stream
+    journal = AuditJournal(tmp_path / "audit.jsonl")
+    client = await _client(ControlAPI(hardware, ai, audit=journal))
+    try:
+        await (await client.post("/api/chat", json={"prompt": "hi"})).text()
+    finally:
+        await client.close()
+    await journal.close()
+
+    record = json.loads((tmp_path / "audit.jsonl").read_text())
+    assert (record["kind"], record["outcome"]) == ("llm", "error")
+
+
+@pytest.mark.asyncio
+async def test_bearer_token_required_when_configured(hardware, ai):
+    client = await _client(ControlAPI(hardware, ai, token="s3cret"))
+    try:
+        assert (await client.get("/api/health")).status == 401
+        resp = await client.get("/api/health", headers={"Authorization": "Bearer s3cret"})
+        assert await resp.json() == {"ollama": True, "devices": 2}
+    finally:
+        await client.close()
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from audit import AuditJournal, AuditRecord, journal_files, main
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_records_are_buffered_then_flushed_in_batches(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    journal = AuditJournal(path, flush_interval=60, batch_size=3)
+
+    journal.record(AuditRecord("claw", "slack", "U1", "C1", "open"))
+    journal.record(AuditRecord("claw", "slack", "U1", "C1", "close"))
+    await asyncio.sleep(0.01)
+    assert not path.exists()  # below batch size: nothing written yet
+
+    journal.record(AuditRecord("llm", "discord", "42", "7", "chat", prompt="hi"))
+    for _ in range(100):
+        if path.exists():
+            break
+        await asyncio.sleep(0.01)
+    await journal.close()
+
+    records = _lines(path)
+    assert [r["intent"] for r in records] == ["open", "close", "chat"]
+    assert "target" not in records[0]  # unset fields are left out
+    assert records[2]["prompt"] == "hi"
+
+
+@pytest.mark.asyncio
+async def test_track_records_latency_and_exceptions(tmp_path):
+    journal = AuditJournal(tmp_path / "audit.jsonl")
+
+    with journal.track("claw", "api", "127.0.0.1", "http", "open", target="claw") as entry:
+        await asyncio.sleep(0.01)
+    with pytest.raises(RuntimeError), journal.track("claw", "api", "127.0.0.1", "http", "stop"):
+        raise RuntimeError("servo jammed")
+    await journal.close()
+
+    ok, failed = _lines(tmp_path / "audit.jsonl")
+    assert entry.latency_ms >= 10
+    assert ok["outcome"] == "ok" and ok["target"] == "claw"
+    assert failed["outcome"] == "RuntimeError"
+
+
+@pytest.mark.asyncio
+async def test_long_prompts_are_clipped(tmp_path):
+    journal = AuditJournal(tmp_path / "audit.jsonl", prompt_chars=10)
+    journal.record(AuditRecord("llm", "slack", "U1", "C1", "chat", prompt="x" * 50))
+    await journal.close()
+
+    assert _lines(tmp_path / "audit.jsonl")[0]["prompt"] == "x" * 10 + "…"
+
+
+@pytest.mark.asyncio
+async def test_buffer_drops_oldest_when_full():
+    journal = AuditJournal("unused.jsonl", flush_interval=60, max_buffer=2)
+    for intent in ("a", "b", "c"):
+        journal.record(AuditRecord("claw", "slack", "U1", "C1", intent))
+
+    assert [r.intent for r in journal._buffer] == ["b", "c"]
+    assert journal.dropped == 1
+    journal._buffer.clear()
+    await journal.close()
+
+
+@pytest.mark.asyncio
+async def test_file_rotates_at_max_bytes(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    journal = AuditJournal(path, max_bytes=200, backups=2)
+    for i in range(6):
+        journal.record(AuditRecord("claw", "slack", "U1", "C1", f"open-{i}"))
+        await journal.flush()
+    await journal.close()
+
+    assert sorted(f.name for f in tmp_path.iterdir()) == [
+        "audit.jsonl",
+        "audit.jsonl.1",
+        "audit.jsonl.2",
+    ]
+    assert _lines(path)[-1]["intent"] == "open-5"
+
+
+@pytest.mark.asyncio
+async def test_disabled_journal_discards():
+    journal = AuditJournal()
+    journal.record(AuditRecord("claw", "slack", "U1", "C1", "open"))
+
+    assert not journal.enabled
+    assert journal._buffer == []
+    await journal.close()
+
+
+def test_from_env_gives_workers_their_own_file(monkeypatch):
+    monkeypatch.setenv("AUDIT_LOG", "logs/audit.jsonl")
+    assert str(AuditJournal.from_env("discord").path) == "logs/audit.discord.jsonl"
+
+    monkeypatch.setenv("AUDIT_LOG", "")
+    assert not AuditJournal.from_env().enabled
+
+
+def test_query_cli_filters_and_merges_files(tmp_path, capsys):
+    rows = [
+        AuditRecord("claw", "slack", "U1", "C1", "open", ts=100.0),
+        AuditRecord("llm", "slack", "U2", "C1", "chat", prompt="hi", outcome="offline", ts=200.0),
+    ]
+    (tmp_path / "audit.jsonl.1").write_text(rows[0].to_json() + "\n")
+    (tmp_path / "audit.discord.jsonl").write_text(
+        AuditRecord("claw", "discord", "42", "7", "stop", ts=150.0).to_json() + "\n"
+    )
+    (tmp_path / "audit.jsonl").write_text(rows[1].to_json() + "\n{torn")
+
+    path = str(tmp_path / "audit.jsonl")
+    assert len(journal_files(path)) == 3
+
+    assert main([path, "--json", "--limit", "0"]) == 0
+    intents = [json.loads(line)["intent"] for line in capsys.readouterr().out.splitlines()]
+    assert intents == ["open", "stop", "chat"]
+
+    assert main([path, "--kind", "claw", "--platform", "slack"]) == 0
+    out = capsys.readouterr().out.splitlines()
+    assert len(out) == 1 and "U1@C1  open" in out[0]
+
+    assert main([path, "--outcome", "error", "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)["user"] == "U2"
+
+
+def test_query_cli_reports_missing_journal(tmp_path, capsys):
+    assert main([str(tmp_path / "nope.jsonl")]) == 1
+    assert "No audit journal" in capsys.readouterr().err
+
+
+def test_journal_without_suffix_is_found_or_reported_missing(tmp_path, capsys):
+    path = tmp_path / "audit"
+    assert main([str(path)]) == 1
+    assert "No audit journal" in capsys.readouterr().err
+
+    for name in ("audit", "audit.1", "audit.discord", "other"):
+        (tmp_path / name).write_text(AuditRecord("claw", "slack", "U1", "C1", "open").to_json())
+
+    assert [f.name for f in journal_files(path)] == ["audit.1", "audit", "audit.discord"]
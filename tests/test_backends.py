@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from hardware import backends
+from hardware.backends import PeripheryPWMBackend, SimulatedServoBackend, create_backend
+from hardware.claw_controller import ClawController
+
+
+def test_simulator_maps_duty_to_angle_without_jitter():
+    sim = SimulatedServoBackend(jitter_us=0.0, seed=1)
+    sim.setup(33, 50)
+
+    assert sim.angle_for(2.5) == pytest.approx(0.0)
+    assert sim.angle_for(7.5) == pytest.approx(90.0)
+    assert sim.angle_for(12.5) == pytest.approx(180.0)
+
+
+def test_simulator_models_travel_time():
+    sim = SimulatedServoBackend(speed_deg_per_s=300.0, jitter_us=0.0, seed=1)
+    sim.setup(33, 50)
+
+    hold = sim.move(2.5)  # 90 -> 0 degrees
+
+    move = sim.history[-1]
+    assert move.target_angle == pytest.approx(0.0)
+    # 90 degrees at 300 deg/s, plus up to one 20ms PWM period before the duty latches
+    assert 0.3 <= move.seconds <= 0.32
+    assert sim.virtual_time == pytest.approx(move.seconds)
+    assert hold == 0.0  # time_scale=0 means no real waiting
+
+
+def test_simulator_time_scale_sets_real_hold():
+    sim = SimulatedServoBackend(jitter_us=0.0, time_scale=0.5, seed=1)
+    hold = sim.move(12.5)
+    assert hold == pytest.approx(sim.history[-1].seconds * 0.5)
+
+
+def test_simulator_jitter_is_seeded():
+    a = SimulatedServoBackend(jitter_us=50.0, seed=7)
+    b = SimulatedServoBackend(jitter_us=50.0, seed=7)
+    assert [a.angle_for(7.5) for _ in range(5)] == [b.angle_for(7.5) for _ in range(5)]
+
+
+def test_periphery_backend_writes_fractional_duty(monkeypatch):
+    pwm = MagicMock()
+    module = MagicMock()
+    module.PWM.return_value = pwm
+    monkeypatch.setitem(sys.modules, "periphery", module)
+
+    backend = PeripheryPWMBackend(chip=1, channel=2)
+    backend.setup(33, 50)
+    backend.set_duty_cycle(7.5)
+
+    module.PWM.assert_called_once_with(1, 2)
+    assert pwm.frequency == 50
+    assert pwm.duty_cycle == pytest.approx(0.075)
+    pwm.enable.assert_called_once()
+
+    backend.cleanup()
+    pwm.disable.assert_called_once()
+    pwm.close.assert_called_once()
+
+
+def test_create_backend_selection(monkeypatch):
+    monkeypatch.delenv("CLAW_BACKEND", raising=False)
+    monkeypatch.setattr(backends, "GPIO", None)
+    assert isinstance(create_backend(), SimulatedServoBackend)
+    assert isinstance(create_backend("periphery"), PeripheryPWMBackend)
+    with pytest.raises(ValueError):
+        create_backend("arduino")
+
+
+def test_claw_controller_drives_backend():
+    sim = SimulatedServoBackend(jitter_us=0.0, seed=1)
+    claw = ClawController(backend=sim)
+    claw.init_gpio()
+
+    claw.open_claw()
+    claw.close_claw()
+
+    assert [m.duty for m in sim.history] == [ClawController.OPEN_DUTY, ClawController.CLOSE_DUTY]
+    assert sim.duty == 0  # released after each move
+    assert claw.get_status() == "CLOSED"
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from benchmarks.run import Result, compare
+
+BASELINE = {"results": {"bot.parse_inbound": {"median_us": 10.0, "p95_us": 12.0}}}
+
+
+def test_compare_flags_slowdown_beyond_threshold():
+    results = {"bot.parse_inbound": Result(median_us=13.0, p95_us=15.0, iterations=10)}
+
+    regressions = compare(results, BASELINE, threshold=25)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("bot.parse_inbound")
+
+
+def test_compare_allows_noise_within_threshold():
+    results = {"bot.parse_inbound": Result(median_us=12.0, p95_us=20.0, iterations=10)}
+
+    assert compare(results, BASELINE, threshold=25) == []
+
+
+def test_compare_ignores_benchmarks_without_baseline():
+    results = {"e2e.mention_to_reply": Result(median_us=900.0, p95_us=990.0, iterations=10)}
+
+    assert compare(results, BASELINE, threshold=25) == []
+
+
+def test_compare_flags_allocation_growth():
+    baseline = {"results": {"e2e.mention_to_reply": {"median_us": 700.0, "alloc_bytes": 40_000}}}
+    results = {
+        "e2e.mention_to_reply": Result(
+            median_us=700.0, p95_us=800.0, iterations=10, alloc_bytes=60_000
+        )
+    }
+
+    regressions = compare(results, baseline, threshold=25)
+
+    assert len(regressions) == 1
+    assert "bytes allocated" in regressions[0]
@@ -1,19 +1,28 @@
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import discord
 import pytest
 
+from audit import AuditJournal
 from bot.discord_bot import ClawCommands, OpenClawDiscord
+from bot.outbound import OutboundSender
+from bot.placeholder import ReplyDeadline
+from hardware.registry import UnknownDeviceError
+from lifecycle import Lifecycle
+from llm.generation import TRUNCATION_MARKER
 
 
 @pytest.fixture
 def hardware():
     hw = MagicMock()
     hw.get_status.return_value = "OPEN"
-    hw.open_claw.return_value = "Claw is now OPEN"
-    hw.close_claw.return_value = "Claw is now CLOSED"
+    hw.open_claw = AsyncMock(return_value="Claw is now OPEN")
+    hw.close_claw = AsyncMock(return_value="Claw is now CLOSED")
+    hw.emergency_stop = AsyncMock(return_value="Claw STOPPED")
+    hw.names = ["claw"]
     return hw
 
 
@@ -40,8 +49,13 @@ def _make_bot(hardware: object, ai_client: object) -> OpenClawDiscord:
     with patch("discord.ext.commands.Bot.__init__", return_value=None):
         bot = OpenClawDiscord.__new__(OpenClawDiscord)
         bot.token = "tok"
+        bot.command_prefix = "!claw "
         bot.ai = ai_client
         bot.hardware = hardware
+        bot.outbound = OutboundSender()
+        bot.lifecycle = Lifecycle()
+        bot.audit = AuditJournal()
+        bot.deadline = ReplyDeadline()
         # Inject _user via the internal attribute discord.py reads through the property
         bot._connection = MagicMock()
         bot._connection.user = MagicMock(spec=discord.ClientUser)
@@ -73,7 +87,7 @@ async def test_claw_status_sends_hardware_status(cog, hardware):
 async def test_claw_open_triggers_hardware_open(cog, hardware):
     ctx = _make_ctx()
     await cog.claw_open.callback(cog, ctx)
-    hardware.open_claw.assert_called_once()
+    hardware.open_claw.assert_awaited_once()
     ctx.send.assert_awaited_once_with("Claw is now OPEN")
 
 
@@ -81,10 +95,42 @@ async def test_claw_open_triggers_hardware_open(cog, hardware):
 async def test_claw_close_triggers_hardware_close(cog, hardware):
     ctx = _make_ctx()
     await cog.claw_close.callback(cog, ctx)
-    hardware.close_claw.assert_called_once()
+    hardware.close_claw.assert_awaited_once()
     ctx.send.assert_awaited_once_with("Claw is now CLOSED")
 
 
+@pytest.mark.asyncio
+async def test_claw_open_named_actuator(cog, hardware):
+    ctx = _make_ctx()
+    await cog.claw_open.callback(cog, ctx, "left")
+    hardware.open_claw.assert_awaited_once_with("left")
+
+
+@pytest.mark.asyncio
+async def test_claw_open_unknown_actuator_replies_with_error(cog, hardware):
+    hardware.open_claw.side_effect = UnknownDeviceError("elbow", ["claw"])
+    ctx = _make_ctx()
+    await cog.claw_open.callback(cog, ctx, "elbow")
+    ctx.send.assert_awaited_once_with("Unknown actuator 'elbow'. Available: claw")
+
+
+@pytest.mark.asyncio
+async def test_claw_status_lists_all_actuators(cog, hardware):
+    hardware.names = ["left", "wrist"]
+    hardware.statuses.return_value = {"left": "OPEN", "wrist": "CLOSED"}
+    ctx = _make_ctx()
+    await cog.claw_status.callback(cog, ctx)
+    ctx.send.assert_awaited_once_with("Status: left=OPEN, wrist=CLOSED")
+
+
+@pytest.mark.asyncio
+async def test_claw_stop_triggers_emergency_stop(cog, hardware):
+    ctx = _make_ctx()
+    await cog.claw_stop.callback(cog, ctx)
+    hardware.emergency_stop.assert_awaited_once()
+    ctx.send.assert_awaited_once_with("Claw STOPPED")
+
+
 # ---------------------------------------------------------------------------
 # OpenClawDiscord bot tests
 # ---------------------------------------------------------------------------
@@ -127,8 +173,35 @@ async def test_on_message_dm_calls_ai_and_replies(hardware, ai_client):
 
     await bot.on_message(message)
 
-    ai_client.chat.assert_awaited_once_with("Hello bot")
-    channel.send.assert_any_await("I am alive.")
+    ai_client.chat.assert_awaited_once()
+    assert ai_client.chat.call_args.args == ("Hello bot",)
+    assert ai_client.chat.call_args.kwargs["context"] == f"discord:{channel.id}:"
+    channel.send.assert_awaited_once_with("I am alive.")
+    channel.typing.assert_not_called()  # fast reply: no typing indicator
+
+
+@pytest.mark.asyncio
+async def test_slow_reply_shows_typing_indicator(hardware, ai_client):
+    async def slow_chat(*args, **kwargs):
+        await asyncio.sleep(0.05)
+        return "Finally."
+
+    ai_client.chat.side_effect = slow_chat
+    bot = _make_bot(hardware, ai_client)
+    bot.deadline = ReplyDeadline(ceiling=0.01, floor=0.01)
+
+    channel = MagicMock(spec=discord.DMChannel)
+    channel.send = AsyncMock()
+    message = MagicMock(spec=discord.Message)
+    message.author = MagicMock()
+    message.channel = channel
+    message.content = "think hard"
+    message.mentions = []
+
+    await bot.on_message(message)
+
+    channel.typing.assert_called_once()
+    channel.send.assert_awaited_once_with("Finally.")
 
 
 @pytest.mark.asyncio
@@ -149,6 +222,27 @@ async def test_on_message_mention_calls_ai(hardware, ai_client):
     await bot.on_message(message)
 
     ai_client.chat.assert_awaited_once()
+    assert ai_client.chat.call_args.kwargs["max_tokens"] == 400
+
+
+@pytest.mark.asyncio
+async def test_long_reply_is_clipped_to_discord_limit(hardware, ai_client):
+    ai_client.chat.return_value = "x" * 5000
+    bot = _make_bot(hardware, ai_client)
+
+    channel = MagicMock(spec=discord.DMChannel)
+    channel.send = AsyncMock()
+    message = MagicMock(spec=discord.Message)
+    message.author = MagicMock()
+    message.channel = channel
+    message.content = "write me an essay"
+    message.mentions = []
+
+    await bot.on_message(message)
+
+    sent = channel.send.call_args.args[0]
+    assert len(sent) <= 2000
+    assert sent.endswith(TRUNCATION_MARKER)
 
 
 @pytest.mark.asyncio
@@ -169,3 +263,80 @@ async def test_on_message_empty_mention_falls_through(hardware, ai_client):
         await bot.on_message(message)
 
     ai_client.chat.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_on_message_mention_claw_command_skips_llm(hardware, ai_client):
+    bot = _make_bot(hardware, ai_client)
+    bot_user = bot._connection.user
+
+    channel = MagicMock()
+    channel.send = AsyncMock()
+
+    message = MagicMock(spec=discord.Message)
+    message.author = MagicMock()
+    message.channel = channel
+    message.content = "<@99> close claw"
+    message.mentions = [bot_user]
+
+    await bot.on_message(message)
+
+    hardware.close_claw.assert_awaited_once_with(None)
+    channel.send.assert_awaited_once_with("Claw is now CLOSED")
+    ai_client.chat.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_stop_mention_is_served_while_draining(hardware, ai_client):
+    bot = _make_bot(hardware, ai_client)
+    bot_user = bot._connection.user
+    bot.lifecycle.stop_accepting()
+
+    channel = MagicMock()
+    channel.send = AsyncMock()
+
+    def mention(text: str) -> MagicMock:
+        message = MagicMock(spec=discord.Message)
+        message.author = MagicMock()
+        message.channel = channel
+        message.content = text
+        message.mentions = [bot_user]
+        return message
+
+    await bot.on_message(mention("<@99> open claw"))
+    await bot.on_message(mention("<@99> stop claw"))
+
+    hardware.open_claw.assert_not_awaited()
+    hardware.emergency_stop.assert_awaited_once()
+    channel.send.assert_awaited_once_with("Claw STOPPED")
+
+
+def test_prefix_stop_command_is_recognised_while_draining(hardware, ai_client):
+    bot = _make_bot(hardware, ai_client)
+    message = MagicMock(spec=discord.Message)
+
+    message.content = "!claw stop"
+    assert bot._is_stop(message)
+    message.content = "!claw open"
+    assert not bot._is_stop(message)
+
+
+@pytest.mark.asyncio
+async def test_question_about_a_command_goes_to_llm(hardware, ai_client):
+    bot = _make_bot(hardware, ai_client)
+    bot_user = bot._connection.user
+
+    channel = MagicMock()
+    channel.send = AsyncMock()
+
+    message = MagicMock(spec=discord.Message)
+    message.author = MagicMock()
+    message.channel = channel
+    message.content = "<@99> how to open claw?"
+    message.mentions = [bot_user]
+
+    await bot.on_message(message)
+
+    hardware.open_claw.assert_not_awaited()
+    ai_client.chat.assert_awaited_once()
+    assert ai_client.chat.call_args.args == ("how to open claw?",)
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from hardware.backends import ServoBackend, SimulatedServoBackend
+from hardware.claw_controller import ClawController
+from hardware.executor import ALL_DEVICES, HardwareExecutor
+from hardware.registry import DeviceRegistry, UnknownDeviceError
+
+
+@pytest.fixture
+def claw():
+    claw = ClawController()
+    claw.init_gpio()
+    return claw
+
+
+def _slow_claw() -> ClawController:
+    """A controller whose moves hold until interrupted."""
+    backend = MagicMock(spec=ServoBackend)
+    backend.move.return_value = 5.0
+    claw = ClawController(backend=backend)
+    return claw
+
+
+@pytest.mark.asyncio
+async def test_commands_update_cached_status(claw):
+    executor = HardwareExecutor(claw)
+    assert executor.get_status() == "UNKNOWN"
+
+    assert await executor.open_claw() == "Claw is now OPEN"
+    assert executor.get_status() == "OPEN"
+
+    assert await executor.close_claw() == "Claw is now CLOSED"
+    assert executor.get_status() == "CLOSED"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_commands_are_serialized(claw):
+    executor = HardwareExecutor(claw)
+    active = 0
+    overlap = False
+    original_open = claw.open_claw
+
+    def tracked_open() -> str:
+        nonlocal active, overlap
+        active += 1
+        overlap = overlap or active > 1
+        try:
+            return original_open()
+        finally:
+            active -= 1
+
+    claw.open_claw = tracked_open
+    results = await asyncio.gather(
+        executor.open_claw(), executor.close_claw(), executor.open_claw()
+    )
+
+    assert not overlap
+    assert results == ["Claw is now OPEN", "Claw is now CLOSED", "Claw is now OPEN"]
+    assert executor.get_status() == claw.get_status() == "OPEN"
+
+
+@pytest.mark.asyncio
+async def test_subscribers_receive_state_changes(claw):
+    executor = HardwareExecutor(claw)
+    events = executor.subscribe()
+
+    await executor.open_claw()
+    await executor.open_claw()  # no change, no event
+    await executor.close_claw()
+
+    first = events.get_nowait()
+    second = events.get_nowait()
+    assert (first.previous, first.state, first.action) == ("UNKNOWN", "OPEN", "open")
+    assert (second.previous, second.state, second.action) == ("OPEN", "CLOSED", "close")
+    assert events.empty()
+
+    executor.unsubscribe(events)
+    await executor.open_claw()
+    assert events.empty()
+
+
+@pytest.mark.asyncio
+async def test_emergency_stop_preempts_pending_moves():
+    claw = _slow_claw()
+    executor = HardwareExecutor(claw)
+
+    running = asyncio.create_task(executor.open_claw())
+    await asyncio.sleep(0.05)
+    pending = asyncio.create_task(executor.close_claw())
+    await asyncio.sleep(0)
+
+    assert await executor.emergency_stop() == "Claw STOPPED"
+    assert await running == "Claw move interrupted"
+    assert await pending == "Cancelled by emergency stop"
+    assert executor.get_status() == "STOPPED"
+    claw.backend.release.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_stop_racing_the_start_of_a_move_is_not_lost():
+    """A stop issued after a move is dequeued but before its thread runs still aborts it."""
+    claw = _slow_claw()
+    executor = HardwareExecutor(claw)
+    gate = threading.Event()
+    original = claw.open_claw
+
+    def gated_open() -> str:
+        gate.wait(5)  # hold the worker thread before the move starts
+        return original()
+
+    claw.open_claw = gated_open
+    running = asyncio.create_task(executor.open_claw())
+    await asyncio.sleep(0.05)  # dequeued, worker thread parked at the gate
+
+    stopping = asyncio.create_task(executor.emergency_stop())
+    await asyncio.sleep(0)  # interrupt() has run
+    gate.set()
+
+    assert await asyncio.wait_for(running, 1) == "Claw move interrupted"
+    assert await stopping == "Claw STOPPED"
+
+
+def test_interrupt_before_move_aborts_it():
+    claw = _slow_claw()
+    claw.interrupt()
+
+    assert claw.open_claw() == "Claw move interrupted"
+    claw.arm()
+    claw.backend.move.return_value = 0.0
+    assert claw.open_claw() == "Claw is now OPEN"
+
+
+@pytest.mark.asyncio
+async def test_separate_actuators_move_in_parallel():
+    sims = {name: SimulatedServoBackend(jitter_us=0.0, time_scale=1.0, seed=1) for name in "ab"}
+    registry = DeviceRegistry({n: ClawController(backend=b, name=n) for n, b in sims.items()})
+    executor = HardwareExecutor(registry)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    result = await executor.close_claw(ALL_DEVICES)
+    elapsed = loop.time() - started
+
+    longest = max(b.history[-1].seconds for b in sims.values())
+    total = sum(b.history[-1].seconds for b in sims.values())
+    assert elapsed < total
+    assert elapsed >= longest
+    assert result == "a: Claw is now CLOSED\nb: Claw is now CLOSED"
+    assert executor.statuses() == {"a": "CLOSED", "b": "CLOSED"}
+
+
+@pytest.mark.asyncio
+async def test_targeted_command_only_moves_named_actuator():
+    registry = DeviceRegistry(
+        {n: ClawController(backend=SimulatedServoBackend(), name=n) for n in ("left", "wrist")}
+    )
+    executor = HardwareExecutor(registry)
+
+    await executor.open_claw("wrist")
+
+    assert executor.get_status("wrist") == "OPEN"
+    assert executor.get_status("left") == "UNKNOWN"
+    with pytest.raises(UnknownDeviceError):
+        await executor.open_claw("elbow")
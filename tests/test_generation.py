@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import pytest
+
+from llm.generation import (
+    DEFAULT_PROFILES,
+    TRUNCATION_MARKER,
+    GenerationProfile,
+    clip_message,
+    load_profiles,
+    platform_budget,
+)
+
+
+def test_options_cap_num_predict_at_budget():
+    profile = GenerationProfile(num_predict=384, num_ctx=1024, temperature=0.2, stop=("###",))
+
+    assert profile.options(max_tokens=100) == {
+        "num_predict": 100,
+        "num_ctx": 1024,
+        "temperature": 0.2,
+        "stop": ["###"],
+    }
+    assert profile.options(max_tokens=1000)["num_predict"] == 384
+    assert "temperature" not in GenerationProfile().options()
+
+
+def test_yaml_overlays_only_listed_keys(tmp_path):
+    path = tmp_path / "generation.yaml"
+    path.write_text(
+        "profiles:\n  chat: {num_predict: 120}\n  haiku: {num_predict: 40, stop: ['###']}\n"
+    )
+
+    profiles = load_profiles(path)
+
+    assert profiles["chat"] == GenerationProfile(
+        num_predict=120, num_ctx=2048, temperature=DEFAULT_PROFILES["chat"].temperature
+    )
+    assert profiles["haiku"].stop == ("###",)
+    assert profiles["summary"] == DEFAULT_PROFILES["summary"]
+
+
+def test_unknown_profile_key_is_rejected(tmp_path):
+    path = tmp_path / "generation.yaml"
+    path.write_text("profiles:\n  chat: {max_length: 10}\n")
+
+    with pytest.raises(ValueError, match="max_length"):
+        load_profiles(path)
+
+
+def test_env_overrides_chat_profile(monkeypatch):
+    monkeypatch.setenv("OLLAMA_NUM_CTX", "1024")
+    monkeypatch.setenv("OLLAMA_TEMPERATURE", "0.3")
+
+    profiles = load_profiles()
+
+    assert (profiles["chat"].num_ctx, profiles["chat"].temperature) == (1024, 0.3)
+    assert profiles["tools"] == DEFAULT_PROFILES["tools"]
+
+
+def test_platform_budget(monkeypatch):
+    assert platform_budget("discord") == 400
+    assert platform_budget("api") is None
+    monkeypatch.setenv("SLACK_MAX_TOKENS", "0")
+    assert platform_budget("slack") is None
+
+
+def test_clip_message_ends_with_single_marker():
+    assert clip_message("short", 100) == "short"
+    clipped = clip_message("word " * 100 + TRUNCATION_MARKER, 80)
+
+    assert len(clipped) <= 80
+    assert clipped.endswith(TRUNCATION_MARKER)
+    assert clipped.count(TRUNCATION_MARKER) == 1
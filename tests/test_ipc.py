@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from hardware.claw_controller import ClawController
+from hardware.executor import HardwareExecutor
+from hardware.registry import UnknownDeviceError
+from ipc.client import CORE_OFFLINE_REPLY, CoreClient, RemoteChat, RemoteHardware
+from ipc.core import CoreServer
+from ipc.protocol import MAX_FRAME, ProtocolError, encode, read_frame
+from ipc.supervisor import Supervisor, WorkerSpec
+
+
+@pytest.fixture
+def hardware():
+    claw = ClawController()
+    claw.init_gpio()
+    return HardwareExecutor(claw)
+
+
+@pytest.fixture
+def chat():
+    chat = MagicMock()
+    chat.chat = AsyncMock(return_value="hi there")
+    return chat
+
+
+@pytest.fixture
+async def core(tmp_path, hardware, chat):
+    server = CoreServer(hardware, chat, str(tmp_path / "core.sock"))
+    task = asyncio.create_task(server.start())
+    yield server
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    await server.close()
+    await hardware.close()
+
+
+@pytest.fixture
+async def client(core):
+    client = CoreClient(core.path, timeout=1.0, retry_delay=0.01)
+    await client.connect(timeout=1.0)
+    yield client
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_frames_round_trip():
+    reader = asyncio.StreamReader()
+    reader.feed_data(encode({"id": 1, "op": "chat", "prompt": "héllo"}))
+    reader.feed_eof()
+
+    assert await read_frame(reader) == {"id": 1, "op": "chat", "prompt": "héllo"}
+    assert await read_frame(reader) is None
+
+
+@pytest.mark.asyncio
+async def test_oversized_frame_is_rejected():
+    reader = asyncio.StreamReader()
+    reader.feed_data((MAX_FRAME + 1).to_bytes(4, "big"))
+
+    with pytest.raises(ProtocolError):
+        await read_frame(reader)
+
+
+@pytest.mark.parametrize("body", [b"{not json", b"\xff\xfe"])
+@pytest.mark.asyncio
+async def test_undecodable_frame_is_a_protocol_error(body):
+    reader = asyncio.StreamReader()
+    reader.feed_data(len(body).to_bytes(4, "big") + body)
+
+    with pytest.raises(ProtocolError):
+        await read_frame(reader)
+
+
+@pytest.mark.asyncio
+async def test_core_drops_a_client_sending_garbage_and_keeps_serving(core, client):
+    reader, writer = await asyncio.open_unix_connection(core.path)
+    assert (await read_frame(reader))["event"] == "hello"
+    writer.write(b"\x00\x00\x00\x03{{{")
+    await writer.drain()
+
+    assert await asyncio.wait_for(read_frame(reader), 1.0) is None
+    writer.close()
+    assert await RemoteChat(client).chat("still there?") == "hi there"
+
+
+@pytest.mark.asyncio
+async def test_hello_seeds_device_state(client):
+    assert client.names == ["claw"]
+    assert client.default == "claw"
+    assert RemoteHardware(client).get_status() == "UNKNOWN"
+
+
+@pytest.mark.asyncio
+async def test_commands_run_on_core_and_push_state(client, hardware):
+    remote = RemoteHardware(client)
+
+    assert await remote.open_claw() == "Claw is now OPEN"
+    assert hardware.get_status() == "OPEN"
+    for _ in range(50):
+        if remote.get_status() == "OPEN":
+            break
+        await asyncio.sleep(0.01)
+    assert remote.statuses() == {"claw": "OPEN"}
+
+
+@pytest.mark.asyncio
+async def test_unknown_device_is_raised_on_gateway(client):
+    remote = RemoteHardware(client)
+
+    with pytest.raises(UnknownDeviceError) as excinfo:
+        await remote.close_claw("wrist")
+    assert excinfo.value.available == ["claw"]
+    with pytest.raises(UnknownDeviceError):
+        remote.get_status("wrist")
+
+
+@pytest.mark.asyncio
+async def test_chat_requests_run_concurrently(client, chat):
+    release = asyncio.Event()
+
+    async def slow_chat(prompt, context=None, max_tokens=None):
+        if prompt == "slow":
+            await release.wait()
+        return f"{prompt}:{context}:{max_tokens}"
+
+    chat.chat.side_effect = slow_chat
+    remote = RemoteChat(client)
+
+    slow = asyncio.create_task(remote.chat("slow"))
+    assert await remote.chat("fast", context="slack:C1:", max_tokens=800) == "fast:slack:C1::800"
+    assert not slow.done()
+    release.set()
+    assert await slow == "slow:None:None"
+
+
+@pytest.mark.asyncio
+async def test_client_reconnects_after_core_restart(tmp_path, hardware, chat):
+    path = str(tmp_path / "core.sock")
+    client = CoreClient(path, timeout=2.0, retry_delay=0.01)
+    remote = RemoteChat(client)
+
+    first = CoreServer(hardware, chat, path)
+    task = asyncio.create_task(first.start())
+    await client.connect(timeout=1.0)
+    assert await remote.chat("one") == "hi there"
+
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    await first.close()
+    for _ in range(50):
+        if not client.connected:
+            break
+        await asyncio.sleep(0.01)
+    assert await RemoteChat(CoreClient(path, timeout=0.05)).chat("down") == CORE_OFFLINE_REPLY
+
+    second = CoreServer(hardware, chat, path)
+    task = asyncio.create_task(second.start())
+    try:
+        assert await remote.chat("two") == "hi there"
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await second.close()
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_supervisor_restarts_crashed_worker():
+    crash = WorkerSpec("core", [sys.executable, "-c", "raise SystemExit(3)"])
+    supervisor = Supervisor([crash], backoff=0.01, max_backoff=0.02, stop_timeout=1.0)
+
+    task = asyncio.create_task(supervisor.run())
+    for _ in range(500):
+        if supervisor.restarts["core"] >= 2:
+            break
+        await asyncio.sleep(0.01)
+    supervisor.stop()
+    await task
+
+    assert supervisor.restarts["core"] >= 2
+
+
+@pytest.mark.asyncio
+async def test_supervisor_starts_gateways_after_core_and_stops_them():
+    sleeper = [sys.executable, "-c", "import time; time.sleep(30)"]
+    ready = asyncio.Event()
+
+    async def core_ready():
+        await ready.wait()
+
+    supervisor = Supervisor(
+        [WorkerSpec("core", sleeper), WorkerSpec("discord", sleeper)],
+        ready=core_ready,
+        stop_timeout=1.0,
+    )
+    task = asyncio.create_task(supervisor.run())
+    await asyncio.sleep(0.2)
+    assert set(supervisor.processes) == {"core"}
+
+    ready.set()
+    for _ in range(100):
+        if "discord" in supervisor.processes:
+            break
+        await asyncio.sleep(0.01)
+    assert set(supervisor.processes) == {"core", "discord"}
+
+    supervisor.stop()
+    await task
+    assert all(p.returncode is not None for p in supervisor.processes.values())
+    assert supervisor.restarts == {"core": 0, "discord": 0}
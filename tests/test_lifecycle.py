@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from lifecycle import Lifecycle, reload_settings
+from llm.admission import AdmissionController, AdmissionThresholds
+from llm.memory import ConversationMemory
+from llm.ollama_client import OllamaClient
+from llm.resilience import RetryPolicy
+from llm.semantic_cache import SemanticCache
+from llm.tools import ToolAgent
+
+
+@pytest.mark.asyncio
+async def test_drain_waits_for_in_flight_work():
+    lifecycle = Lifecycle()
+    finished = []
+
+    async def request():
+        with lifecycle.track():
+            await asyncio.sleep(0.05)
+            finished.append(True)
+
+    task = asyncio.create_task(request())
+    await asyncio.sleep(0)
+
+    assert await lifecycle.drain(timeout=1) is True
+    assert finished == [True]
+    assert lifecycle.accepting is False
+    await task
+
+
+@pytest.mark.asyncio
+async def test_drain_gives_up_at_deadline():
+    lifecycle = Lifecycle()
+    release = asyncio.Event()
+
+    async def stuck():
+        with lifecycle.track():
+            await release.wait()
+
+    task = asyncio.create_task(stuck())
+    await asyncio.sleep(0)
+
+    assert await lifecycle.drain(timeout=0.01) is False
+    assert lifecycle.in_flight == 1
+    release.set()
+    await task
+    assert lifecycle.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_reload_applies_env_in_place(monkeypatch):
+    ai = OllamaClient("http://localhost:11434", "llama3", retry=RetryPolicy())
+    admission = AdmissionController(MagicMock(), max_concurrency=2)
+    session = object()
+    ai.session = session
+    monkeypatch.setenv("OLLAMA_MODEL", "mistral")
+    monkeypatch.setenv("OLLAMA_HOST", "http://gpu-box:11434")
+    monkeypatch.setenv("OLLAMA_BREAKER_THRESHOLD", "7")
+    monkeypatch.setenv("LLM_MAX_CONCURRENCY", "1")
+    monkeypatch.setenv("ADMISSION_MAX_TEMP", "80")
+
+    changed = await reload_settings(ai, admission)
+
+    assert (ai.model, ai.host) == ("mistral", "http://gpu-box:11434")
+    assert ai.session is session  # nothing reconnects
+    assert ai.resilience.breaker.failure_threshold == 7
+    assert admission.max_concurrency == 1
+    assert admission.thresholds == AdmissionThresholds(max_temp=80.0)
+    assert "OLLAMA_MODEL" in changed and "LLM_MAX_CONCURRENCY" in changed
+
+
+@pytest.mark.asyncio
+async def test_reload_rejects_bad_host(monkeypatch):
+    ai = OllamaClient("http://localhost:11434", "llama3")
+    monkeypatch.setenv("OLLAMA_HOST", "file:///etc/passwd")
+    monkeypatch.delenv("OLLAMA_MODEL", raising=False)
+
+    assert await reload_settings(ai) == []
+    assert ai.host == "http://localhost:11434"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [
+        ("LLM_MAX_CONCURRENCY", "two"),
+        ("LLM_MAX_CONCURRENCY", "0"),
+        ("OLLAMA_RETRIES", "many"),
+        ("MEMORY_KEEP_TURNS", "6.5"),
+        ("OLLAMA_TOOL_BUDGET", "-1"),
+        ("SEMANTIC_CACHE_TTL", "soon"),
+    ],
+)
+async def test_reload_with_a_bad_value_changes_nothing(monkeypatch, name, value):
+    ai = OllamaClient(
+        "http://localhost:11434", "llama3", retry=RetryPolicy(), cache=SemanticCache()
+    )
+    admission = AdmissionController(MagicMock(), max_concurrency=2)
+    memory = ConversationMemory(ai, ai)
+    agent = ToolAgent(ai, [])
+    monkeypatch.setenv("OLLAMA_MODEL", "mistral")
+    monkeypatch.setenv("OLLAMA_HOST", "http://gpu-box:11434")
+    monkeypatch.setenv(name, value)
+
+    assert await reload_settings(ai, admission, memory, agent) == []
+    assert (ai.model, ai.host) == ("llama3", "http://localhost:11434")
+    assert admission.max_concurrency == 2
+    assert ai.resilience.policy == RetryPolicy()
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from llm.ollama_client import OllamaClient
+from main import build_core
+
+ANSWER = "Mention me and say 'open claw'."
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("tools", ["false", "true"])
+async def test_semantic_cache_hits_with_memory_on(monkeypatch, tmp_path, tools):
+    monkeypatch.setenv("OLLAMA_EMBED_MODEL", "nomic-embed-text")
+    monkeypatch.setenv("OLLAMA_TOOLS", tools)
+    monkeypatch.setenv("TELEMETRY_ROOT", str(tmp_path))
+    monkeypatch.delenv("MEMORY_MAX_TOKENS", raising=False)
+    monkeypatch.delenv("CLAW_CONFIG", raising=False)
+    generated: list[str] = []
+
+    async def post(self, path, payload):
+        if path == "/api/embed":
+            return {"embeddings": [[1.0, 0.0] if "claw" in payload["input"] else [0.0, 1.0]]}
+        generated.append(path)
+        if path == "/api/chat":
+            return {"message": {"role": "assistant", "content": ANSWER}}
+        return {"response": ANSWER}
+
+    monkeypatch.setattr(OllamaClient, "_post", post)
+    monkeypatch.setattr(OllamaClient, "check_connection", AsyncMock(return_value=True))
+    core = await build_core()
+    try:
+        assert core.memory is not None and core.ai.cache is not None
+        # Stored as the first message of one thread, looked up mid-thread in another
+        await core.chat_ai.chat("how do I open the claw?", context="slack:C1:1.0")
+        await core.chat_ai.chat("hello", context="slack:C2:2.0")
+        before = len(generated)
+
+        reply = await core.chat_ai.chat("how do I open the claw?", context="slack:C2:2.0")
+
+        assert reply == ANSWER
+        assert len(generated) == before
+        assert core.ai.cache.hits >= 1
+        assert core.memory.history("slack:C2:2.0")[-1] == {"role": "assistant", "content": ANSWER}
+    finally:
+        await core.close()
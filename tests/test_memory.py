@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from llm.admission import Action, Decision
+from llm.generation import GenerationProfile
+from llm.memory import ConversationMemory, estimate_tokens
+from replies import OFFLINE_REPLY
+
+
+def _backend(reply: str = "ok"):
+    backend = MagicMock()
+    backend.chat = AsyncMock(return_value=reply)
+    return backend
+
+
+def _client(
+    summary: str | None = "user asked about the claw",
+    admission=None,
+    profile: GenerationProfile | None = None,
+):
+    client = MagicMock()
+    client.admission = admission
+    client.options.side_effect = lambda name, max_tokens=None: (
+        profile or GenerationProfile(num_ctx=8192)
+    ).options(max_tokens)
+    message = {"role": "assistant", "content": summary} if summary is not None else None
+    client.chat_completion = AsyncMock(return_value=message)
+    return client
+
+
+async def _settle(memory: ConversationMemory, key: str) -> None:
+    task = memory.conversation(key).compaction
+    if task:
+        await task
+
+
+@pytest.mark.asyncio
+async def test_history_is_passed_per_conversation():
+    backend = _backend("Done.")
+    memory = ConversationMemory(backend, _client())
+
+    await memory.chat("open claw please", context="slack:C1:1.0")
+    await memory.chat("is it open?", context="slack:C1:1.0")
+    await memory.chat("hello", context="slack:C1:2.0")
+
+    second = backend.chat.call_args_list[1].kwargs["context"]
+    assert second == [
+        {"role": "user", "content": "open claw please"},
+        {"role": "assistant", "content": "Done."},
+    ]
+    assert backend.chat.call_args_list[2].kwargs["context"] == []
+
+
+@pytest.mark.asyncio
+async def test_without_key_behaves_like_plain_chat():
+    backend = _backend()
+    memory = ConversationMemory(backend, _client())
+
+    await memory.chat("hi")
+
+    backend.chat.assert_awaited_once_with("hi", max_tokens=None)
+    assert len(memory) == 0
+
+
+@pytest.mark.asyncio
+async def test_long_thread_is_compacted_into_summary():
+    client = _client()
+    memory = ConversationMemory(_backend("x" * 200), client, max_tokens=200, keep_turns=2)
+
+    for i in range(4):
+        await memory.chat(f"question {i}", context="k")
+    await _settle(memory, "k")
+
+    conversation = memory.conversation("k")
+    assert conversation.summary == "user asked about the claw"
+    assert [t["content"] for t in conversation.turns] == ["question 3", "x" * 200]
+    history = memory.history("k")
+    assert history[0]["role"] == "system"
+    assert "user asked about the claw" in history[0]["content"]
+    assert conversation.tokens < 200
+    transcript = client.chat_completion.call_args.args[0][1]["content"]
+    assert "question 0" in transcript and "question 3" not in transcript
+
+
+@pytest.mark.asyncio
+async def test_failed_summary_keeps_full_history():
+    memory = ConversationMemory(_backend("x" * 400), _client(summary=None), max_tokens=100)
+
+    await memory.chat("q", context="k")
+    await _settle(memory, "k")
+
+    assert memory.conversation("k").summary == ""
+    assert len(memory.conversation("k").turns) == 2
+
+
+@pytest.mark.asyncio
+async def test_compaction_waits_for_idle_gpu():
+    admission = MagicMock()
+    admission.in_flight = 1
+    admission.evaluate.return_value = Decision(Action.ADMIT)
+    client = _client(admission=admission)
+    memory = ConversationMemory(
+        _backend("x" * 400), client, max_tokens=100, keep_turns=1, idle_poll=0.01
+    )
+
+    await memory.chat("q1", context="k")
+    await memory.chat("q2", context="k")
+    await asyncio.sleep(0.05)
+    client.chat_completion.assert_not_awaited()
+
+    admission.in_flight = 0
+    await _settle(memory, "k")
+    client.chat_completion.assert_awaited_once()
+
+
+def test_history_hard_cap_drops_oldest_turns():
+    memory = ConversationMemory(_backend(), _client(), max_tokens=50)
+    conversation = memory.conversation("k")
+    for i in range(10):
+        conversation.append("user", f"{i}" * 80)
+
+    history = memory.history("k")
+
+    assert sum(estimate_tokens(m["content"]) for m in history) <= 100
+    assert history[-1]["content"] == "9" * 80
+
+
+@pytest.mark.asyncio
+async def test_history_fits_the_profile_context_window():
+    backend = _backend()
+    client = _client(profile=GenerationProfile(num_predict=384, num_ctx=2048))
+    memory = ConversationMemory(backend, client, max_tokens=1500)
+    conversation = memory.conversation("k")
+    for i in range(20):
+        conversation.append("user", f"{i % 10}" * 400)
+
+    prompt = "and what about now?"
+    await memory.chat(prompt, context="k")
+
+    history = backend.chat.call_args.kwargs["context"]
+    used = sum(estimate_tokens(m["content"]) for m in history) + estimate_tokens(prompt)
+    assert used <= 2048 - 384
+    assert history[-1]["content"] == "9" * 400
+    client.options.assert_called_with("chat", None)
+
+
+def test_least_recently_used_conversation_is_evicted():
+    memory = ConversationMemory(_backend(), _client(), max_conversations=2)
+    memory.conversation("a")
+    memory.conversation("b")
+    memory.conversation("a")
+    memory.conversation("c")
+
+    assert len(memory) == 2
+    assert memory.history("b") == []  # recreated empty
+
+
+@pytest.mark.asyncio
+async def test_failed_replies_are_not_remembered():
+    backend = _backend(OFFLINE_REPLY)
+    memory = ConversationMemory(backend, _client())
+
+    assert await memory.chat("open claw please", context="slack:C1:1.0") == OFFLINE_REPLY
+    backend.chat.return_value = "Done."
+    await memory.chat("open claw please", context="slack:C1:1.0")
+
+    assert backend.chat.call_args.kwargs["context"] == []
+    assert len(memory.history("slack:C1:1.0")) == 2
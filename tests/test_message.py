@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bot.message import InboundMessage, dispatch_command, parse_command, parse_inbound
+from hardware.backends import SimulatedServoBackend
+from hardware.claw_controller import ClawController
+from hardware.executor import HardwareExecutor
+from hardware.registry import DeviceRegistry
+
+
+def test_parse_inbound_strips_mention_and_whitespace():
+    msg = parse_inbound("slack", "C1", "U1", "  <@UBOT>   what is up?  ", "UBOT", ts="1.0")
+
+    assert msg.text == "what is up?"
+    assert msg.channel_key == "slack:C1"
+    assert msg.ts == "1.0"
+    assert msg.command is None
+
+
+def test_parse_inbound_handles_discord_nickname_mention():
+    msg = parse_inbound("discord", "5", "7", "hey <@!99> there", "99")
+    assert msg.text == "hey there"
+
+
+def test_parse_inbound_empty_after_mention_is_none():
+    assert parse_inbound("slack", "C1", "U1", "<@UBOT>", "UBOT") is None
+    assert parse_inbound("slack", "C1", "U1", "   ", "UBOT") is None
+
+
+@pytest.mark.parametrize(
+    ("text", "verb", "target"),
+    [
+        ("open claw please", "open", None),
+        ("close claw now", "close", None),
+        ("open claw Left", "open", "left"),
+        ("CLOSE Claw wrist", "close", "wrist"),
+        ("stop claw!", "stop", None),
+        ("open claw", "open", None),
+    ],
+)
+def test_parse_command(text, verb, target):
+    command = parse_command(text)
+    assert (command.verb, command.target) == (verb, target)
+
+
+def test_parse_command_ignores_other_text():
+    assert parse_command("the clawing open sea") is None
+
+
+@pytest.mark.parametrize(
+    "text", ["how to open claw?", "how do I close claw wrist", "why did you stop claw"]
+)
+def test_questions_mentioning_a_command_are_not_commands(text):
+    assert parse_command(text) is None
+    assert parse_inbound("discord", "5", "7", f"<@99> {text}", "99").command is None
+
+
+def test_inbound_message_has_no_instance_dict():
+    msg = InboundMessage("slack", "C1", "U1", "hi")
+    assert not hasattr(msg, "__dict__")
+    assert msg.conversation_key == "slack:C1:"
+
+
+@pytest.mark.asyncio
+async def test_dispatch_command_filler_word_uses_default_actuator():
+    hardware = MagicMock()
+    hardware.names = ["claw", "wrist"]
+    hardware.open_claw = AsyncMock(return_value="Claw is now OPEN")
+
+    assert await dispatch_command(hardware, parse_command("open claw please")) == "Claw is now OPEN"
+    hardware.open_claw.assert_awaited_once_with(None)
+
+    await dispatch_command(hardware, parse_command("open claw wrist"))
+    hardware.open_claw.assert_awaited_with("wrist")
+
+
+@pytest.mark.asyncio
+async def test_dispatch_command_typo_never_moves_the_default_actuator():
+    registry = DeviceRegistry(
+        {n: ClawController(backend=SimulatedServoBackend(), name=n) for n in ("left", "right")}
+    )
+    executor = HardwareExecutor(registry)
+
+    reply = await dispatch_command(executor, parse_command("close claw rihgt"))
+
+    assert reply == "Unknown actuator 'rihgt'. Available: left, right"
+    assert executor.statuses() == {"left": "UNKNOWN", "right": "UNKNOWN"}
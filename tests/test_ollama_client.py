@@ -4,12 +4,19 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from llm.ollama_client import OllamaClient
+from llm.admission import OverloadedError
+from llm.generation import TRUNCATION_MARKER
+from llm.ollama_client import OFFLINE_REPLY, OVERLOADED_REPLY, OllamaClient, StreamDecoder
+from llm.resilience import CircuitBreaker, RetryPolicy
+from llm.semantic_cache import SemanticCache
+
+# No backoff sleeps in unit tests
+FAST_RETRY = RetryPolicy(backoff_initial=0, backoff_max=0)
 
 
 @pytest.fixture
 def client():
-    return OllamaClient(host="http://localhost:11434", model="llama3")
+    return OllamaClient(host="http://localhost:11434", model="llama3", retry=FAST_RETRY)
 
 
 @pytest.mark.asyncio
@@ -97,6 +104,46 @@ async def test_chat_handles_ollama_error_status(client):
         result = await client.chat("Say hello")
 
     assert result == "Sorry, my brain is offline."
+    # 5xx is transient: retried up to the policy's attempt count
+    assert mock_session.post.call_count == FAST_RETRY.attempts
+
+
+@pytest.mark.asyncio
+async def test_chat_retries_connection_reset_then_succeeds(client):
+    mock_resp = AsyncMock()
+    mock_resp.status = 200
+    mock_resp.json = AsyncMock(return_value={"response": "Back again"})
+    mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
+    mock_resp.__aexit__ = AsyncMock(return_value=False)
+
+    mock_session = MagicMock()
+    mock_session.closed = False
+    mock_session.post = MagicMock(side_effect=[ConnectionResetError("reset"), mock_resp])
+
+    with patch("aiohttp.ClientSession", return_value=mock_session):
+        client.session = None
+        result = await client.chat("Say hello")
+
+    assert result == "Back again"
+    assert client.resilience.breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_chat_short_circuits_when_breaker_open(client):
+    mock_session = MagicMock()
+    mock_session.closed = False
+    mock_session.post = MagicMock(side_effect=ConnectionRefusedError("down"))
+    client.resilience.probe = None  # no background recovery in this test
+
+    with patch("aiohttp.ClientSession", return_value=mock_session):
+        client.session = None
+        for _ in range(FAST_RETRY.failure_threshold):
+            await client.chat("hello?")
+        calls = mock_session.post.call_count
+        result = await client.chat("hello?")
+
+    assert result == OFFLINE_REPLY
+    assert mock_session.post.call_count == calls
 
 
 @pytest.mark.asyncio
@@ -213,3 +260,359 @@ async def test_async_context_manager():
         assert entered is c
 
     mock_session.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_sends_tools_and_returns_message(client):
+    message = {"role": "assistant", "content": "", "tool_calls": []}
+    mock_resp = AsyncMock()
+    mock_resp.status = 200
+    mock_resp.json = AsyncMock(return_value={"message": message})
+    mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
+    mock_resp.__aexit__ = AsyncMock(return_value=False)
+
+    mock_session = MagicMock()
+    mock_session.closed = False
+    mock_session.post = MagicMock(return_value=mock_resp)
+
+    tools = [{"type": "function", "function": {"name": "open_claw"}}]
+    with patch("aiohttp.ClientSession", return_value=mock_session):
+        client.session = None
+        result = await client.chat_completion([{"role": "user", "content": "hi"}], tools=tools)
+
+    assert result == message
+    url = mock_session.post.call_args.args[0]
+    payload = mock_session.post.call_args.kwargs["json"]
+    assert url == "http://localhost:11434/api/chat"
+    assert payload["tools"] == tools
+    assert payload["stream"] is False
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_leaves_truncated_content_unmarked(client):
+    mock_resp = AsyncMock()
+    mock_resp.status = 200
+    mock_resp.json = AsyncMock(
+        return_value={
+            "message": {"role": "assistant", "content": "Summary: user opened"},
+            "done_reason": "length",
+        }
+    )
+    mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
+    mock_resp.__aexit__ = AsyncMock(return_value=False)
+    mock_session = MagicMock()
+    mock_session.closed = False
+    mock_session.post = MagicMock(return_value=mock_resp)
+
+    with patch("aiohttp.ClientSession", return_value=mock_session):
+        client.session = None
+        result = await client.chat_completion([{"role": "user", "content": "summarize"}])
+
+    assert result["content"] == "Summary: user opened"
+    assert result["done_reason"] == "length"
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_returns_none_on_error(client):
+    mock_resp = AsyncMock()
+    mock_resp.status = 400
+    mock_resp.text = AsyncMock(return_value="model does not support tools")
+    mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
+    mock_resp.__aexit__ = AsyncMock(return_value=False)
+
+    mock_session = MagicMock()
+    mock_session.closed = False
+    mock_session.post = MagicMock(return_value=mock_resp)
+
+    with patch("aiohttp.ClientSession", return_value=mock_session):
+        client.session = None
+        result = await client.chat_completion([{"role": "user", "content": "hi"}])
+
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_chat_uses_fallback_model_when_degraded():
+    admission = MagicMock()
+    decision = MagicMock(model="llama3.2:1b")
+    admission.slot.return_value.__aenter__ = AsyncMock(return_value=decision)
+    admission.slot.return_value.__aexit__ = AsyncMock(return_value=False)
+    c = OllamaClient(host="http://localhost:11434", model="llama3", admission=admission)
+
+    mock_resp = AsyncMock()
+    mock_resp.status = 200
+    mock_resp.json = AsyncMock(return_value={"response": "short answer"})
+    mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
+    mock_resp.__aexit__ = AsyncMock(return_value=False)
+    mock_session = MagicMock()
+    mock_session.closed = False
+    mock_session.post = MagicMock(return_value=mock_resp)
+
+    with patch("aiohttp.ClientSession", return_value=mock_session):
+        assert await c.chat("hi") == "short answer"
+
+    assert mock_session.post.call_args.kwargs["json"]["model"] == "llama3.2:1b"
+
+
+@pytest.mark.asyncio
+async def test_chat_sheds_load_with_clear_reply():
+    admission = MagicMock()
+    admission.slot.return_value.__aenter__ = AsyncMock(side_effect=OverloadedError("SoC at 92C"))
+    admission.slot.return_value.__aexit__ = AsyncMock(return_value=False)
+    c = OllamaClient(host="http://localhost:11434", model="llama3", admission=admission)
+    c.session = MagicMock()
+
+    result = await c.chat("hi")
+
+    assert result.startswith(OVERLOADED_REPLY)
+    assert "SoC at 92C" in result
+    c.session.post.assert_not_called()
+
+
+def test_stream_decoder_buffers_partial_lines():
+    decoder = StreamDecoder()
+    assert decoder.feed(b'{"response": "Hel') == []
+    assert decoder.feed(b'lo"}\n{"response": " world"}\n{"do') == [
+        {"response": "Hello"},
+        {"response": " world"},
+    ]
+    assert decoder.feed(b'ne": true}\n') == [{"done": True}]
+
+
+def _stream_response(status, *chunks, text=""):
+    async def iter_any():
+        for chunk in chunks:
+            yield chunk
+
+    resp = MagicMock()
+    resp.status = status
+    resp.text = AsyncMock(return_value=text)
+    resp.content.iter_any = iter_any
+    return resp
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_yields_tokens_until_done(client):
+    resp = _stream_response(
+        200,
+        b'{"response": "Claw "}\n{"respo',
+        b'nse": "open"}\n{"response": "", "done": true}\n{"response": "ignored"}\n',
+    )
+    mock_session = MagicMock()
+    mock_session.closed = False
+    mock_session.post = AsyncMock(return_value=resp)
+
+    with patch("aiohttp.ClientSession", return_value=mock_session):
+        client.session = None
+        tokens = [token async for token in client.chat_stream("hi")]
+
+    assert tokens == ["Claw ", "open"]
+    assert mock_session.post.call_args.kwargs["json"]["stream"] is True
+    resp.release.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_reports_error_status(client):
+    mock_session = MagicMock()
+    mock_session.closed = False
+    mock_session.post = AsyncMock(return_value=_stream_response(404, text="model not found"))
+
+    with patch("aiohttp.ClientSession", return_value=mock_session):
+        client.session = None
+        tokens = [token async for token in client.chat_stream("hi")]
+
+    assert tokens == ["Sorry, my brain is offline."]
+
+
+@pytest.mark.asyncio
+async def test_chat_with_history_uses_chat_endpoint(client):
+    mock_resp = AsyncMock()
+    mock_resp.status = 200
+    mock_resp.json = AsyncMock(return_value={"message": {"role": "assistant", "content": "Yes."}})
+    mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
+    mock_resp.__aexit__ = AsyncMock(return_value=False)
+    mock_session = MagicMock()
+    mock_session.closed = False
+    mock_session.post = MagicMock(return_value=mock_resp)
+    history = [{"role": "system", "content": "Summary of the earlier conversation: x"}]
+
+    with patch("aiohttp.ClientSession", return_value=mock_session):
+        client.session = None
+        assert await client.chat("still there?", context=history) == "Yes."
+
+    assert mock_session.post.call_args.args[0] == "http://localhost:11434/api/chat"
+    messages = mock_session.post.call_args.kwargs["json"]["messages"]
+    assert messages == [*history, {"role": "user", "content": "still there?"}]
+
+
+def _routing_session(embedding, answer="Mention me and say 'open claw'."):
+    """Session whose /api/embed, /api/generate and /api/chat return canned payloads."""
+
+    def post(url, json=None):
+        resp = AsyncMock()
+        resp.status = 200
+        if url.endswith("/api/embed"):
+            resp.json = AsyncMock(return_value={"embeddings": [embedding]})
+        elif url.endswith("/api/chat"):
+            resp.json = AsyncMock(return_value={"message": {"content": answer}})
+        else:
+            resp.json = AsyncMock(return_value={"response": answer})
+        resp.__aenter__ = AsyncMock(return_value=resp)
+        resp.__aexit__ = AsyncMock(return_value=False)
+        return resp
+
+    session = MagicMock()
+    session.closed = False
+    session.post = MagicMock(side_effect=post)
+    return session
+
+
+def _generate_calls(session):
+    return [c for c in session.post.call_args_list if c.args[0].endswith("/api/generate")]
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_answers_near_duplicate_without_generating():
+    c = OllamaClient(
+        "http://localhost:11434",
+        "llama3",
+        retry=FAST_RETRY,
+        cache=SemanticCache(threshold=0.9),
+        embed_model="nomic-embed-text",
+    )
+    session = _routing_session([0.6, 0.8])
+    c.session = session
+
+    first = await c.chat("how do I open the claw?")
+    second = await c.chat("how to open claw")
+
+    assert first == second == "Mention me and say 'open claw'."
+    assert len(_generate_calls(session)) == 1
+    assert c.cache.hits == 1
+    embed_payload = session.post.call_args_list[0].kwargs["json"]
+    assert embed_payload == {"model": "nomic-embed-text", "input": "how do I open the claw?"}
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_skipped_for_conversations():
+    c = OllamaClient(
+        "http://localhost:11434",
+        "llama3",
+        retry=FAST_RETRY,
+        cache=SemanticCache(),
+        embed_model="nomic-embed-text",
+    )
+    session = _routing_session([1.0, 0.0], answer="contextual")
+    history = [{"role": "user", "content": "earlier"}]
+    c.session = session
+
+    assert await c.chat("same?", context=history) == "contextual"
+    assert [call.args[0] for call in session.post.call_args_list] == [
+        "http://localhost:11434/api/chat"
+    ]
+    assert len(c.cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_standalone_prompt_mid_conversation_uses_the_cache():
+    c = OllamaClient(
+        "http://localhost:11434",
+        "llama3",
+        retry=FAST_RETRY,
+        cache=SemanticCache(),
+        embed_model="nomic-embed-text",
+    )
+    session = _routing_session([1.0, 0.0], answer="Say 'open claw'.")
+    c.session = session
+
+    await c.chat("how do I open the claw?")
+    reply = await c.chat("how do I open the claw?", context=[{"role": "user", "content": "yo"}])
+
+    assert reply == "Say 'open claw'."
+    assert len(_generate_calls(session)) == 1
+    assert not [c for c in session.post.call_args_list if c.args[0].endswith("/api/chat")]
+    assert c.cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_replies_written_with_history_are_not_cached():
+    c = OllamaClient(
+        "http://localhost:11434",
+        "llama3",
+        retry=FAST_RETRY,
+        cache=SemanticCache(),
+        embed_model="nomic-embed-text",
+    )
+    session = _routing_session([1.0, 0.0], answer="Your name is Alice.")
+    c.session = session
+    alice = [{"role": "user", "content": "I am Alice"}]
+
+    # Standalone enough to look up mid-thread, but the answer came from the thread
+    await c.chat("what is the name on file?", context=alice)
+
+    assert len(c.cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_embedding_failure_falls_back_to_generation():
+    c = OllamaClient(
+        "http://localhost:11434",
+        "llama3",
+        retry=FAST_RETRY,
+        cache=SemanticCache(),
+        embed_model="missing-model",
+    )
+    session = _routing_session([1.0, 0.0], answer="generated")
+    embed_error = AsyncMock()
+    embed_error.status = 404
+    embed_error.text = AsyncMock(return_value="model not found")
+    embed_error.__aenter__ = AsyncMock(return_value=embed_error)
+    embed_error.__aexit__ = AsyncMock(return_value=False)
+    generate = session.post.side_effect
+    session.post.side_effect = lambda url, json=None: (
+        embed_error if url.endswith("/api/embed") else generate(url, json)
+    )
+    c.session = session
+
+    assert await c.chat("hi") == "generated"
+    assert len(c.cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_chat_sends_profile_options_and_marks_truncation(client):
+    mock_resp = AsyncMock()
+    mock_resp.status = 200
+    mock_resp.json = AsyncMock(
+        return_value={"response": "A servo reads the pulse width and ", "done_reason": "length"}
+    )
+    mock_resp.__aenter__ = AsyncMock(return_value=mock_resp)
+    mock_resp.__aexit__ = AsyncMock(return_value=False)
+    mock_session = MagicMock()
+    mock_session.closed = False
+    mock_session.post = MagicMock(return_value=mock_resp)
+
+    with patch("aiohttp.ClientSession", return_value=mock_session):
+        client.session = None
+        reply = await client.chat("explain servos", max_tokens=50, profile="command-explain")
+
+    assert reply == "A servo reads the pulse width and" + TRUNCATION_MARKER
+    options = mock_session.post.call_args.kwargs["json"]["options"]
+    assert options["num_predict"] == 50
+    assert options["num_ctx"] == 1024
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_appends_marker_when_cut_at_budget(client):
+    resp = _stream_response(
+        200, b'{"response": "Claw"}\n{"response": "", "done": true, "done_reason": "length"}\n'
+    )
+    mock_session = MagicMock()
+    mock_session.closed = False
+    mock_session.post = AsyncMock(return_value=resp)
+
+    with patch("aiohttp.ClientSession", return_value=mock_session):
+        client.session = None
+        tokens = [token async for token in client.chat_stream("hi", max_tokens=1)]
+
+    assert tokens == ["Claw", TRUNCATION_MARKER]
+    assert mock_session.post.call_args.kwargs["json"]["options"]["num_predict"] == 1
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bot.outbound import OutboundSender, Priority, RateLimitBucket
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _RateLimited(Exception):
+    def __init__(self, retry_after: float) -> None:
+        super().__init__("429")
+        self.retry_after = retry_after
+
+
+# ---------------------------------------------------------------------------
+# RateLimitBucket
+# ---------------------------------------------------------------------------
+
+
+def test_bucket_allows_calls_until_exhausted():
+    clock = _FakeClock()
+    bucket = RateLimitBucket(clock=clock)
+    bucket.update({"X-RateLimit-Remaining": "1", "X-RateLimit-Reset-After": "2.5"})
+
+    assert bucket.delay() == 0.0
+    bucket.consume()
+    assert bucket.delay() == pytest.approx(2.5)
+
+    clock.now += 3
+    assert bucket.delay() == 0.0
+
+
+def test_bucket_penalized_by_retry_after_header():
+    clock = _FakeClock()
+    bucket = RateLimitBucket(clock=clock)
+    bucket.update({"Retry-After": "4"})
+
+    assert bucket.delay() == pytest.approx(4.0)
+
+
+# ---------------------------------------------------------------------------
+# OutboundSender
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_send_returns_call_result():
+    sender = OutboundSender()
+    func = AsyncMock(return_value="sent")
+
+    result = await sender.send("slack:C1", func, channel="C1", text="hi")
+
+    assert result == "sent"
+    func.assert_awaited_once_with(channel="C1", text="hi")
+
+
+@pytest.mark.asyncio
+async def test_hardware_priority_overtakes_queued_text():
+    sender = OutboundSender()
+    order: list[str] = []
+    gate = asyncio.Event()
+
+    async def first() -> None:
+        await gate.wait()
+        order.append("first")
+
+    async def record(name: str) -> None:
+        order.append(name)
+
+    blocked = asyncio.create_task(sender.submit("c", first))
+    await asyncio.sleep(0.01)  # worker is now busy with the first call
+    pending = [
+        asyncio.create_task(sender.send("c", record, "llm", priority=Priority.REPLY)),
+        asyncio.create_task(sender.send("c", record, "claw", priority=Priority.HARDWARE)),
+    ]
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(blocked, *pending)
+
+    assert order == ["first", "claw", "llm"]
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_call_is_retried():
+    sender = OutboundSender()
+    func = AsyncMock(side_effect=[_RateLimited(0.01), "ok"])
+
+    result = await sender.send("c", func)
+
+    assert result == "ok"
+    assert func.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_non_rate_limit_errors_propagate():
+    sender = OutboundSender()
+    func = AsyncMock(side_effect=ValueError("boom"))
+
+    with pytest.raises(ValueError):
+        await sender.send("c", func)
+    func.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_response_headers_update_bucket():
+    sender = OutboundSender()
+    response = MagicMock()
+    response.headers = {"Retry-After": "30"}
+
+    await sender.send("c", AsyncMock(return_value=response))
+
+    assert sender.bucket("c").delay() > 0
+    assert sender.bucket("other").delay() == 0.0
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from bot.placeholder import ReplyDeadline
+
+
+def test_deadline_starts_at_ceiling():
+    assert ReplyDeadline(ceiling=1.0).deadline == 1.0
+
+
+def test_fast_replies_shrink_deadline_towards_their_latency():
+    deadline = ReplyDeadline(ceiling=1.0, floor=0.1)
+    for seconds in (0.2, 0.3, 0.25, 0.4):
+        deadline.observe(seconds)
+
+    assert deadline.deadline == pytest.approx(0.3 * 1.25)
+
+
+def test_mostly_slow_replies_show_placeholder_early():
+    deadline = ReplyDeadline(ceiling=1.0, floor=0.2)
+    for seconds in (0.3, 4.0, 5.0, 6.0):
+        deadline.observe(seconds)
+
+    assert deadline.deadline == 0.2
+
+
+def test_window_forgets_old_samples():
+    deadline = ReplyDeadline(ceiling=1.0, floor=0.1, window=2)
+    for seconds in (9.0, 9.0, 0.4, 0.4):
+        deadline.observe(seconds)
+
+    assert deadline.deadline == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_race_reports_whether_reply_beat_the_deadline():
+    deadline = ReplyDeadline(ceiling=0.05, floor=0.05)
+
+    async def reply(delay):
+        await asyncio.sleep(delay)
+        return "done"
+
+    fast = deadline.start(reply(0))
+    assert await deadline.race(fast) is True
+    assert fast.result() == "done"
+
+    slow = deadline.start(reply(0.2))
+    assert await deadline.race(slow) is False
+    assert await slow == "done"
+    assert len(deadline._samples) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelling_race_cancels_generation():
+    deadline = ReplyDeadline(ceiling=10)
+    task = deadline.start(asyncio.sleep(10))
+    racer = asyncio.create_task(deadline.race(task))
+    await asyncio.sleep(0)
+
+    racer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await racer
+    await asyncio.sleep(0)
+    assert task.cancelled()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import pytest
+
+from hardware.backends import SimulatedServoBackend
+from hardware.claw_controller import ClawController
+from hardware.registry import DeviceRegistry, UnknownDeviceError
+
+CONFIG = """
+default: left
+actuators:
+  left:
+    backend: sim
+    pin: 33
+  wrist:
+    backend: sim
+    pin: 32
+    open_duty: 10.0
+    close_duty: 5.0
+"""
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "actuators.yaml"
+    path.write_text(CONFIG)
+    return path
+
+
+def test_from_yaml_builds_named_actuators(config_path):
+    registry = DeviceRegistry.from_yaml(config_path)
+
+    assert registry.names == ["left", "wrist"]
+    assert registry.default_name == "left"
+    wrist = registry.get("wrist")
+    assert wrist.pin == 32
+    assert (wrist.open_duty, wrist.close_duty) == (10.0, 5.0)
+    assert isinstance(wrist.backend, SimulatedServoBackend)
+    assert registry.get().name == "left"
+
+
+def test_calibration_reaches_backend(config_path):
+    registry = DeviceRegistry.from_yaml(config_path)
+    registry.init_all()
+
+    registry.get("wrist").open_claw()
+
+    assert registry.get("wrist").backend.history[-1].duty == 10.0
+
+
+def test_unknown_actuator_lists_available(config_path):
+    registry = DeviceRegistry.from_yaml(config_path)
+
+    with pytest.raises(UnknownDeviceError) as exc:
+        registry.get("elbow")
+    assert str(exc.value) == "Unknown actuator 'elbow'. Available: left, wrist"
+
+
+def test_unknown_config_key_rejected():
+    with pytest.raises(ValueError, match="unknown keys: duty"):
+        DeviceRegistry.from_dict({"actuators": {"left": {"duty": 5}}})
+
+
+def test_load_without_path_is_single_claw():
+    registry = DeviceRegistry.load(None)
+
+    assert registry.names == ["claw"]
+    assert registry.get().pin == ClawController.SERVO_PIN
+
+
+def test_names_are_case_insensitive():
+    registry = DeviceRegistry.from_dict(
+        {"default": "Left", "actuators": {"Left": {"backend": "sim"}, "WRIST": {"backend": "sim"}}}
+    )
+
+    assert registry.names == ["left", "wrist"]
+    assert registry.default_name == "left"
+    assert registry.get("Wrist") is registry.get("wrist")
+    assert registry.get().name == "left"
+
+
+def test_names_differing_only_by_case_rejected():
+    with pytest.raises(ValueError, match="differ only by case"):
+        DeviceRegistry({"left": ClawController(name="left"), "LEFT": ClawController(name="LEFT")})
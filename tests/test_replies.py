@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from hardware.registry import UnknownDeviceError
+from replies import (
+    CORE_OFFLINE_REPLY,
+    NEURAL_ERROR_REPLY,
+    OFFLINE_REPLY,
+    OLLAMA_ERROR_REPLY,
+    OVERLOADED_REPLY,
+    STEP_LIMIT_REPLY,
+    TIMEOUT_REPLY,
+    claw_outcome,
+    reply_outcome,
+)
+
+
+def test_reply_outcome():
+    assert reply_outcome("Sure, here you go.") == "ok"
+    assert reply_outcome(OFFLINE_REPLY) == reply_outcome(CORE_OFFLINE_REPLY) == "offline"
+    assert reply_outcome(f"{OVERLOADED_REPLY} (GPU 85C). Please try again.") == "overloaded"
+    assert reply_outcome(OLLAMA_ERROR_REPLY) == reply_outcome(NEURAL_ERROR_REPLY) == "error"
+    assert reply_outcome(TIMEOUT_REPLY) == "timeout"
+    assert reply_outcome(STEP_LIMIT_REPLY) == "step_limit"
+
+
+def test_claw_outcome():
+    assert claw_outcome("Claw is now OPEN") == "ok"
+    assert claw_outcome(str(UnknownDeviceError("elbow", ["claw"]))) == "unknown_device"
+    assert claw_outcome("Claw move interrupted") == "interrupted"
+    assert claw_outcome("Cancelled by emergency stop") == "preempted"
+    assert claw_outcome("a: Claw is now OPEN\nb: Claw move interrupted") == "interrupted"
+    assert claw_outcome(CORE_OFFLINE_REPLY) == "offline"
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from llm.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    OllamaError,
+    Resilience,
+    RetryPolicy,
+    TransientOllamaError,
+)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _policy(**overrides: float) -> RetryPolicy:
+    options = {"backoff_initial": 0, "backoff_max": 0, "probe_interval": 0.01, **overrides}
+    return RetryPolicy(**options)
+
+
+def test_breaker_opens_and_half_opens_after_cooldown():
+    clock = _FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    clock.now = 10
+    assert breaker.allow()  # single trial call
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried():
+    resilience = Resilience(_policy(attempts=3))
+    fn = AsyncMock(side_effect=[TransientOllamaError(503, "loading"), {"ok": True}])
+
+    assert await resilience.call(fn) == {"ok": True}
+    assert fn.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried_and_keep_circuit_closed():
+    resilience = Resilience(_policy(failure_threshold=1))
+    fn = AsyncMock(side_effect=OllamaError(404, "model not found"))
+
+    with pytest.raises(OllamaError):
+        await resilience.call(fn)
+    assert fn.await_count == 1
+    assert resilience.breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_per_attempt_timeout_is_retried():
+    resilience = Resilience(_policy(attempts=2, attempt_timeout=0.01))
+    calls = 0
+
+    async def hangs_once() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(1)
+        return "ok"
+
+    assert await resilience.call(hangs_once) == "ok"
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_overall_deadline_bounds_the_call():
+    resilience = Resilience(_policy(attempts=10, attempt_timeout=5))
+
+    async def hangs() -> str:
+        await asyncio.sleep(1)
+        return "late"
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    with pytest.raises(asyncio.TimeoutError):
+        await resilience.call(hangs, deadline=0.05)
+    assert loop.time() - started < 0.5
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_short_circuits_and_probe_recovers():
+    probe = AsyncMock(side_effect=[False, True])
+    resilience = Resilience(_policy(attempts=1, failure_threshold=1), probe=probe)
+    fn = AsyncMock(side_effect=ConnectionResetError("reset"))
+
+    with pytest.raises(ConnectionResetError):
+        await resilience.call(fn)
+    assert not resilience.available
+    with pytest.raises(CircuitOpenError):
+        await resilience.call(fn)
+    assert fn.await_count == 1
+
+    await asyncio.wait_for(resilience._probe_task, 1)
+    assert resilience.available
+    assert probe.await_count == 2
+    await resilience.close()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import pytest
+
+from llm.semantic_cache import SemanticCache, is_standalone
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_near_duplicate_hits_and_distant_prompt_misses():
+    cache = SemanticCache(threshold=0.9)
+    cache.store([1.0, 0.0, 0.0], "Say 'open claw'.")
+
+    assert cache.lookup([0.95, 0.05, 0.0]) == "Say 'open claw'."
+    assert cache.lookup([0.0, 1.0, 0.0]) is None
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_similarity_is_scale_invariant():
+    cache = SemanticCache(threshold=0.99)
+    cache.store([3.0, 4.0], "answer")
+
+    assert cache.lookup([30.0, 40.0]) == "answer"
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SemanticCache(capacity=2, threshold=0.99)
+    cache.store([1.0, 0.0, 0.0], "a")
+    cache.store([0.0, 1.0, 0.0], "b")
+    assert cache.lookup([1.0, 0.0, 0.0]) == "a"  # "b" is now least recently used
+
+    cache.store([0.0, 0.0, 1.0], "c")
+
+    assert len(cache) == 2
+    assert cache.lookup([0.0, 1.0, 0.0]) is None
+    assert cache.lookup([1.0, 0.0, 0.0]) == "a"
+    assert cache.lookup([0.0, 0.0, 1.0]) == "c"
+
+
+def test_expired_entries_are_ignored():
+    clock = FakeClock()
+    cache = SemanticCache(ttl=60, clock=clock)
+    cache.store([1.0, 0.0], "stale soon")
+
+    clock.now = 61
+    assert cache.lookup([1.0, 0.0]) is None
+
+
+def test_embedding_dimension_change_resets_cache():
+    cache = SemanticCache()
+    cache.store([1.0, 0.0], "old model")
+
+    assert cache.lookup([1.0, 0.0, 0.0]) is None
+    cache.store([1.0, 0.0, 0.0], "new model")
+    assert len(cache) == 1
+    assert cache.lookup([1.0, 0.0, 0.0]) == "new model"
+
+
+def test_zero_vector_is_never_cached():
+    cache = SemanticCache()
+    cache.store([0.0, 0.0], "nothing")
+
+    assert len(cache) == 0
+    assert cache.lookup([0.0, 0.0]) is None
+
+
+@pytest.mark.parametrize(
+    ("prompt", "standalone"),
+    [
+        ("how do I open the claw?", True),
+        ("What is a PWM servo?", True),
+        ("is it open?", False),
+        ("and the other one?", False),
+        ("yes please", False),
+        ("why?", False),
+        ("What is my name?", False),
+    ],
+)
+def test_standalone_prompts_do_not_refer_back(prompt, standalone):
+    assert is_standalone(prompt) is standalone
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from audit import AuditJournal
+from bot.placeholder import ReplyDeadline
 from bot.slack_bot import OpenClawSlack
+from hardware.registry import UnknownDeviceError
 
 
 @pytest.fixture
 def hardware():
     hw = MagicMock()
-    hw.open_claw.return_value = "Claw is now OPEN"
-    hw.close_claw.return_value = "Claw is now CLOSED"
+    hw.open_claw = AsyncMock(return_value="Claw is now OPEN")
+    hw.close_claw = AsyncMock(return_value="Claw is now CLOSED")
+    hw.emergency_stop = AsyncMock(return_value="Claw STOPPED")
+    hw.names = ["claw", "wrist"]
     return hw
 
 
@@ -126,7 +133,7 @@ async def test_open_claw_command(slack_bot, hardware):
 
     await slack_bot.handle_request(client, request)
 
-    hardware.open_claw.assert_called_once()
+    hardware.open_claw.assert_awaited_once_with(None)
     slack_bot.web_client.chat_postMessage.assert_awaited_once_with(
         channel="C1", text="Claw is now OPEN"
     )
@@ -146,7 +153,7 @@ async def test_close_claw_command(slack_bot, hardware):
 
     await slack_bot.handle_request(client, request)
 
-    hardware.close_claw.assert_called_once()
+    hardware.close_claw.assert_awaited_once()
     slack_bot.web_client.chat_postMessage.assert_awaited_once_with(
         channel="C1", text="Claw is now CLOSED"
     )
@@ -154,12 +161,42 @@ async def test_close_claw_command(slack_bot, hardware):
 
 
 @pytest.mark.asyncio
-async def test_llm_routing_for_non_command(slack_bot, ai_client):
+async def test_claw_command_with_named_actuator(slack_bot, hardware):
     slack_bot._bot_user_id = "UBOT"
     slack_bot.web_client = MagicMock()
     slack_bot.web_client.chat_postMessage = AsyncMock()
-    slack_bot.web_client.reactions_add = AsyncMock()
-    slack_bot.web_client.reactions_remove = AsyncMock()
+
+    client = MagicMock()
+    client.send_socket_mode_response = AsyncMock()
+
+    await slack_bot.handle_request(client, _make_request(text="<@UBOT> close claw wrist"))
+
+    hardware.close_claw.assert_awaited_once_with("wrist")
+
+
+@pytest.mark.asyncio
+async def test_stop_claw_command(slack_bot, hardware):
+    slack_bot._bot_user_id = "UBOT"
+    slack_bot.web_client = MagicMock()
+    slack_bot.web_client.chat_postMessage = AsyncMock()
+
+    client = MagicMock()
+    client.send_socket_mode_response = AsyncMock()
+
+    await slack_bot.handle_request(client, _make_request(text="stop claw!"))
+
+    hardware.emergency_stop.assert_awaited_once()
+    slack_bot.web_client.chat_postMessage.assert_awaited_once_with(
+        channel="C1", text="Claw STOPPED"
+    )
+
+
+@pytest.mark.asyncio
+async def test_llm_routing_for_non_command(slack_bot, ai_client):
+    slack_bot._bot_user_id = "UBOT"
+    slack_bot.web_client = MagicMock()
+    slack_bot.web_client.chat_postMessage = AsyncMock(return_value={"ts": "2222.0"})
+    slack_bot.web_client.chat_update = AsyncMock()
 
     client = MagicMock()
     client.send_socket_mode_response = AsyncMock()
@@ -168,7 +205,9 @@ async def test_llm_routing_for_non_command(slack_bot, ai_client):
 
     await slack_bot.handle_request(client, request)
 
-    ai_client.chat.assert_awaited_once_with("What is the meaning of life?")
+    ai_client.chat.assert_awaited_once_with(
+        "What is the meaning of life?", context="slack:C1:", max_tokens=800
+    )
     slack_bot.web_client.chat_postMessage.assert_awaited_once()
 
 
@@ -208,9 +247,8 @@ async def test_im_message_event_type(slack_bot, ai_client):
     """Direct messages (im channel_type) should also trigger LLM routing."""
     slack_bot._bot_user_id = "UBOT"
     slack_bot.web_client = MagicMock()
-    slack_bot.web_client.chat_postMessage = AsyncMock()
-    slack_bot.web_client.reactions_add = AsyncMock()
-    slack_bot.web_client.reactions_remove = AsyncMock()
+    slack_bot.web_client.chat_postMessage = AsyncMock(return_value={"ts": "2222.0"})
+    slack_bot.web_client.chat_update = AsyncMock()
 
     client = MagicMock()
     client.send_socket_mode_response = AsyncMock()
@@ -231,17 +269,45 @@ async def test_im_message_event_type(slack_bot, ai_client):
 
     await slack_bot.handle_request(client, req)
 
-    ai_client.chat.assert_awaited_once_with("Hello there")
+    ai_client.chat.assert_awaited_once_with("Hello there", context="slack:D1:", max_tokens=800)
+
+
+def _slow_chat(reply: str = "Here is my LLM response."):
+    async def chat(*args, **kwargs):
+        await asyncio.sleep(0.05)
+        return reply
+
+    return chat
 
 
 @pytest.mark.asyncio
-async def test_reactions_added_and_removed_around_llm_call(slack_bot, ai_client):
-    """Thinking reaction should be added before and removed after LLM call."""
+async def test_fast_reply_is_a_single_post(slack_bot, ai_client):
+    """An answer inside the deadline goes out without a placeholder."""
     slack_bot._bot_user_id = "UBOT"
     slack_bot.web_client = MagicMock()
-    slack_bot.web_client.chat_postMessage = AsyncMock()
-    slack_bot.web_client.reactions_add = AsyncMock()
-    slack_bot.web_client.reactions_remove = AsyncMock()
+    slack_bot.web_client.chat_postMessage = AsyncMock(return_value={"ts": "2222.0"})
+    slack_bot.web_client.chat_update = AsyncMock()
+
+    client = MagicMock()
+    client.send_socket_mode_response = AsyncMock()
+
+    await slack_bot.handle_request(client, _make_request(text="Tell me something"))
+
+    slack_bot.web_client.chat_postMessage.assert_awaited_once_with(
+        channel="C1", text="<@U1> Here is my LLM response."
+    )
+    slack_bot.web_client.chat_update.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_placeholder_edited_in_place_with_slow_reply(slack_bot, ai_client):
+    """A slow answer gets a placeholder, replaced via chat_update instead of a second post."""
+    ai_client.chat.side_effect = _slow_chat()
+    slack_bot.deadline = ReplyDeadline(ceiling=0.01, floor=0.01)
+    slack_bot._bot_user_id = "UBOT"
+    slack_bot.web_client = MagicMock()
+    slack_bot.web_client.chat_postMessage = AsyncMock(return_value={"ts": "2222.0"})
+    slack_bot.web_client.chat_update = AsyncMock()
 
     client = MagicMock()
     client.send_socket_mode_response = AsyncMock()
@@ -250,9 +316,114 @@ async def test_reactions_added_and_removed_around_llm_call(slack_bot, ai_client)
 
     await slack_bot.handle_request(client, request)
 
-    slack_bot.web_client.reactions_add.assert_awaited_once_with(
-        channel="C1", timestamp="1111.0", name="thinking_face"
+    slack_bot.web_client.chat_postMessage.assert_awaited_once_with(
+        channel="C1", text="_Thinking..._"
     )
-    slack_bot.web_client.reactions_remove.assert_awaited_once_with(
-        channel="C1", timestamp="1111.0", name="thinking_face"
+    slack_bot.web_client.chat_update.assert_awaited_once_with(
+        channel="C1", ts="2222.0", text="<@U1> Here is my LLM response."
     )
+
+
+@pytest.mark.asyncio
+async def test_reply_posted_when_placeholder_has_no_ts(slack_bot, ai_client):
+    ai_client.chat.side_effect = _slow_chat()
+    slack_bot.deadline = ReplyDeadline(ceiling=0.01, floor=0.01)
+    slack_bot._bot_user_id = "UBOT"
+    slack_bot.web_client = MagicMock()
+    slack_bot.web_client.chat_postMessage = AsyncMock(return_value={})
+    slack_bot.web_client.chat_update = AsyncMock()
+
+    client = MagicMock()
+    client.send_socket_mode_response = AsyncMock()
+
+    await slack_bot.handle_request(client, _make_request(text="Tell me something"))
+
+    assert slack_bot.web_client.chat_postMessage.await_count == 2
+    slack_bot.web_client.chat_update.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_claw_command_and_chat_are_audited(tmp_path, hardware, ai_client):
+    with patch("bot.slack_bot.WebClient"), patch("bot.slack_bot.SocketModeClient"):
+        bot = OpenClawSlack(
+            bot_token="xoxb-test",
+            app_token="xapp-test",
+            ai_client=ai_client,
+            hardware=hardware,
+            audit=AuditJournal(tmp_path / "audit.jsonl"),
+        )
+    bot._bot_user_id = "UBOT"
+    bot.web_client = MagicMock()
+    bot.web_client.chat_postMessage = AsyncMock(return_value={"ts": "2222.0"})
+    client = MagicMock()
+    client.send_socket_mode_response = AsyncMock()
+
+    await bot.handle_request(client, _make_request(text="open claw wrist"))
+    await bot.handle_request(client, _make_request(text="hello"))
+    await bot.audit.close()
+
+    claw, llm = [json.loads(line) for line in (tmp_path / "audit.jsonl").read_text().splitlines()]
+    assert claw["kind"] == "claw" and claw["intent"] == "open" and claw["target"] == "wrist"
+    assert (claw["platform"], claw["user"], claw["channel"]) == ("slack", "U1", "C1")
+    assert llm["kind"] == "llm" and llm["prompt"] == "hello" and llm["outcome"] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_claw_command_that_moves_nothing_is_not_audited_as_ok(tmp_path, hardware, ai_client):
+    hardware.open_claw.side_effect = UnknownDeviceError("elbow", hardware.names)
+    with patch("bot.slack_bot.WebClient"), patch("bot.slack_bot.SocketModeClient"):
+        bot = OpenClawSlack(
+            bot_token="xoxb-test",
+            app_token="xapp-test",
+            ai_client=ai_client,
+            hardware=hardware,
+            audit=AuditJournal(tmp_path / "audit.jsonl"),
+        )
+    bot._bot_user_id = "UBOT"
+    bot.web_client = MagicMock()
+    bot.web_client.chat_postMessage = AsyncMock(return_value={"ts": "2222.0"})
+    client = MagicMock()
+    client.send_socket_mode_response = AsyncMock()
+
+    await bot.handle_request(client, _make_request(text="open claw elbow"))
+    await bot.audit.close()
+
+    record = json.loads((tmp_path / "audit.jsonl").read_text())
+    assert (record["intent"], record["target"], record["outcome"]) == (
+        "open",
+        "elbow",
+        "unknown_device",
+    )
+
+
+@pytest.mark.asyncio
+async def test_events_acked_but_ignored_while_draining(slack_bot, ai_client):
+    slack_bot._bot_user_id = "UBOT"
+    slack_bot.web_client = MagicMock()
+    slack_bot.web_client.chat_postMessage = AsyncMock()
+    slack_bot.lifecycle.stop_accepting()
+    client = MagicMock()
+    client.send_socket_mode_response = AsyncMock()
+
+    await slack_bot.handle_request(client, _make_request(text="<@UBOT> hi"))
+
+    client.send_socket_mode_response.assert_awaited_once()
+    ai_client.chat.assert_not_awaited()
+    slack_bot.web_client.chat_postMessage.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_stop_is_served_while_draining(slack_bot, hardware, ai_client):
+    slack_bot._bot_user_id = "UBOT"
+    slack_bot.web_client = MagicMock()
+    slack_bot.web_client.chat_postMessage = AsyncMock()
+    slack_bot.lifecycle.stop_accepting()
+    client = MagicMock()
+    client.send_socket_mode_response = AsyncMock()
+
+    await slack_bot.handle_request(client, _make_request(text="<@UBOT> open claw"))
+    await slack_bot.handle_request(client, _make_request(text="<@UBOT> stop claw"))
+
+    hardware.open_claw.assert_not_awaited()
+    hardware.emergency_stop.assert_awaited_once()
+    ai_client.chat.assert_not_awaited()
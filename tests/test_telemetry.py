@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from hardware.telemetry import TelemetrySampler
+
+
+def write_board(
+    root: Path,
+    temps: dict[str, int],
+    mem_total_kb: int = 8_000_000,
+    mem_available_kb: int = 4_000_000,
+    swap_total_kb: int = 4_000_000,
+    swap_free_kb: int = 4_000_000,
+) -> None:
+    """Lay out a fake Jetson /sys + /proc tree under ``root``."""
+    for i, (name, millidegrees) in enumerate(temps.items()):
+        zone = root / "sys/class/thermal" / f"thermal_zone{i}"
+        zone.mkdir(parents=True, exist_ok=True)
+        (zone / "type").write_text(f"{name}\n")
+        (zone / "temp").write_text(f"{millidegrees}\n")
+    (root / "proc").mkdir(parents=True, exist_ok=True)
+    (root / "proc/meminfo").write_text(
+        f"MemTotal:       {mem_total_kb} kB\n"
+        f"MemFree:         1000000 kB\n"
+        f"MemAvailable:   {mem_available_kb} kB\n"
+        f"SwapTotal:      {swap_total_kb} kB\n"
+        f"SwapFree:       {swap_free_kb} kB\n"
+    )
+
+
+def test_sample_reads_zones_and_meminfo(tmp_path):
+    write_board(tmp_path, {"cpu-thermal": 51500, "gpu-thermal": 63250}, swap_free_kb=3_000_000)
+
+    sample = TelemetrySampler(tmp_path).sample()
+
+    assert sample.temperatures == {"cpu-thermal": 51.5, "gpu-thermal": 63.25}
+    assert sample.max_temp == 63.25
+    assert sample.mem_used_pct == pytest.approx(50.0)
+    assert sample.swap_used_pct == pytest.approx(25.0)
+    assert "63.2C" in sample.summary()
+
+
+def test_missing_files_yield_empty_sample(tmp_path):
+    sample = TelemetrySampler(tmp_path).sample()
+
+    assert sample.temperatures == {}
+    assert sample.max_temp == 0.0
+    assert sample.mem_used_pct == 0.0
+
+
+def test_samples_are_cached_for_min_interval(tmp_path):
+    now = [0.0]
+    write_board(tmp_path, {"cpu-thermal": 40000})
+    sampler = TelemetrySampler(tmp_path, min_interval=1.0, clock=lambda: now[0])
+
+    assert sampler.sample().max_temp == 40.0
+    write_board(tmp_path, {"cpu-thermal": 90000})
+    assert sampler.sample().max_temp == 40.0
+
+    now[0] = 1.5
+    assert sampler.sample().max_temp == 90.0
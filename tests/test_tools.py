@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from audit import AuditJournal
+from hardware.backends import SimulatedServoBackend
+from hardware.claw_controller import ClawController
+from hardware.executor import HardwareExecutor
+from hardware.registry import DeviceRegistry
+from llm.generation import TRUNCATION_MARKER
+from llm.tools import Tool, ToolAgent, hardware_tools
+
+
+def _call(name: str, **arguments: object) -> dict:
+    return {"function": {"name": name, "arguments": arguments}}
+
+
+@pytest.fixture
+def hardware():
+    registry = DeviceRegistry(
+        {n: ClawController(backend=SimulatedServoBackend(), name=n) for n in ("left", "wrist")}
+    )
+    return HardwareExecutor(registry)
+
+
+@pytest.fixture
+def client():
+    c = MagicMock()
+    c.chat = AsyncMock(return_value="plain answer")
+    c.chat_completion = AsyncMock()
+    c.cache_lookup = AsyncMock(return_value=([1.0, 0.0], None))
+    return c
+
+
+def test_tool_definitions_generated_from_controller(hardware):
+    definitions = {t.name: t.definition()["function"] for t in hardware_tools(hardware)}
+
+    assert set(definitions) == {"open_claw", "close_claw", "get_status", "stop", "wait"}
+    assert definitions["close_claw"]["description"] == ClawController.close_claw.__doc__
+    target = definitions["open_claw"]["parameters"]["properties"]["target"]
+    assert target["enum"] == ["left", "wrist", "all"]
+    assert definitions["stop"]["parameters"]["properties"] == {}
+
+
+@pytest.mark.asyncio
+async def test_compound_request_runs_in_one_loop(hardware, client):
+    client.chat_completion.side_effect = [
+        {"role": "assistant", "content": "", "tool_calls": [_call("open_claw", target="left")]},
+        {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [_call("wait", seconds=0), _call("close_claw", target="left")],
+        },
+        {"role": "assistant", "content": "", "tool_calls": [_call("get_status", target="left")]},
+        {"role": "assistant", "content": "Done, the left claw is CLOSED."},
+    ]
+    agent = ToolAgent(client, hardware_tools(hardware))
+
+    reply = await agent.chat("open the claw, wait, then close it and tell me the status")
+
+    assert reply == "Done, the left claw is CLOSED."
+    assert hardware.get_status("left") == "CLOSED"
+    messages = client.chat_completion.await_args.args[0]
+    tool_results = [m["content"] for m in messages if m["role"] == "tool"]
+    assert tool_results == ["Claw is now OPEN", "Waited 0s", "Claw is now CLOSED", "CLOSED"]
+
+
+@pytest.mark.asyncio
+async def test_iteration_cap(hardware, client):
+    client.chat_completion.return_value = {
+        "role": "assistant",
+        "content": "",
+        "tool_calls": [_call("get_status")],
+    }
+    agent = ToolAgent(client, hardware_tools(hardware), max_iterations=3)
+
+    reply = await agent.chat("loop forever")
+
+    assert reply == "I stopped after too many hardware steps."
+    assert client.chat_completion.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_slow_tool_is_cut_off_by_timeout(client):
+    async def slow(_: dict) -> str:
+        await asyncio.sleep(1)
+        return "late"
+
+    client.chat_completion.side_effect = [
+        {"role": "assistant", "content": "", "tool_calls": [_call("slow")]},
+        {"role": "assistant", "content": "gave up"},
+    ]
+    agent = ToolAgent(client, [Tool("slow", "", {}, slow)], tool_timeout=0.01)
+
+    assert await agent.chat("go") == "gave up"
+    tool_message = client.chat_completion.await_args.args[0][-1]
+    assert tool_message["content"].startswith("Error: slow timed out")
+
+
+@pytest.mark.asyncio
+async def test_unknown_tool_and_actuator_reported_to_model(hardware, client):
+    client.chat_completion.side_effect = [
+        {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [_call("fly"), _call("open_claw", target="elbow")],
+        },
+        {"role": "assistant", "content": "ok"},
+    ]
+    agent = ToolAgent(client, hardware_tools(hardware))
+
+    await agent.chat("fly")
+
+    results = [
+        m["content"] for m in client.chat_completion.await_args.args[0] if m["role"] == "tool"
+    ]
+    assert results[0] == "Error: unknown tool 'fly'"
+    assert results[1].startswith("Error: Unknown actuator 'elbow'")
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_plain_chat_without_tool_support(hardware, client):
+    client.chat_completion.return_value = None
+    agent = ToolAgent(client, hardware_tools(hardware))
+
+    assert await agent.chat("hi") == "plain answer"
+    client.chat.assert_awaited_once_with("hi", None, max_tokens=None)
+
+
+@pytest.mark.asyncio
+async def test_history_goes_between_system_prompt_and_user(hardware, client):
+    client.chat_completion.return_value = {"role": "assistant", "content": "Still open."}
+    agent = ToolAgent(client, hardware_tools(hardware))
+    history = [{"role": "user", "content": "open it"}, {"role": "assistant", "content": "Done."}]
+
+    await agent.chat("is it open?", context=history)
+
+    messages = client.chat_completion.call_args.args[0]
+    assert [m["role"] for m in messages] == ["system", "user", "assistant", "user"]
+    assert messages[-1]["content"] == "is it open?"
+
+
+@pytest.mark.asyncio
+async def test_cached_answer_skips_the_tool_loop(hardware, client):
+    client.cache_lookup.return_value = ([1.0, 0.0], "Say 'open claw'.")
+    agent = ToolAgent(client, hardware_tools(hardware))
+
+    assert await agent.chat("how do I open the claw?") == "Say 'open claw'."
+    client.chat_completion.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_only_answers_without_tool_calls_are_cached(hardware, client):
+    client.chat_completion.side_effect = [
+        {"role": "assistant", "content": "Say 'open claw'."},
+        {"role": "assistant", "tool_calls": [{"function": {"name": "open_claw"}}]},
+        {"role": "assistant", "content": "Opened it."},
+    ]
+    agent = ToolAgent(client, hardware_tools(hardware))
+
+    await agent.chat("how do I open the claw?")
+    await agent.chat("open the left claw")
+
+    client.cache_store.assert_called_once_with([1.0, 0.0], "Say 'open claw'.", [])
+
+
+@pytest.mark.asyncio
+async def test_only_the_final_reply_gets_the_truncation_marker(hardware, client):
+    client.chat_completion.side_effect = [
+        {
+            "role": "assistant",
+            "content": "Opening",
+            "tool_calls": [{"function": {"name": "open_claw"}}],
+            "done_reason": "length",
+        },
+        {"role": "assistant", "content": "The claw is open and", "done_reason": "length"},
+    ]
+    agent = ToolAgent(client, hardware_tools(hardware))
+
+    reply = await agent.chat("open the claw")
+
+    assert reply == "The claw is open and" + TRUNCATION_MARKER
+    sent = client.chat_completion.await_args.args[0]
+    assert sent[2] == {
+        "role": "assistant",
+        "content": "Opening",
+        "tool_calls": [{"function": {"name": "open_claw"}}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_tool_moves_are_audited_for_the_chat_caller(hardware, client, tmp_path):
+    journal = AuditJournal(tmp_path / "audit.jsonl")
+    client.chat_completion.side_effect = [
+        {"role": "assistant", "tool_calls": [_call("open_claw", target="wrist")]},
+        {"role": "assistant", "content": "Opened."},
+    ]
+    agent = ToolAgent(client, hardware_tools(hardware, journal))
+
+    with journal.track("llm", "slack", "U1", "C1", "chat", prompt="open the wrist"):
+        await agent.chat("open the wrist")
+    await journal.close()
+
+    claw, chat = [json.loads(line) for line in (tmp_path / "audit.jsonl").read_text().splitlines()]
+    assert (claw["kind"], claw["intent"], claw["target"], claw["via"]) == (
+        "claw",
+        "open",
+        "wrist",
+        "tool",
+    )
+    assert (claw["platform"], claw["user"], claw["channel"]) == ("slack", "U1", "C1")
+    assert chat["kind"] == "llm" and "via" not in chat
+
+
+@pytest.mark.asyncio
+async def test_tool_move_on_unknown_actuator_is_audited_as_unknown_device(
+    hardware, client, tmp_path
+):
+    journal = AuditJournal(tmp_path / "audit.jsonl")
+    client.chat_completion.side_effect = [
+        {"role": "assistant", "tool_calls": [_call("open_claw", target="elbow")]},
+        {"role": "assistant", "content": "No elbow here."},
+    ]
+    agent = ToolAgent(client, hardware_tools(hardware, journal))
+
+    await agent.chat("open the elbow")
+    await journal.close()
+
+    record = json.loads((tmp_path / "audit.jsonl").read_text())
+    assert (record["via"], record["outcome"]) == ("tool", "unknown_device")